@@ -0,0 +1 @@
+"""가상 화면으로 삭제 속도를 측정하는 오프라인 벤치마크."""
@@ -0,0 +1,501 @@
+"""벤치마크용 가상 YouTube 시청 기록 화면과 pyautogui 대체 모듈.
+
+실제 계정이나 화면 없이 PyAutoGuiDriver 를 돌릴 수 있도록
+화면 캡처, 마우스 이동/클릭을 시간 기반으로 흉내 냅니다.
+
+- 행마다 고유한 제목 무늬와 같은 모양의 메뉴 버튼("⋮")을 그립니다.
+- 메뉴 버튼을 누르면 menu_latency 뒤에 메뉴가 열리고,
+  메뉴의 삭제 항목을 누르면 removal_latency 뒤에 행이 사라집니다 (fail_rate 확률로 무시).
+- stuck_rate 확률로 어떤 클릭에도 지워지지 않는 행이 섞입니다 (스크롤로만 넘어감).
+- page_size 를 주면 행을 그만큼씩 나눠 불러옵니다. 불러온 행이 화면보다 적어지면
+  목록 끝에 로딩 표시가 돌고, load_latency 뒤에 다음 페이지가 붙습니다.
+- header_every 를 주면 그 행 수마다 메뉴 버튼이 없는 날짜 제목 줄이 끼어듭니다.
+- 버튼이나 열린 메뉴 항목이 아닌 곳을 누르면 잘못된 클릭(misclick)으로 셉니다.
+- 메뉴는 버튼 아래에 붙어 열리는 항목 칸 상자입니다. menu_variants 를 주면 SHORTS_EVERY 번째
+  행마다 항목이 하나 더 있는 메뉴(Shorts)를 열고, 화면 아래쪽에서는 메뉴가 버튼 위로 열립니다.
+  삭제 항목의 위치가 메뉴마다 달라지므로 고정 간격 하나로는 맞출 수 없습니다.
+- 행 n 의 제목은 "모의 동영상 #n", 채널은 "채널 (n % 7)" 입니다 (mock/history.html 과 같음).
+  FakeRowReader 가 글자 인식 대신 이 값을 돌려줍니다.
+"""
+
+import random
+import sys
+import threading
+import time
+import types
+from collections import Counter, namedtuple
+
+import numpy as np
+from PIL import Image
+
+# --- Page Geometry ---
+SCREEN_SIZE = (1920, 1080)
+FIRST_ROW_CENTER_Y = 200
+ROW_PITCH = 94
+BUTTON_X = 1500  # 메뉴 버튼 중심 x
+BUTTON_HALF = 10
+TITLE_LEFT = 1000
+TITLE_RIGHT = 1480
+TITLE_HALF_HEIGHT = 20
+MENU_ITEM_GAP = (-36, 108)  # 메뉴 버튼 → 삭제 항목 중심까지의 거리 (settings.json 기본값과 같음)
+MENU_ITEM_HALF = (100, 18)
+# 메뉴 상자: 버튼 중심에서 MENU_MARGIN 떨어져 열리고 항목 칸 높이는 MENU_SLOT_HEIGHT.
+# 보통 메뉴는 4칸 중 3번째, Shorts 메뉴는 5칸 중 4번째가 삭제 항목 (보통 메뉴는 MENU_ITEM_GAP 과 같은 위치)
+MENU_WIDTH = 240
+MENU_MARGIN = 8
+MENU_SLOT_HEIGHT = 40
+MENU_LAYOUTS = {"video": (4, 2), "shorts": (5, 3)}  # 종류 → (칸 수, 삭제 항목 칸 번호)
+SHORTS_EVERY = 3
+MENU_FILL = 225
+SPINNER_X = 1300
+SPINNER_HALF = 16
+SPINNER_FRAME_S = 0.05  # 로딩 표시 애니메이션 한 프레임 길이
+BACKGROUND = 255
+CHANNEL_COUNT = 7
+OCR_WRAP_EVERY = 4  # 이 간격마다 제목이 두 줄로 넘어가는 행 (글자 인식 흉내)
+
+Point = namedtuple("Point", "x y")
+
+
+class FailSafeException(Exception):
+    pass
+
+
+class FakeHistoryScreen:
+    """시간에 따라 변하는 가상 시청 기록 페이지."""
+
+    def __init__(
+        self,
+        rows=100_000,
+        menu_latency=0.08,
+        removal_latency=0.15,
+        jitter=0.03,
+        fail_rate=0.0,
+        stuck_rate=0.0,
+        page_size=0,
+        load_latency=0.8,
+        header_every=0,
+        capture_latency=0.0,
+        menu_variants=False,
+        seed=0,
+    ):
+        self.menu_latency = menu_latency
+        self.removal_latency = removal_latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.stuck_rate = stuck_rate
+        self.stuck_rows = set()
+        self.page_size = page_size
+        self.load_latency = load_latency
+        self.header_every = header_every
+        self.capture_latency = capture_latency  # 실제 화면 캡처에 걸리는 시간 흉내
+        self.menu_variants = menu_variants  # 메뉴 종류와 열리는 방향이 행마다 달라짐
+        self.headers = set()  # 날짜 제목 줄 id (음수)
+        self.load_at = None  # 다음 페이지가 붙을 시각 (로딩 중이 아니면 None)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_row_id = 0
+        self._total_rows = rows
+        self.visible_rows = (SCREEN_SIZE[1] - FIRST_ROW_CENTER_Y) // ROW_PITCH
+        self.rows = []  # 화면 위에서부터의 행/제목 줄 id
+        self._load_page(page_size or self.visible_rows)
+        self.menu_row = None  # 메뉴를 연 행 id
+        self.menu_opens_at = None
+        self.menu_anchor = None  # 메뉴를 연 버튼 위치
+        self.pending_removals = []  # (삭제 시각, 행 id)
+        self.clicks = 0
+        self.misclicks = 0
+        self.removed = 0
+        self.removed_channels = Counter()  # 채널별 삭제된 행 수
+        self.scrolled_past = 0
+        self._title_cache = {}
+        self._button = self._button_pattern()
+        self._menu_item = self._menu_item_pattern()
+        slot_count = max(slots for slots, _ in MENU_LAYOUTS.values())
+        self._menu_slots = [self._menu_slot_pattern(i) for i in range(slot_count)]
+
+    def _new_row_id(self):
+        if self._next_row_id >= self._total_rows:
+            return None
+        self._next_row_id += 1
+        if self._random.random() < self.stuck_rate:
+            self.stuck_rows.add(self._next_row_id)
+        return self._next_row_id
+
+    def _append_row(self):
+        row_id = self._new_row_id()
+        if row_id is None:
+            return
+        if self.header_every and (row_id - 1) % self.header_every == 0:
+            self.headers.add(-row_id)
+            self.rows.append(-row_id)
+        self.rows.append(row_id)
+
+    def _load_page(self, count):
+        for _ in range(count):
+            self._append_row()
+
+    def _has_more(self):
+        return self._next_row_id < self._total_rows
+
+    def _spinner_visible(self):
+        return (
+            self.page_size > 0 and self._has_more() and len(self.rows) < self.visible_rows
+        )
+
+    def _refill(self, count):
+        """화면에서 빠진 행만큼 아래를 채웁니다 (나눠 불러오기를 쓰지 않을 때)."""
+        if not self.page_size:
+            self._load_page(count)
+
+    def _drop_empty_headers(self):
+        """아래에 행이 없는 날짜 제목 줄은 사라집니다."""
+        kept = []
+        for index, entry in enumerate(self.rows):
+            if entry in self.headers:
+                following = self.rows[index + 1] if index + 1 < len(self.rows) else None
+                if following is None and not self._has_more():
+                    continue
+                if following is not None and following in self.headers:
+                    continue
+            kept.append(entry)
+        self.rows = kept
+
+    # --- 상태 변화 ---
+    def _jittered(self, latency):
+        return latency + self._random.random() * self.jitter
+
+    def _advance(self, now):
+        """예정된 행 삭제와 다음 페이지 불러오기를 반영합니다."""
+        due = [item for item in self.pending_removals if item[0] <= now]
+        if due:
+            self.pending_removals = [
+                item for item in self.pending_removals if item[0] > now
+            ]
+            for _, row_id in due:
+                if row_id in self.rows:
+                    self.rows.remove(row_id)
+                    self.removed += 1
+                    self.removed_channels[self.channel_of(row_id)] += 1
+                    self._refill(1)
+            self._drop_empty_headers()
+        if self.load_at is not None and now >= self.load_at:
+            self.load_at = None
+            self._load_page(self.page_size)
+            self._drop_empty_headers()
+        if self.load_at is None and self._spinner_visible():
+            self.load_at = now + self._jittered(self.load_latency)
+
+    def _menu_open(self, now):
+        return self.menu_row is not None and now >= self.menu_opens_at
+
+    def _menu_box(self):
+        """열린 메뉴: (왼쪽, 위, 칸 수, 삭제 항목 칸 번호)."""
+        shorts = self.menu_variants and self.menu_row % SHORTS_EVERY == 0
+        slots, remove_slot = MENU_LAYOUTS["shorts" if shorts else "video"]
+        left = self.menu_anchor.x + MENU_ITEM_GAP[0] - MENU_WIDTH // 2
+        top = self.menu_anchor.y + MENU_MARGIN
+        if self.menu_variants and top + slots * MENU_SLOT_HEIGHT > SCREEN_SIZE[1]:
+            # 화면 아래로 넘치면 버튼 위로 열림
+            top = self.menu_anchor.y - MENU_MARGIN - slots * MENU_SLOT_HEIGHT
+        return left, top, slots, remove_slot
+
+    def _menu_item_center(self):
+        left, top, _, remove_slot = self._menu_box()
+        return Point(
+            left + MENU_WIDTH // 2,
+            top + remove_slot * MENU_SLOT_HEIGHT + MENU_SLOT_HEIGHT // 2,
+        )
+
+    def _row_at_button(self, x, y):
+        if abs(x - BUTTON_X) > BUTTON_HALF:
+            return None
+        index = round((y - FIRST_ROW_CENTER_Y) / ROW_PITCH)
+        if 0 <= index < len(self.rows) and abs(
+            y - (FIRST_ROW_CENTER_Y + index * ROW_PITCH)
+        ) <= BUTTON_HALF:
+            row_id = self.rows[index]
+            return None if row_id in self.headers else row_id
+        return None
+
+    @staticmethod
+    def channel_of(row_id):
+        return f"채널 {row_id % CHANNEL_COUNT}"
+
+    def row_text(self, x, y):
+        """메뉴 버튼 위치에 있는 행의 (제목, 채널). 행이 없으면 (None, None)."""
+        with self._lock:
+            self._advance(time.perf_counter())
+            row_id = self._row_at_button(x, y)
+        if row_id is None:
+            return None, None
+        return f"모의 동영상 #{row_id}", self.channel_of(row_id)
+
+    def row_ocr_text(self, x, y):
+        """row_text 를 실제 행을 글자 인식한 결과처럼 만듭니다 (제목 줄바꿈, 조회수, 빈 줄)."""
+        title, channel = self.row_text(x, y)
+        if title is None:
+            return ""
+        number = int(title.rsplit("#", 1)[1])
+        if number % OCR_WRAP_EVERY == 0:
+            title += "\n공식 뮤직비디오 | 아주 긴 제목이 다음 줄로 넘어감"
+        separator = "·" if number % 2 else "•"
+        return f"{title}\n\n{channel} {separator} 조회수 {number * 37}회\n"
+
+    @classmethod
+    def channel_of_text(cls, text):
+        """row_ocr_text 로 만든 글의 실제 채널."""
+        return cls.channel_of(int(text.split("\n", 1)[0].rsplit("#", 1)[1]))
+
+    def click(self, x, y):
+        with self._lock:
+            now = time.perf_counter()
+            self._advance(now)
+            self.clicks += 1
+            if self._menu_open(now):
+                item = self._menu_item_center()
+                hit_item = (
+                    abs(x - item.x) <= MENU_ITEM_HALF[0]
+                    and abs(y - item.y) <= MENU_ITEM_HALF[1]
+                )
+                row_id = self.menu_row
+                self.menu_row = None
+                if hit_item:
+                    if (
+                        row_id not in self.stuck_rows
+                        and self._random.random() >= self.fail_rate
+                    ):
+                        self.pending_removals.append(
+                            (now + self._jittered(self.removal_latency), row_id)
+                        )
+                    return
+            row_id = self._row_at_button(x, y)
+            if row_id is None:
+                self.misclicks += 1
+                self.menu_row = None
+                return
+            self.menu_row = row_id
+            self.menu_anchor = Point(
+                BUTTON_X, FIRST_ROW_CENTER_Y + self.rows.index(row_id) * ROW_PITCH
+            )
+            self.menu_opens_at = now + self._jittered(self.menu_latency)
+
+    def scroll(self, clicks):
+        """아래로 굴리면(clicks < 0) 위쪽 행이 한 칸에 한 행씩 화면 밖으로 나갑니다."""
+        with self._lock:
+            self.menu_row = None
+            for _ in range(min(-clicks, len(self.rows))):
+                if self.rows.pop(0) not in self.headers:
+                    self.scrolled_past += 1
+                    self._refill(1)
+            self._drop_empty_headers()
+
+    def press(self, key):
+        with self._lock:
+            if key == "esc":
+                self.menu_row = None
+
+    # --- 그리기 ---
+    def _title_pattern(self, row_id):
+        pattern = self._title_cache.get(row_id)
+        if pattern is None:
+            rng = np.random.default_rng(row_id if row_id > 0 else 2**32 - row_id)
+            blocks = rng.integers(
+                0, 200, size=(TITLE_HALF_HEIGHT * 2 // 8, (TITLE_RIGHT - TITLE_LEFT) // 8)
+            )
+            pattern = np.kron(blocks, np.ones((8, 8))).astype(np.uint8)
+            if len(self._title_cache) > 256:
+                self._title_cache.clear()
+            self._title_cache[row_id] = pattern
+        return pattern
+
+    @staticmethod
+    def _spinner_pattern(now):
+        """시간에 따라 돌아가는 로딩 표시."""
+        size = SPINNER_HALF * 2
+        pattern = np.full((size, size), BACKGROUND, dtype=np.uint8)
+        quarter = int(now / SPINNER_FRAME_S) % 4
+        top = (quarter // 2) * SPINNER_HALF
+        left = (quarter % 2) * SPINNER_HALF
+        pattern[top : top + SPINNER_HALF, left : left + SPINNER_HALF] = 60
+        return pattern
+
+    @staticmethod
+    def _button_pattern():
+        size = BUTTON_HALF * 2
+        pattern = np.full((size, size), BACKGROUND, dtype=np.uint8)
+        for dy in (-6, 0, 6):
+            cy = BUTTON_HALF + dy
+            pattern[cy - 2 : cy + 2, BUTTON_HALF - 2 : BUTTON_HALF + 2] = 30
+        return pattern
+
+    @staticmethod
+    def _menu_item_pattern():
+        rng = np.random.default_rng(12345)
+        h, w = MENU_ITEM_HALF[1] * 2, MENU_ITEM_HALF[0] * 2
+        blocks = rng.integers(0, 255, size=(h // 6, w // 6))
+        pattern = np.full((h, w), 240, dtype=np.uint8)
+        pattern[: h // 6 * 6, : w // 6 * 6] = np.kron(blocks, np.ones((6, 6)))
+        return pattern
+
+    @staticmethod
+    def _menu_slot_pattern(index):
+        """삭제가 아닌 메뉴 항목 칸 (칸마다 다른 무늬)."""
+        rng = np.random.default_rng(1000 + index)
+        h, w = MENU_ITEM_HALF[1] * 2, MENU_ITEM_HALF[0] * 2
+        blocks = rng.integers(120, 220, size=(h // 6, w // 6))
+        pattern = np.full((h, w), MENU_FILL, dtype=np.uint8)
+        pattern[: h // 6 * 6, : w // 6 * 6] = np.kron(blocks, np.ones((6, 6)))
+        return pattern
+
+    @staticmethod
+    def _paste(canvas, pattern, left, top, region):
+        """화면 좌표 (left, top) 에 pattern 을 그리되 region 안쪽만 그립니다."""
+        r_left, r_top, r_w, r_h = region
+        x0, y0 = max(left, r_left), max(top, r_top)
+        x1 = min(left + pattern.shape[1], r_left + r_w)
+        y1 = min(top + pattern.shape[0], r_top + r_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        canvas[y0 - r_top : y1 - r_top, x0 - r_left : x1 - r_left] = pattern[
+            y0 - top : y1 - top, x0 - left : x1 - left
+        ]
+
+    def screenshot(self, region=None):
+        region = tuple(int(v) for v in (region or (0, 0, *SCREEN_SIZE)))
+        if self.capture_latency:
+            time.sleep(self.capture_latency)
+        with self._lock:
+            now = time.perf_counter()
+            self._advance(now)
+            canvas = np.full((region[3], region[2]), BACKGROUND, dtype=np.uint8)
+            for index, row_id in enumerate(self.rows[: self.visible_rows]):
+                center_y = FIRST_ROW_CENTER_Y + index * ROW_PITCH
+                self._paste(
+                    canvas,
+                    self._title_pattern(row_id),
+                    TITLE_LEFT,
+                    center_y - TITLE_HALF_HEIGHT,
+                    region,
+                )
+                if row_id not in self.headers:
+                    self._paste(
+                        canvas,
+                        self._button,
+                        BUTTON_X - BUTTON_HALF,
+                        center_y - BUTTON_HALF,
+                        region,
+                    )
+            if self._spinner_visible():
+                center_y = FIRST_ROW_CENTER_Y + len(self.rows) * ROW_PITCH
+                self._paste(
+                    canvas,
+                    self._spinner_pattern(now),
+                    SPINNER_X - SPINNER_HALF,
+                    center_y - SPINNER_HALF,
+                    region,
+                )
+            if self._menu_open(now):
+                left, top, slots, remove_slot = self._menu_box()
+                self._paste(
+                    canvas,
+                    np.full((slots * MENU_SLOT_HEIGHT, MENU_WIDTH), MENU_FILL, dtype=np.uint8),
+                    left,
+                    top,
+                    region,
+                )
+                for slot in range(slots):
+                    pattern = self._menu_item if slot == remove_slot else self._menu_slots[slot]
+                    self._paste(
+                        canvas,
+                        pattern,
+                        left + MENU_WIDTH // 2 - MENU_ITEM_HALF[0],
+                        top + slot * MENU_SLOT_HEIGHT + MENU_SLOT_HEIGHT // 2 - MENU_ITEM_HALF[1],
+                        region,
+                    )
+        return Image.fromarray(canvas).convert("RGB")
+
+
+class FakeRowReader:
+    """OcrRowReader 대신 가상 화면의 행을 실제 글자 인식 결과와 같은 모양의 글로 만들어 나눕니다.
+
+    긴 제목은 두 줄로 넘어가고 채널 줄에는 조회수가 붙으므로 OcrRowReader 와 같은 parse_ocr_row 를
+    거칩니다 (인식 시간은 latency 로 흉내).
+    """
+
+    def __init__(self, screen, latency=0.0):
+        self.screen = screen
+        self.latency = latency
+        self.misread = 0  # 나눈 채널이 실제 채널과 다른 행 수
+
+    def read(self, button_point):
+        from filters import parse_ocr_row
+
+        if self.latency:
+            time.sleep(self.latency)
+        text = self.screen.row_ocr_text(*button_point)
+        info = parse_ocr_row(text)
+        if text and info.channel != self.screen.channel_of_text(text):
+            self.misread += 1
+        return info
+
+
+def install_fake_pyautogui(screen, pause=0.1):
+    """screen 을 조작하는 pyautogui 대체 모듈을 sys.modules 에 등록합니다.
+
+    실제 pyautogui 처럼 호출마다 PAUSE 초만큼 쉽니다 (기본 0.1초, _pause=False 면 생략).
+    드라이버 모듈을 가져오기 전에 호출해야 하며, 화면은 module.screen 으로 바꿀 수 있습니다.
+    """
+    module = types.ModuleType("pyautogui")
+    module.screen = screen
+    module.Point = Point
+    module.PAUSE = pause
+    module.FAILSAFE = True
+    module.FailSafeException = FailSafeException
+    state = {"position": Point(0, 0)}
+
+    def pause(enabled=True):
+        if enabled and module.PAUSE:
+            time.sleep(module.PAUSE)
+
+    def failSafeCheck():
+        if module.FAILSAFE and tuple(state["position"]) == (0, 0):
+            raise FailSafeException("fail-safe triggered from mouse moving to (0, 0)")
+
+    def position():
+        return state["position"]
+
+    def moveTo(x=None, y=None, *args, _pause=True, **kwargs):
+        if y is None and x is not None:
+            x, y = x
+        state["position"] = Point(int(x), int(y))
+        pause(_pause)
+
+    def click(x=None, y=None, *args, _pause=True, **kwargs):
+        if x is not None:
+            if y is None:
+                x, y = x
+            state["position"] = Point(int(x), int(y))
+        module.screen.click(*state["position"])
+        pause(_pause)
+
+    def press(key, *args, _pause=True, **kwargs):
+        module.screen.press(key)
+        pause(_pause)
+
+    def scroll(clicks, x=None, y=None, *args, _pause=True, **kwargs):
+        if x is not None and y is not None:
+            state["position"] = Point(int(x), int(y))
+        module.screen.scroll(clicks)
+        pause(_pause)
+
+    module.failSafeCheck = failSafeCheck
+    module.position = position
+    module.moveTo = moveTo
+    module.click = click
+    module.press = press
+    module.scroll = scroll
+    module.size = lambda: SCREEN_SIZE
+    module.screenshot = lambda region=None, **kwargs: module.screen.screenshot(region)
+    sys.modules["pyautogui"] = module
+    return module
@@ -0,0 +1,414 @@
+"""가상 시청 기록 화면으로 페이싱 전략별 삭제 속도를 측정하는 오프라인 벤치마크.
+
+실제 계정이나 화면 없이 실행됩니다 (리눅스 헤드리스 환경 포함).
+저장소 루트에서 실행하세요:
+
+    python -m bench.run_bench --seconds 10 --menu-ms 80 --remove-ms 150 --fail-rate 0.02
+
+전략마다 새 가상 화면으로 DeletionSession 을 돌리고 다음 값을 출력합니다.
+- 삭제/초: 가상 화면에서 실제로 사라진 행 수 기준
+- 보고/초: 드라이버가 삭제를 확인한 수 기준 (실제와 다르면 삭제 확인이 부정확한 것)
+- 잘못된 클릭 비율: 버튼이나 열린 메뉴 항목이 아닌 곳을 누른 비율
+- CPU: 실행 시간 대비 프로세스 CPU 시간 (가상 화면을 그리는 비용 포함)
+- 입력ms: 반복 한 번에 마우스/키 입력을 보내는 데 쓴 시간의 중앙값 (pyautogui 내장 대기 포함)
+- 남김/잘못 삭제: 필터 전략에서 규칙에 맞지 않아 남긴 행 수와, 그런데도 지워진 행 수
+
+--menu-variants 를 주면 메뉴 종류(Shorts)와 열리는 방향이 행마다 달라집니다.
+gap 전략(고정 간격)과 event 전략(메뉴 레이아웃별 클릭 계획)을 비교해 보세요.
+
+browser 전략은 가상 화면 대신 mock/history.html 을 헤드리스 브라우저 백엔드로 끝까지 지우고
+(--seconds 대신 최대 BROWSER_MAX_SECONDS 초),
+지운 행 수, 지워지지 않는 행 건너뛰기(_skip_index), 다음 페이지 불러오기(_load_more_rows)가
+모의 페이지 설정과 맞는지 확인합니다. Playwright 와 Chromium 이 없으면 건너뜁니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from bench.fake_screen import (
+    BUTTON_X,
+    FIRST_ROW_CENTER_Y,
+    MENU_ITEM_GAP,
+    FakeHistoryScreen,
+    FakeRowReader,
+    install_fake_pyautogui,
+)
+
+# --- Strategies ---
+# 전략 이름 → 기본 설정에 덮어쓸 값
+STRATEGIES = {
+    "fixed": {"adaptive_pacing": False, "event_driven_waits": False, "use_locator": False},
+    "adaptive": {"adaptive_pacing": True, "event_driven_waits": False, "use_locator": False},
+    "event": {"adaptive_pacing": True, "event_driven_waits": True, "use_locator": False},
+    # event 와 같지만 클릭2 위치를 메뉴 레이아웃과 상관없이 고정 간격 하나로 정함 (이전 방식)
+    "gap": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": False,
+        "adaptive_menu": False,
+    },
+    "locator": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": True,
+        "pipelined": False,
+    },
+    # locator 와 같지만 pyautogui 의 호출마다 대기(PAUSE)와 따로 보내는 이동을 그대로 둠
+    "pyautogui": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": True,
+        "pipelined": False,
+        "fast_input": False,
+    },
+    # locator 와 같지만 캡처/분석 스레드가 다음 행 위치를 미리 계산
+    "pipeline": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": True,
+        "pipelined": True,
+    },
+    # pipeline 과 같지만 "채널 1" 의 행만 삭제 (나머지는 클릭 없이 스크롤해 남김)
+    "filter": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": True,
+        "pipelined": True,
+        "filter_channels": ["채널 1"],
+    },
+    "batch": {
+        "adaptive_pacing": True,
+        "event_driven_waits": True,
+        "use_locator": True,
+        "batch_mode": True,
+    },
+}
+
+
+# 모의 페이지를 헤드리스 브라우저 백엔드로 지우는 전략 (STRATEGIES 의 화면 클릭 설정과 따로 실행)
+BROWSER_STRATEGY = "browser"
+MOCK_PAGE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mock", "history.html"
+)
+BROWSER_PAGE_SIZE = 10  # --page-size 를 주지 않았을 때 모의 페이지가 한 번에 불러오는 행 수
+BROWSER_LOAD_TIMEOUT_MS = 3000  # 기록 끝 판단까지 기다리는 시간 (모의 페이지 불러오기 지연보다 길게)
+BROWSER_TIMEOUT_MS = 1000  # 지워지지 않는 행을 실패로 볼 때까지 기다리는 시간
+BROWSER_MAX_SECONDS = 120  # 끝까지 지우는지 확인하므로 --seconds 대신 이 시간까지 실행
+
+
+def browser_unavailable():
+    """브라우저 전략을 실행할 수 없으면 이유를, 실행할 수 있으면 None 을 반환합니다."""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError as e:
+        return f"Playwright 없음 ({e})"
+    try:
+        with sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+    except Exception as e:
+        return f"Chromium 을 실행할 수 없음 ({str(e).splitlines()[0]})"
+    return None
+
+
+def run_browser_strategy(args):
+    """모의 페이지를 브라우저 백엔드로 지우고 결과 dict 를 반환합니다."""
+    from browser_driver import BrowserDriver
+    from drivers import HistoryExhaustedError
+    from sessions import DeletionSession
+
+    rows = args.browser_rows
+    page = args.page_size or BROWSER_PAGE_SIZE
+    stuck = rows // args.browser_stuck_every if args.browser_stuck_every else 0
+    query = (
+        f"rows={rows}&page={page}&menu_ms={args.menu_ms:g}&remove_ms={args.remove_ms:g}"
+        f"&jitter_ms={args.jitter_ms:g}&fail_rate={args.fail_rate:g}&load_ms={args.load_ms:g}"
+        f"&stuck_every={args.browser_stuck_every}"
+    )
+    with tempfile.TemporaryDirectory() as profile_dir:
+        settings = {
+            "browser_history_url": f"{MOCK_PAGE}?{query}",
+            "browser_profile_dir": profile_dir,
+            "browser_timeout_ms": BROWSER_TIMEOUT_MS,
+            "load_timeout_ms": BROWSER_LOAD_TIMEOUT_MS,
+            "row_retries": 1,
+        }
+        driver = BrowserDriver.from_settings(settings.get)
+        # 모의 페이지는 로딩 표시가 보이면 스스로 다음 페이지를 불러오므로 호출 횟수만 셈
+        # (기록 끝 판단은 _load_more_rows 에서만 나옴)
+        loads = []
+        load_more_rows = driver._load_more_rows
+
+        def counting_load_more_rows(loaded):
+            loads.append(loaded)
+            return load_more_rows(loaded)
+
+        driver._load_more_rows = counting_load_more_rows
+        session = DeletionSession(BROWSER_STRATEGY, driver)
+        stopper = threading.Timer(BROWSER_MAX_SECONDS, session.stop)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        stopper.start()
+        try:
+            session.run()
+        except Exception:
+            pass  # session.error 에 남아 결과에 표시됨
+        finally:
+            stopper.cancel()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+    checks = []
+    if not loads:
+        checks.append("행이 없을 때 _load_more_rows 가 호출되지 않음")
+    if not isinstance(session.stop_exception, HistoryExhaustedError):
+        checks.append(f"{BROWSER_MAX_SECONDS}초 안에 기록 끝에 도달하지 못함")
+    if session.delete_count != rows - stuck:
+        checks.append(f"삭제 {session.delete_count}개 (예상 {rows - stuck}개)")
+    if driver.skipped_rows != stuck or driver._skip_index != stuck:
+        checks.append(
+            f"건너뛴 행 {driver.skipped_rows}개, _skip_index {driver._skip_index} (예상 {stuck})"
+        )
+
+    summary = driver.telemetry.summary()
+    return {
+        "strategy": BROWSER_STRATEGY,
+        "seconds": round(wall, 2),
+        # 페이지에서 사라진 행 수는 브라우저를 닫은 뒤 알 수 없어 확인된 삭제 수로 셈
+        "deleted": session.delete_count,
+        "reported": session.delete_count,
+        "deletions_per_s": round(session.delete_count / wall, 3),
+        "reported_per_s": round(session.delete_count / wall, 3),
+        "clicks": 0,
+        "misclick_rate": 0.0,
+        "cpu_percent": round(cpu / wall * 100, 1),  # 브라우저 프로세스는 포함하지 않음
+        "failures": driver.failures,
+        "skipped": driver.skipped_rows,
+        "filtered": driver.filtered_rows,
+        "wrongly_deleted": 0,
+        "stop_reason": session.stop_reason or session.error,
+        "input_ms_per_iteration": None,
+        "steps_ms": summary["steps"],
+        "checks": checks,
+    }
+
+
+def prepare_templates(pa, screen, template_dir):
+    """F8/F9 와 같은 방식으로 가상 화면에서 기준 이미지를 저장합니다."""
+    from locator import (
+        MENU_BUTTON_HALF_SIZE,
+        MENU_BUTTON_TEMPLATE,
+        REMOVE_ITEM_HALF_SIZE,
+        REMOVE_ITEM_TEMPLATE,
+        save_reference_crop,
+    )
+
+    button = pa.Point(BUTTON_X, FIRST_ROW_CENTER_Y)
+    item = pa.Point(button.x + MENU_ITEM_GAP[0], button.y + MENU_ITEM_GAP[1])
+    save_reference_crop(button, MENU_BUTTON_HALF_SIZE, MENU_BUTTON_TEMPLATE, template_dir)
+    screen.click(*button)
+    time.sleep(screen.menu_latency + screen.jitter)
+    save_reference_crop(item, REMOVE_ITEM_HALF_SIZE, REMOVE_ITEM_TEMPLATE, template_dir)
+    screen.press("esc")
+
+
+def run_strategy(name, overrides, args, template_dir, pa):
+    """전략 하나를 args.seconds 동안 실행하고 결과 dict 를 반환합니다."""
+    from desktop_driver import PyAutoGuiDriver
+    from menu_plans import PLANS_FILE_NAME
+    from sessions import DeletionSession
+
+    screen = FakeHistoryScreen(
+        menu_latency=args.menu_ms / 1000,
+        removal_latency=args.remove_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        fail_rate=args.fail_rate,
+        stuck_rate=args.stuck_rate,
+        rows=args.rows,
+        page_size=args.page_size,
+        load_latency=args.load_ms / 1000,
+        header_every=args.header_every,
+        capture_latency=args.capture_ms / 1000,
+        menu_variants=args.menu_variants,
+        seed=args.seed,
+    )
+    pa.screen = screen
+    # 앞 전략이 배운 클릭 계획은 쓰지 않음
+    plans_path = os.path.join(template_dir, PLANS_FILE_NAME)
+    if os.path.exists(plans_path):
+        os.remove(plans_path)
+    settings = {
+        "pos1_x": BUTTON_X,
+        "pos1_y": FIRST_ROW_CENTER_Y,
+        "x_gap": MENU_ITEM_GAP[0],
+        "y_gap": MENU_ITEM_GAP[1],
+        "template_dir": template_dir,
+        **overrides,
+    }
+    reader = FakeRowReader(screen, args.ocr_ms / 1000)
+    driver = PyAutoGuiDriver.from_settings(settings.get, text_reader=reader)
+    session = DeletionSession(name, driver)
+
+    stopper = threading.Timer(args.seconds, session.stop)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    stopper.start()
+    try:
+        session.run()
+    finally:
+        stopper.cancel()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    time.sleep(screen.removal_latency + screen.jitter)  # 마지막 클릭의 삭제 반영
+    screen.screenshot(region=(0, 0, 1, 1))
+
+    summary = driver.telemetry.summary()
+    channels = set(overrides.get("filter_channels", ()))
+    wrongly_deleted = (
+        sum(n for channel, n in screen.removed_channels.items() if channel not in channels)
+        if channels
+        else 0
+    )
+    checks = []
+    if wrongly_deleted:
+        checks.append(f"필터에 맞지 않는 행 {wrongly_deleted}개 삭제")
+    if reader.misread:
+        checks.append(f"글자 인식 결과에서 채널을 잘못 나눈 행 {reader.misread}개")
+    return {
+        "strategy": name,
+        "seconds": round(wall, 2),
+        "deleted": screen.removed,
+        "reported": session.delete_count,
+        "deletions_per_s": round(screen.removed / wall, 3),
+        "reported_per_s": round(session.delete_count / wall, 3),
+        "clicks": screen.clicks,
+        "misclick_rate": round(screen.misclicks / screen.clicks, 4) if screen.clicks else 0.0,
+        "cpu_percent": round(cpu / wall * 100, 1),
+        "failures": driver.failures,
+        "skipped": driver.skipped_rows,
+        "filtered": driver.filtered_rows,
+        "wrongly_deleted": wrongly_deleted,
+        "stop_reason": session.stop_reason or session.error,
+        "input_ms_per_iteration": summary["steps"].get("input", {}).get("p50"),
+        "steps_ms": summary["steps"],
+        "checks": checks,
+    }
+
+
+def format_table(results):
+    lines = [
+        f"{'전략':<10}{'삭제/초':>9}{'보고/초':>9}{'잘못된 클릭':>12}{'CPU':>8}{'실패':>6}{'건너뜀':>6}"
+        f"{'입력ms':>8}{'남김':>6}{'잘못 삭제':>8}",
+    ]
+    for r in results:
+        input_ms = r["input_ms_per_iteration"]
+        lines.append(
+            f"{r['strategy']:<10}{r['deletions_per_s']:>9.2f}{r['reported_per_s']:>9.2f}"
+            f"{r['misclick_rate'] * 100:>11.1f}%{r['cpu_percent']:>7.1f}%{r['failures']:>6}"
+            f"{r['skipped']:>6}{'-' if input_ms is None else f'{input_ms:.1f}':>8}"
+            f"{r['filtered']:>6}{r['wrongly_deleted']:>8}"
+        )
+        if r["stop_reason"]:
+            lines.append(f"{'':<10}자동 중지: {r['stop_reason']}")
+        for problem in r.get("checks", ()):
+            lines.append(f"{'':<10}확인 실패: {problem}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="페이싱 전략별 오프라인 삭제 벤치마크")
+    parser.add_argument(
+        "--strategies",
+        default=",".join([*STRATEGIES, BROWSER_STRATEGY]),
+        help=f"쉼표로 구분한 전략 목록 (기본: {','.join([*STRATEGIES, BROWSER_STRATEGY])})",
+    )
+    parser.add_argument("--seconds", type=float, default=10.0, help="전략별 실행 시간")
+    parser.add_argument("--menu-ms", type=float, default=80, help="메뉴 열림 지연")
+    parser.add_argument("--remove-ms", type=float, default=150, help="행 삭제 지연")
+    parser.add_argument("--jitter-ms", type=float, default=30, help="지연에 더할 최대 무작위 시간")
+    parser.add_argument("--fail-rate", type=float, default=0.02, help="삭제 클릭이 무시될 확률")
+    parser.add_argument(
+        "--stuck-rate", type=float, default=0.0, help="지워지지 않는 행이 섞일 확률"
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="전체 기록 행 수")
+    parser.add_argument(
+        "--page-size", type=int, default=0, help="한 번에 불러오는 행 수 (0 이면 바로 채움)"
+    )
+    parser.add_argument("--load-ms", type=float, default=800, help="다음 페이지 불러오기 지연")
+    parser.add_argument(
+        "--header-every", type=int, default=0, help="날짜 제목 줄을 넣을 행 간격 (0 이면 없음)"
+    )
+    parser.add_argument(
+        "--capture-ms", type=float, default=0, help="화면 캡처 한 번에 걸리는 시간 (실제 화면 흉내)"
+    )
+    parser.add_argument(
+        "--menu-variants",
+        action="store_true",
+        help="메뉴 종류와 열리는 방향을 행마다 바꿈 (화면 아래쪽은 위로 열림)",
+    )
+    parser.add_argument(
+        "--ocr-ms", type=float, default=30, help="필터 전략에서 행 글자 인식 한 번에 걸리는 시간"
+    )
+    parser.add_argument(
+        "--browser-rows", type=int, default=40, help="browser 전략에서 모의 페이지의 전체 행 수"
+    )
+    parser.add_argument(
+        "--browser-stuck-every",
+        type=int,
+        default=10,
+        help="browser 전략에서 이 행 번호마다 지워지지 않는 행을 둠 (0 이면 없음)",
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.1, help="pyautogui 호출마다 쉬는 시간 (pa.PAUSE)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+    names = [name.strip() for name in args.strategies.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STRATEGIES and name != BROWSER_STRATEGY]
+    if unknown:
+        print(f"알 수 없는 전략: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    pa = install_fake_pyautogui(FakeHistoryScreen(), pause=args.pause)
+    results = []
+    with tempfile.TemporaryDirectory() as template_dir:
+        prepare_templates(pa, pa.screen, template_dir)
+        for name in names:
+            if name == BROWSER_STRATEGY:
+                reason = browser_unavailable()
+                if reason:
+                    print(f"[{name}] 건너뜀: {reason}", file=sys.stderr)
+                    continue
+                print(
+                    f"[{name}] 모의 페이지를 끝까지 지우는 중 (최대 {BROWSER_MAX_SECONDS}초)...",
+                    file=sys.stderr,
+                )
+                results.append(run_browser_strategy(args))
+                continue
+            print(f"[{name}] {args.seconds:.0f}초 실행 중...", file=sys.stderr)
+            results.append(run_strategy(name, STRATEGIES[name], args, template_dir, pa))
+
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"parameters": vars(args), "results": results}, f, ensure_ascii=False, indent=2
+            )
+        print(f"결과 저장: {os.path.abspath(args.json)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""헤드리스 브라우저에서 DOM 요소를 직접 눌러 시청 기록을 삭제하는 백엔드.
+
+화면과 마우스를 쓰지 않으므로 작업 중에도 PC 를 그대로 사용할 수 있습니다.
+Playwright 가 필요합니다 (선택 설치):
+
+    pip install playwright
+    playwright install chromium
+
+로그인 상태를 유지하려면 browser_profile_dir 의 프로필로 한 번 로그인해 두어야 합니다
+(browser_headless 를 false 로 두고 실행하면 창이 열립니다).
+"""
+
+import logging
+import time
+from datetime import date
+from pathlib import Path
+
+from drivers import DeletionDriver, HistoryExhaustedError, verify_settings
+from filters import RowFilter, RowInfo, parse_watch_date
+
+logger = logging.getLogger(__name__)
+
+# --- Browser Defaults ---
+DEFAULT_BROWSER_SETTINGS = {
+    "browser_history_url": "https://www.youtube.com/feed/history",
+    "browser_profile_dir": "browser_profile",
+    "browser_headless": True,
+    "browser_timeout_ms": 5000,
+    # YouTube 페이지 구조가 바뀌면 settings.json 에서 선택자만 고치면 됩니다
+    "browser_row_selector": "ytd-video-renderer",
+    "browser_menu_selector": "ytd-menu-renderer button#button",
+    "browser_remove_selector": (
+        "ytd-menu-service-item-renderer:has-text('시청 기록에서 삭제'), "
+        "ytd-menu-service-item-renderer:has-text('Remove from watch history')"
+    ),
+    # 목록 끝의 "더 불러오기" 로딩 표시
+    "browser_spinner_selector": "ytd-continuation-item-renderer",
+    # 필터를 쓸 때 읽는 행의 제목, 채널과 날짜 구역의 제목 줄 ("오늘", "3월 5일" 등)
+    "browser_title_selector": "#video-title",
+    "browser_channel_selector": "ytd-channel-name #text",
+    "browser_section_header_selector": "ytd-item-section-header-renderer",
+}
+SCROLL_STEP = 2000  # 행이 없을 때 아래로 스크롤할 양 (픽셀)
+# 긴 대기를 이 길이로 나눠 중지 요청을 확인 (Playwright 대기는 다른 스레드에서 취소할 수 없음)
+STOP_CHECK_MS = 100
+# 불러온 행 수가 늘어날 때까지 기다리는 조건 (Playwright wait_for_function 용)
+MORE_ROWS_SCRIPT = "([selector, count]) => document.querySelectorAll(selector).length > count"
+FILTER_READ_WINDOW = 20  # 필터를 쓸 때 한 번에 글자를 읽어 오는 행 수
+# 행 start 부터 count 개의 제목, 채널, 날짜 구역 제목을 한 번의 호출로 읽음
+ROW_INFO_SCRIPT = """
+([rowSelector, start, count, titleSelector, channelSelector, headerSelector]) => {
+  const text = (root, selector) => {
+    const element = root && root.querySelector(selector);
+    return element ? element.textContent.trim() : null;
+  };
+  const section = (row) => {
+    // 실제 페이지는 날짜 구역(ytd-item-section-renderer) 안에 제목 줄과 행이 있음
+    const container = row.closest("ytd-item-section-renderer");
+    if (container) return text(container, headerSelector);
+    // 제목 줄이 행과 나란히 있는 구조(모의 페이지)는 앞쪽 형제에서 찾음
+    for (let node = row.previousElementSibling; node; node = node.previousElementSibling) {
+      if (node.matches(headerSelector)) return node.textContent.trim();
+    }
+    return null;
+  };
+  return Array.from(document.querySelectorAll(rowSelector))
+    .slice(start, start + count)
+    .map((row) => ({
+      title: text(row, titleSelector),
+      channel: text(row, channelSelector),
+      section: section(row),
+    }));
+}
+"""
+
+
+def resolve_url(url):
+    """'mock/history.html?rows=200' 같은 로컬 경로를 file:// URL 로 바꿉니다.
+
+    쿼리와 프래그먼트는 경로에서 떼어 낸 뒤 그대로 다시 붙입니다 (as_uri() 가 ? 와 # 를 인코딩하므로).
+    """
+    if "://" in url:
+        return url
+    # urlsplit 은 Windows 경로의 드라이브 문자(C:)를 스킴으로 읽으므로 직접 나눔
+    path, hash_mark, fragment = url.partition("#")
+    path, question_mark, query = path.partition("?")
+    return Path(path).resolve().as_uri() + question_mark + query + hash_mark + fragment
+
+
+class BrowserDriver(DeletionDriver):
+    """Playwright 로 연 브라우저 페이지에서 DOM 요소를 클릭해 삭제하는 백엔드."""
+
+    name = "browser"
+    uses_desktop_input = False
+
+    def __init__(
+        self,
+        history_url,
+        profile_dir,
+        row_selector,
+        menu_selector,
+        remove_selector,
+        spinner_selector=DEFAULT_BROWSER_SETTINGS["browser_spinner_selector"],
+        title_selector=DEFAULT_BROWSER_SETTINGS["browser_title_selector"],
+        channel_selector=DEFAULT_BROWSER_SETTINGS["browser_channel_selector"],
+        section_header_selector=DEFAULT_BROWSER_SETTINGS["browser_section_header_selector"],
+        headless=True,
+        timeout_ms=5000,
+        **verify_options,
+    ):
+        super().__init__(**verify_options)
+        self.history_url = resolve_url(history_url)
+        self.profile_dir = profile_dir
+        self.row_selector = row_selector
+        self.menu_selector = menu_selector
+        self.remove_selector = remove_selector
+        self.spinner_selector = spinner_selector
+        self.title_selector = title_selector
+        self.channel_selector = channel_selector
+        self.section_header_selector = section_header_selector
+        self.headless = headless
+        self.timeout_ms = timeout_ms
+        self.last_latency_ms = 0.0
+        self._skip_index = 0  # 건너뛰거나 필터로 남긴 행 수만큼 위쪽 행은 무시
+        self._row_attempts = 0  # 현재 행에서 실패한 횟수
+        self._playwright = None
+        self._context = None
+        self._page = None
+
+    @classmethod
+    def from_settings(cls, get):
+        """SettingsManager.get 과 같은 형태의 함수로부터 드라이버를 생성합니다."""
+
+        def value(key):
+            return get(key, DEFAULT_BROWSER_SETTINGS[key])
+
+        return cls(
+            history_url=value("browser_history_url"),
+            profile_dir=value("browser_profile_dir"),
+            row_selector=value("browser_row_selector"),
+            menu_selector=value("browser_menu_selector"),
+            remove_selector=value("browser_remove_selector"),
+            spinner_selector=value("browser_spinner_selector"),
+            title_selector=value("browser_title_selector"),
+            channel_selector=value("browser_channel_selector"),
+            section_header_selector=value("browser_section_header_selector"),
+            headless=value("browser_headless"),
+            timeout_ms=value("browser_timeout_ms"),
+            row_filter=RowFilter.from_settings(get),
+            **verify_settings(get),
+        )
+
+    def start(self):
+        # Playwright 는 브라우저 백엔드를 쓸 때만 필요하므로 여기서 가져옵니다
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        self._context = self._playwright.chromium.launch_persistent_context(
+            self.profile_dir, headless=self.headless
+        )
+        self._context.set_default_timeout(self.timeout_ms)
+        pages = self._context.pages
+        self._page = pages[0] if pages else self._context.new_page()
+        self._page.goto(self.history_url)
+        logger.info(f"브라우저 백엔드 시작 - {self.history_url} (headless={self.headless})")
+
+    def step(self):
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        rows = self._page.query_selector_all(self.row_selector)
+        self.visible_rows = max(0, len(rows) - self._skip_index)
+        if not self.visible_rows:
+            if not self._load_more_rows(len(rows)) and self._should_continue():
+                self._record_failure("다음 행을 불러오지 못함")
+            return
+        if self.row_filter is not None and not self._skip_unselected_rows():
+            return
+        row = rows[self._skip_index]
+
+        menu_button = row.query_selector(self.menu_selector)
+        if menu_button is None:
+            raise RuntimeError(
+                f"행 안에서 메뉴 버튼을 찾을 수 없음 (선택자: {self.menu_selector})"
+            )
+
+        start = time.perf_counter()
+        timer = self.telemetry.start_iteration()
+        try:
+            menu_button.click()
+            timer.mark("click1")
+            self._page.locator(self.remove_selector).first.click()
+            timer.mark("click2")
+            # 요소가 DOM 에서 빠지면 "hidden" 상태가 됨
+            if not self._wait_cancellable(
+                lambda timeout: row.wait_for_element_state("hidden", timeout=timeout),
+                self.timeout_ms,
+            ):
+                return
+            timer.mark("confirm")
+        except PlaywrightTimeoutError as e:
+            logger.warning("브라우저 삭제 실패 - %s", e)
+            timer.finish(False)
+            self._page.keyboard.press("Escape")
+            self._row_attempts += 1
+            if self._row_attempts > self.row_retries:
+                logger.warning("행이 지워지지 않음 - 다음 행으로 건너뜀")
+                self._skip_index += 1
+                self.skipped_rows += 1
+                self._row_attempts = 0
+            self._record_failure("브라우저 삭제 시간 초과")
+            return
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        self._row_attempts = 0
+        timer.finish(True)
+        self._record_deleted()
+
+    def _wait_cancellable(self, wait, timeout_ms):
+        """Playwright 대기 함수 wait(timeout_ms) 를 짧게 나눠 호출해 중지 요청에 바로 반응합니다.
+
+        Returns:
+            조건을 만족하면 True, 그 전에 중지되면 False.
+
+        Raises:
+            playwright TimeoutError: timeout_ms 안에 조건을 만족하지 않을 때.
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        deadline = time.perf_counter() + timeout_ms / 1000
+        while True:
+            remaining_ms = (deadline - time.perf_counter()) * 1000
+            try:
+                wait(max(1, min(remaining_ms, STOP_CHECK_MS)))
+                return True
+            except PlaywrightTimeoutError:
+                if not self._should_continue():
+                    return False
+                if remaining_ms <= STOP_CHECK_MS:
+                    raise
+
+    def _skip_unselected_rows(self):
+        """필터에 맞지 않는 행을 클릭 없이 건너뜁니다 (남긴 행은 페이지 위쪽에 그대로 남음).
+
+        Returns:
+            rows[self._skip_index] 가 삭제할 행이면 True. 읽어 온 행이 모두 남길 행이면 False.
+        """
+        infos = self._page.evaluate(
+            ROW_INFO_SCRIPT,
+            [
+                self.row_selector,
+                self._skip_index,
+                FILTER_READ_WINDOW,
+                self.title_selector,
+                self.channel_selector,
+                self.section_header_selector,
+            ],
+        )
+        today = date.today()
+        for info in infos:
+            row = RowInfo(info["title"], info["channel"], parse_watch_date(info["section"], today))
+            if self.row_filter.matches(row):
+                return True
+            logger.debug("필터에 맞지 않는 행 - 남김: %s", row)
+            self._skip_index += 1
+            self.filtered_rows += 1
+        return False
+
+    def _load_more_rows(self, loaded):
+        """스크롤해 다음 행이 불러와질 때까지 기다립니다.
+
+        행 수가 늘어나는 즉시 돌아오며, load_timeout 안에 늘지 않았을 때
+        로딩 표시도 없으면 기록을 모두 지운 것으로 봅니다.
+
+        Returns:
+            행이 더 불러와졌으면 True.
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        logger.debug("삭제할 행 없음 - 스크롤 후 다음 행을 기다림")
+        self._page.mouse.wheel(0, SCROLL_STEP)
+        try:
+            return self._wait_cancellable(
+                lambda timeout: self._page.wait_for_function(
+                    MORE_ROWS_SCRIPT, arg=[self.row_selector, loaded], timeout=timeout
+                ),
+                self.load_timeout_s * 1000,
+            )
+        except PlaywrightTimeoutError:
+            if self._page.query_selector(self.spinner_selector) is None:
+                raise HistoryExhaustedError("더 이상 삭제할 행이 없음")
+            return False
+
+    def page_state(self):
+        return {**super().page_state(), "skip_index": self._skip_index}
+
+    def restore_page_state(self, state):
+        # 페이지를 다시 열면 지워지지 않던 행과 필터로 남긴 행이 맨 위에 다시 있으므로 그 위치만 이어받음.
+        # 건너뛴 행과 남긴 행 수는 이번 실행에서 처리한 것만 셈
+        self._skip_index = state.get("skip_index", 0)
+
+    def status_lines(self):
+        lines = [
+            f"브라우저 삭제 지연: {self.last_latency_ms:.0f}ms "
+            f"(실패 {self.failures}회, 건너뛴 행 {self.skipped_rows}개)"
+        ]
+        filter_status = self._filter_status()
+        if filter_status is not None:
+            lines.append(filter_status)
+        if self.visible_rows is not None:
+            lines.append(f"불러온 남은 행: {self.visible_rows}개")
+        return lines
+
+    def close(self):
+        if self._context is not None:
+            self._context.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._context = self._playwright = self._page = None
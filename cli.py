@@ -0,0 +1,359 @@
+"""GUI 없이 삭제를 실행하는 명령줄 진입점.
+
+settings.json 을 읽어 선택한 백엔드(또는 "sessions" 목록)로 삭제를 실행하고,
+진행 상황을 표준 출력에 JSON 한 줄씩 출력합니다 (로그는 표준 오류로 나감).
+Qt 는 gui 명령을 쓸 때만 가져옵니다.
+
+    python cli.py run                      # 설정대로 한 번 실행하고 끝나면 종료
+    python cli.py run --backend browser    # 백엔드만 바꿔서 실행
+    python cli.py run --sessions           # settings.json 의 "sessions" 를 동시에 실행
+    python cli.py daemon --port 8765       # 계속 실행하며 소켓 명령을 기다림
+    python cli.py stats                    # 설정별 유효 속도 비교와 최근 실행
+    python cli.py gui                      # 기존 GUI 실행
+    python cli.py gui --profile-startup    # GUI 시작 단계별 시간 출력
+
+제어:
+    SIGINT/SIGTERM 은 진행 중인 삭제를 멈추고 종료, SIGUSR1 은 즉시 상태 출력 (POSIX).
+    --port 를 주면 127.0.0.1 의 해당 포트에서 한 줄짜리 명령
+    (status, start, stop, quit) 을 받고 결과를 JSON 한 줄로 답합니다.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import socketserver
+import sys
+import threading
+import time
+
+from drivers import DEFAULT_BACKEND
+from journal import RunJournal
+from log_config import DEFAULT_LOG_LEVEL, LOG_LEVELS, configure_logging
+from run_stats import STATS_FILE_NAME, RunStatsStore
+from sessions import DEFAULT_MAX_PARALLEL_SESSIONS, SessionScheduler, create_session
+from settings import SETTINGS_FILE_NAME, SettingsManager
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+PROGRESS_INTERVAL = 1.0  # 진행 상황 출력 간격 (초)
+STOP_WAIT = 5.0  # 종료할 때 세션이 끝나기를 기다리는 최대 시간 (초)
+CONTROL_HOST = "127.0.0.1"
+# 현재 모니터 구성의 위치 프로필에서 가져오는 설정
+POSITION_KEYS = ("pos1_x", "pos1_y", "x_gap", "y_gap", "template_dir", "template_scale")
+
+
+class JsonLineWriter:
+    """여러 스레드에서 표준 출력에 JSON 한 줄씩 씁니다."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        line = json.dumps(
+            {"event": event, "t": round(time.time(), 3), **fields}, ensure_ascii=False
+        )
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class HeadlessRunner:
+    """설정으로 세션을 만들어 실행하고, 상태를 dict 로 알려 줍니다."""
+
+    def __init__(self, settings, writer, use_sessions=False, backend=None):
+        self.settings = settings
+        self.writer = writer
+        self.use_sessions = use_sessions
+        self.backend = backend
+        self.journal = RunJournal() if settings.get("resume_runs", True) else None
+        self.stats = RunStatsStore()
+        self.scheduler = None
+        self._positions = None  # 화면 클릭 백엔드가 처음 좌표를 물을 때 정함
+        self._lock = threading.Lock()
+
+    def _position_settings(self):
+        """현재 모니터 구성에 맞는 위치 프로필의 좌표. 맞는 프로필이 없으면 모두 None."""
+        if self._positions is None:
+            # 화면이 없는 환경에서도 브라우저 백엔드는 쓸 수 있도록 여기서 가져옴
+            from screen_profiles import detect_displays, resolve_positions
+
+            resolved = resolve_positions(self.settings.get, detect_displays())
+            self._positions = (
+                resolved["settings"] if resolved else dict.fromkeys(POSITION_KEYS[:4])
+            )
+        return self._positions
+
+    def _get(self, key, default=None):
+        if key == "backend" and self.backend is not None:
+            return self.backend
+        if key in POSITION_KEYS:
+            return self._position_settings().get(key, default)
+        return self.settings.get(key, default)
+
+    def _session_configs(self):
+        if self.use_sessions:
+            return self.settings.get("sessions", [])
+        backend = self._get("backend", DEFAULT_BACKEND)
+        return [{"name": backend, "backend": backend}]
+
+    def start(self):
+        """세션을 만들어 시작합니다. 시작하지 못하면 이유 문자열을 반환합니다."""
+        with self._lock:
+            if self.is_running():
+                return "이미 실행 중"
+            configs = self._session_configs()
+            if not configs:
+                return 'settings.json 에 "sessions" 목록이 없습니다.'
+            scheduler = SessionScheduler(
+                self.settings.get("max_parallel_sessions", DEFAULT_MAX_PARALLEL_SESSIONS)
+            )
+            try:
+                for config in configs:
+                    scheduler.add(
+                        create_session(
+                            config, self._get, journal=self.journal, stats=self.stats
+                        )
+                    )
+            except (ImportError, ValueError) as e:
+                return f"세션을 만들 수 없습니다: {e}"
+            self.scheduler = scheduler
+            scheduler.start()
+        self.writer.emit("started", sessions=[s.name for s in scheduler.sessions])
+        return None
+
+    def stop(self):
+        with self._lock:
+            if self.scheduler is not None:
+                self.scheduler.stop()
+
+    def is_running(self):
+        return self.scheduler is not None and self.scheduler.is_running()
+
+    def close(self, timeout=STOP_WAIT):
+        """세션이 끝나기를 잠시 기다린 뒤 남은 실행 통계를 씁니다."""
+        if self.scheduler is not None:
+            self.scheduler.wait(timeout)
+        self.stats.close()
+
+    def status(self):
+        """세션별 진행 상황 dict."""
+        if self.scheduler is None:
+            return {"running": False, "sessions": []}
+        sessions = []
+        for session in self.scheduler.sessions:
+            driver = session.driver
+            sessions.append(
+                {
+                    "name": session.name,
+                    "backend": driver.name,
+                    "running": session.is_running and session.start_time is not None,
+                    "deleted": session.delete_count,
+                    "total_deleted": session.total_deleted(),
+                    "rate": round(session.rate(), 3),
+                    "total_rate": round(session.total_rate(), 3),
+                    "failures": driver.failures,
+                    "skipped": driver.skipped_rows,
+                    "visible_rows": driver.visible_rows,
+                    "restarts": getattr(session, "restarts", 0),
+                    "stop_reason": session.stop_reason,
+                    "error": session.error,
+                }
+            )
+        return {
+            "running": self.is_running(),
+            "total_deleted": self.scheduler.total_deleted(),
+            "rate": round(self.scheduler.aggregate_rate(), 3),
+            "sessions": sessions,
+        }
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    """한 줄짜리 명령을 받아 HeadlessRunner 를 제어합니다."""
+
+    def handle(self):
+        for raw in self.rfile:
+            command = raw.decode("utf-8", "replace").strip().lower()
+            if not command:
+                continue
+            reply = self.server.dispatch(command)
+            self.wfile.write((json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8"))
+            if command == "quit":
+                return
+
+
+class ControlServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port, runner, quit_event):
+        super().__init__((CONTROL_HOST, port), ControlHandler)
+        self.runner = runner
+        self.quit_event = quit_event
+
+    def dispatch(self, command):
+        if command == "status":
+            return {"ok": True, **self.runner.status()}
+        if command == "start":
+            error = self.runner.start()
+            return {"ok": error is None, "error": error}
+        if command == "stop":
+            self.runner.stop()
+            return {"ok": True}
+        if command == "quit":
+            self.runner.stop()
+            self.quit_event.set()
+            return {"ok": True}
+        return {"ok": False, "error": f"알 수 없는 명령: {command}"}
+
+
+def _install_signal_handlers(runner, writer, quit_event):
+    def request_quit(signum, frame):
+        logger.info(f"종료 신호 수신 ({signal.Signals(signum).name})")
+        runner.stop()
+        quit_event.set()
+
+    signal.signal(signal.SIGINT, request_quit)
+    signal.signal(signal.SIGTERM, request_quit)
+    if hasattr(signal, "SIGUSR1"):  # Windows 에는 없음
+        signal.signal(
+            signal.SIGUSR1, lambda signum, frame: writer.emit("progress", **runner.status())
+        )
+
+
+def run_headless(args):
+    """run/daemon 명령: 세션을 실행하며 진행 상황을 JSON 줄로 출력합니다."""
+    settings = SettingsManager(args.settings)
+    configure_logging(args.log_level or settings.get("log_level", DEFAULT_LOG_LEVEL))
+    writer = JsonLineWriter()
+    runner = HeadlessRunner(
+        settings, writer, use_sessions=args.sessions, backend=args.backend
+    )
+    quit_event = threading.Event()
+    _install_signal_handlers(runner, writer, quit_event)
+
+    server = None
+    if args.port:
+        server = ControlServer(args.port, runner, quit_event)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"제어 소켓 대기 중: {CONTROL_HOST}:{args.port}")
+
+    daemon = args.command == "daemon"
+    if not daemon or not args.idle:
+        error = runner.start()
+        if error:
+            writer.emit("error", message=error)
+            if not daemon:
+                return 2
+
+    was_running = runner.is_running()
+    while not quit_event.wait(args.interval):
+        running = runner.is_running()
+        if running or was_running:
+            writer.emit("progress", **runner.status())
+        if was_running and not running:
+            writer.emit("finished", **runner.status())
+            if not daemon:
+                break
+        was_running = running
+
+    runner.stop()
+    if server is not None:
+        server.shutdown()
+    runner.close()
+    status = runner.status()
+    writer.emit("exit", **status)
+    return 1 if any(s["error"] for s in status["sessions"]) else 0
+
+
+def show_stats(args):
+    """stats 명령: 설정별 유효 속도 비교와 최근 실행을 출력합니다."""
+    configure_logging(args.log_level or DEFAULT_LOG_LEVEL)
+    store = RunStatsStore(args.stats_file)
+    if args.json:
+        json.dump(
+            {"groups": store.compare_settings(), "recent": store.recent_runs(args.limit)},
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        print()
+        return 0
+    print("설정별 유효 속도")
+    for line in store.comparison_lines():
+        print(f"  {line}")
+    print(f"최근 실행 {args.limit}개")
+    for run in store.recent_runs(args.limit):
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started_at"]))
+        reason = f" - {run['stop_reason']}" if run["stop_reason"] else ""
+        print(
+            f"  {started} [{run['session']}] {run['deleted']}개, {run['rate']:.2f}개/초, "
+            f"실패 {run['failures']}회{reason}"
+        )
+    return 0
+
+
+def run_gui():
+    """gui 명령: Qt 와 GUI 모듈은 여기서만 가져옵니다."""
+    from PyQt5.QtWidgets import QApplication
+
+    from startup import profiler
+    from youtube_history_deleter import YouTubeHistoryDeleter
+
+    app = QApplication(sys.argv)
+    profiler.mark("QApplication 생성")
+    window = YouTubeHistoryDeleter()
+    window.show()
+    return app.exec_()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="YouTube 시청 기록 삭제 도구 (명령줄)")
+    subparsers = parser.add_subparsers(dest="command")
+    for name, help_text in (
+        ("run", "설정대로 삭제를 실행하고 끝나면 종료"),
+        ("daemon", "계속 실행하며 신호나 소켓 명령으로 제어"),
+    ):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--settings", default=SETTINGS_FILE_NAME, help="설정 파일 경로")
+        sub.add_argument("--backend", help="settings.json 의 backend 대신 사용할 백엔드")
+        sub.add_argument(
+            "--sessions", action="store_true", help='settings.json 의 "sessions" 를 실행'
+        )
+        sub.add_argument(
+            "--interval", type=float, default=PROGRESS_INTERVAL, help="진행 상황 출력 간격 (초)"
+        )
+        sub.add_argument("--port", type=int, help="제어 명령을 받을 로컬 TCP 포트")
+        sub.add_argument("--log-level", choices=LOG_LEVELS)
+        if name == "daemon":
+            sub.add_argument(
+                "--idle", action="store_true", help="시작하지 않고 start 명령을 기다림"
+            )
+    stats = subparsers.add_parser("stats", help="실행 통계 보기")
+    stats.add_argument("--stats-file", default=STATS_FILE_NAME, help="실행 통계 파일 경로")
+    stats.add_argument("--limit", type=int, default=10, help="표시할 최근 실행 수")
+    stats.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    stats.add_argument("--log-level", choices=LOG_LEVELS)
+    gui = subparsers.add_parser("gui", help="GUI 실행")
+    gui.add_argument(
+        "--profile-startup", action="store_true", help="시작 단계별 시간을 표준 오류로 출력"
+    )
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.error("명령을 지정하세요 (run, daemon, stats, gui)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "gui":
+        return run_gui()
+    if args.command == "stats":
+        return show_stats(args)
+    return run_headless(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
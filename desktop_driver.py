@@ -0,0 +1,716 @@
+"""pyautogui 로 실제 마우스를 움직여 삭제하는 데스크톱 백엔드."""
+
+import logging
+import os
+import time
+
+import pyautogui as pa
+
+from drivers import DeletionDriver, HistoryExhaustedError, verify_settings
+from filters import OcrRowReader, RowFilter
+from input_events import create_input
+from locator import (
+    TemplateLocator,
+    MENU_BUTTON_TEMPLATE,
+    REMOVE_ITEM_TEMPLATE,
+    TEMPLATE_DIR,
+)
+from menu_plans import (
+    PLANS_FILE_NAME,
+    ClickPlanner,
+    classify_menu,
+    menu_area,
+    wait_for_menu,
+)
+from pacing import STEP_MENU, STEP_ROW, AdaptivePacer, DEFAULT_PACING_SETTINGS
+from pipeline import FramePipeline
+from screen_watch import (
+    STABLE_FRAMES,
+    ScreenRegion,
+    frames_differ,
+    is_blank,
+    to_frame,
+    wait_for_change,
+    wait_until_stable,
+)
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+# 클릭2 대상(메뉴 항목) 주변 감시 영역 크기 (절반 너비, 절반 높이)
+MENU_PROBE_HALF_SIZE = (40, 12)
+# 일괄 모드 스냅샷의 가로 범위 (기준 위치 기준 왼쪽/오른쪽 여백)
+BATCH_BAND_LEFT = 420
+BATCH_BAND_RIGHT = 40
+# 사라지지 않는 행을 건너뛸 때 한 번에 굴리는 휠 칸 수와 최대 횟수
+SKIP_SCROLL_CLICKS = 1
+SKIP_SCROLL_ATTEMPTS = 5
+# 기준 위치에 행이 없을 때: 화면이 멈춰 있으면 이 간격으로 스크롤해 다음 페이지를 불러오고,
+# 로딩 표시가 도는 중이면 더 긴 간격으로만 스크롤
+LOAD_SCROLL_CLICKS = 1
+LOAD_SCROLL_INTERVAL = 0.5
+LOADING_SCROLL_INTERVAL = 2.0
+LOAD_POLL_INTERVAL = 0.05
+# 남은 행을 살피는 영역의 기준 위치 위쪽 여백
+FEED_TOP_MARGIN = 20
+# 파이프라인에서 찾은 메뉴 버튼 중 기준 위치의 행으로 볼 범위 (절반 너비, 절반 높이)
+PIPELINE_TARGET_BAND = (80, 60)
+
+
+class PyAutoGuiDriver(DeletionDriver):
+    """pyautogui 로 실제 마우스를 움직여 화면의 메뉴를 클릭하는 백엔드."""
+
+    name = "desktop"
+    uses_desktop_input = True
+
+    def __init__(
+        self,
+        base_pos,
+        x_gap,
+        y_gap,
+        pacer,
+        event_driven=True,
+        button_locator=None,
+        item_locator=None,
+        batch_mode=False,
+        input_sender=None,
+        pipelined=False,
+        text_reader=None,
+        click_planner=None,
+        **verify_options,
+    ):
+        super().__init__(**verify_options)
+        self.base_position = base_pos
+        self.x_gap = x_gap
+        self.y_gap = y_gap
+        self.pacer = pacer
+        self.event_driven = event_driven  # 화면 변화 감지로 대기할지 여부
+        # 템플릿 매칭 위치 탐색기 (None 이면 저장된 좌표를 그대로 사용)
+        self.button_locator = button_locator
+        self.item_locator = item_locator
+        # 일괄 모드는 메뉴 버튼 기준 이미지가 있어야 동작
+        self.batch_mode = batch_mode and button_locator is not None
+        # 내장 대기 없이 입력을 보내고 주입 시간을 재는 입력 계층
+        self.input = input_sender or create_input()
+        # 캡처/분석 스레드가 다음 행 위치를 미리 계산 (한 행씩 삭제 + 화면 변화 감지일 때만)
+        self.pipelined = (
+            pipelined and event_driven and button_locator is not None and not self.batch_mode
+        )
+        self.pipeline = None
+        self._next_decision = None  # 삭제 확인 때 받아 둔, 다음 반복에 쓸 판단 결과
+        # 필터가 있을 때 기준 행의 제목과 채널을 읽는 객체 (read(메뉴 버튼 위치) → RowInfo)
+        self.text_reader = text_reader
+        # 메뉴 레이아웃별 클릭2 위치 (None 이면 항상 x_gap, y_gap 간격 사용)
+        self.planner = click_planner
+
+    @classmethod
+    def from_settings(cls, get, text_reader=None):
+        """SettingsManager.get 과 같은 형태의 함수로부터 드라이버를 생성합니다.
+
+        text_reader 를 주지 않으면 필터를 쓸 때 화면 글자 인식(OcrRowReader)을 사용합니다.
+        """
+        pos1_x = get("pos1_x")
+        pos1_y = get("pos1_y")
+        x_gap = get("x_gap")
+        y_gap = get("y_gap")
+        if None in (pos1_x, pos1_y, x_gap, y_gap):
+            raise ValueError("위치가 설정되지 않았습니다 (F8, F9 필요)")
+
+        template_dir = get("template_dir", TEMPLATE_DIR)
+        button_locator = item_locator = None
+        if get("use_locator", True):
+            template_scale = get("template_scale", 1.0)
+            button_locator = TemplateLocator.load(
+                MENU_BUTTON_TEMPLATE, template_dir, template_scale
+            )
+            item_locator = TemplateLocator.load(
+                REMOVE_ITEM_TEMPLATE, template_dir, template_scale
+            )
+            if button_locator is None:
+                logger.info("메뉴 버튼 기준 이미지 없음. 저장된 좌표 사용 (F8로 다시 설정)")
+
+        click_planner = None
+        if get("adaptive_menu", True):
+            # 계획은 픽셀 좌표이므로 모니터 구성별 기준 이미지 폴더에 함께 저장
+            click_planner = ClickPlanner.load(
+                os.path.join(template_dir, PLANS_FILE_NAME), (x_gap, y_gap)
+            )
+
+        batch_mode = get("batch_mode", False)
+        if batch_mode and button_locator is None:
+            logger.warning("메뉴 버튼 기준 이미지가 없어 일괄 모드 대신 한 행씩 삭제")
+
+        row_filter = RowFilter.from_settings(get)
+        if row_filter is not None:
+            if row_filter.has_date_rules:
+                # 화면의 행에는 시청 날짜가 없어 날짜 규칙을 지킬 수 없음
+                raise ValueError("시청 날짜 필터는 헤드리스 브라우저 백엔드에서만 사용할 수 있습니다")
+            if text_reader is None:
+                try:
+                    text_reader = OcrRowReader.from_settings(get)
+                except ImportError as e:
+                    raise ImportError(
+                        f"필터를 쓰려면 pytesseract 와 Tesseract 가 필요합니다 - {e}"
+                    ) from e
+        return cls(
+            pa.Point(pos1_x, pos1_y),
+            x_gap,
+            y_gap,
+            AdaptivePacer.from_settings(get),
+            event_driven=get(
+                "event_driven_waits", DEFAULT_PACING_SETTINGS["event_driven_waits"]
+            ),
+            button_locator=button_locator,
+            item_locator=item_locator,
+            batch_mode=batch_mode,
+            input_sender=create_input(get("fast_input", True)),
+            pipelined=get("pipelined", True),
+            text_reader=text_reader,
+            click_planner=click_planner,
+            row_filter=row_filter,
+            **verify_settings(get),
+        )
+
+    def start(self):
+        if not self.pipelined:
+            return
+        # 분석 스레드는 위치 캐시가 섞이지 않도록 별도의 탐색기를 씀
+        locator = self.button_locator.copy()
+        region = self._pipeline_region()
+        origin = region.box[:2]
+
+        last = {"frame": None, "targets": []}
+
+        def analyze(snapshot):
+            # 직전 프레임과 같으면 템플릿 매칭 결과를 그대로 씀 (삭제를 기다리는 동안 대부분 같음)
+            frame = to_frame(snapshot)
+            if last["frame"] is None or frames_differ(last["frame"], frame):
+                last["targets"] = locator.find_all(snapshot, origin)
+            last["frame"] = frame
+            return {"snapshot": snapshot, "targets": last["targets"]}
+
+        self.pipeline = FramePipeline(region, analyze)
+        self._next_decision = None
+        self.pipeline.start()
+
+    def close(self):
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            self.pipeline = None
+        if self.planner is not None:
+            self.planner.save()
+
+    def refocus(self):
+        # 기준 행의 메뉴 버튼을 눌렀다가 Esc 로 닫으면 브라우저 창이 앞으로 오고,
+        # 남아 있던 메뉴나 팝업도 닫히며 커서가 화면 모서리(비상 정지 위치)에서 벗어남
+        self.input.press("esc")
+        self.input.click(self.base_position)
+        self._sleep(self.pacer.menu_wait())
+        self.input.press("esc")
+        logger.info(f"창 초점 복구: {self.base_position}")
+
+    def recalibrate(self):
+        self.pacer.reset()
+        for locator in (self.button_locator, self.item_locator):
+            if locator is not None:
+                locator.forget()
+        logger.info("대기 시간과 위치 캐시를 초기화")
+        self.refocus()
+
+    def step(self):
+        if self.batch_mode:
+            self._delete_visible_batch()
+        elif self.pipeline is not None:
+            self._delete_one_pipelined()
+        else:
+            self._delete_one()
+
+    def status_lines(self):
+        lines = [
+            f"대기: {self.pacer.describe()} (실패 {self.failures}회, 건너뛴 행 {self.skipped_rows}개)"
+        ]
+        if self.pipeline is not None:
+            lines.append(
+                f"파이프라인 분석: {self.pipeline.last_analyze_ms:.1f}ms "
+                f"(버린 프레임 {self.pipeline.frames.dropped}개)"
+            )
+        elif self.button_locator is not None:
+            lines.append(f"위치 탐색: {self.button_locator.last_locate_ms:.1f}ms")
+        lines.append(
+            f"입력: {self.input.name} (생략한 이동 {self.input.skipped_moves}회)"
+        )
+        if self.planner is not None:
+            lines.append(self.planner.describe())
+        filter_status = self._filter_status()
+        if filter_status is not None:
+            lines.append(filter_status)
+        if self.visible_rows is not None:
+            lines.append(f"화면에 남은 행: {self.visible_rows}개")
+        return lines
+
+    def _on_success(self):
+        self.pacer.on_success()
+        self._record_deleted()
+
+    def _on_failure(self, reason, step=STEP_ROW):
+        self.pacer.on_failure(step)
+        self._record_failure(reason)
+
+    def _wait_for_menu(self, menu_region, menu_before):
+        """클릭1 이후 메뉴가 열릴 때까지 기다립니다. 열리지 않으면 False."""
+        if not self.event_driven:
+            if not self._sleep(self.pacer.menu_wait()):
+                return False
+            return frames_differ(menu_before, menu_region.capture())
+        latency = wait_for_change(
+            menu_region, menu_before, self.pacer.menu.max_s, self._should_continue
+        )
+        if latency is None:
+            return False
+        self.pacer.record_menu_latency(latency)
+        wait_until_stable(menu_region, self.pacer.menu_wait(), self._should_continue)
+        return True
+
+    def _wait_for_menu_layout(self, menu_region, menu_before, target_pos_1):
+        """클릭 계획을 쓸 때: 메뉴가 열리기를 기다려 레이아웃을 구합니다. 열리지 않으면 None."""
+        if not self.event_driven:
+            if not self._sleep(self.pacer.menu_wait()):
+                return None
+            return classify_menu(menu_before, menu_region.capture(), menu_region, target_pos_1)
+        layout, latency = wait_for_menu(
+            menu_region,
+            menu_before,
+            target_pos_1,
+            self.pacer.menu.max_s,
+            self.pacer.menu_wait(),
+            self._should_continue,
+        )
+        if latency is not None:
+            self.pacer.record_menu_latency(latency)
+        return layout
+
+    def _wait_for_row_removal(self, row_region, row_before):
+        """클릭2 이후 행이 사라질 때까지 기다립니다. 변화가 없으면 False."""
+        if not self.event_driven:
+            if not self._sleep(self.pacer.row_wait()):
+                return False
+            return frames_differ(row_before, row_region.capture())
+        latency = wait_for_change(
+            row_region, row_before, self.pacer.row.max_s, self._should_continue
+        )
+        if latency is None:
+            return False
+        self.pacer.record_row_latency(latency)
+        wait_until_stable(row_region, self.pacer.row_wait(), self._should_continue)
+        return True
+
+    def _locate_menu_button(self):
+        """클릭1 위치(메뉴 버튼)를 찾습니다. 찾지 못하면 None."""
+        if self.button_locator is None:
+            # 기준 이미지가 없으면 제목 줄이 비어 있는지로 행 유무만 판단
+            if is_blank(ScreenRegion.row_strip(self.base_position).capture()):
+                return None
+            return self.base_position
+        return self.button_locator.locate(self.base_position)
+
+    def _locate_remove_item(self, expected):
+        """클릭2 위치(삭제 메뉴 항목)를 찾습니다. 찾지 못하면 None."""
+        if self.item_locator is None:
+            return expected
+        # 클릭 계획의 위치는 레이아웃별로 맞춘 것이므로 마지막 위치보다 먼저 찾음
+        return self.item_locator.locate(expected, prefer_expected=self.planner is not None)
+
+    def _report_plan(self, removed):
+        """마지막 클릭2 결과를 그때 메뉴 레이아웃의 클릭 계획에 반영합니다."""
+        if self.planner is not None:
+            self.planner.report(self.planner.last_layout, removed)
+
+    def _row_selected(self, target_pos_1):
+        """필터가 있으면 메뉴 버튼 왼쪽의 제목과 채널을 읽어 규칙에 맞는지 확인합니다."""
+        if self.row_filter is None:
+            return True
+        return self.row_filter.matches(self.text_reader.read(target_pos_1))
+
+    def _feed_region(self):
+        """기준 위치부터 화면 아래 끝까지, 남은 행이 보이는 영역."""
+        _, screen_height = pa.size()
+        left = self.base_position.x - BATCH_BAND_LEFT
+        top = self.base_position.y - FEED_TOP_MARGIN
+        return ScreenRegion(
+            left, top, BATCH_BAND_LEFT + BATCH_BAND_RIGHT, screen_height - top
+        )
+
+    def _pipeline_region(self):
+        """파이프라인이 캡처하는 영역: 기준 행의 제목 줄과 메뉴 버튼 탐색 범위.
+
+        남은 행 전체가 아닌 기준 행 주변만 캡처해 프레임마다 분석 비용을 작게 유지합니다.
+        """
+        strip = ScreenRegion.row_strip(self.base_position)
+        half_w, half_h = self.button_locator.half_w, self.button_locator.half_h
+        right = self.base_position.x + PIPELINE_TARGET_BAND[0] + half_w
+        top = self.base_position.y - PIPELINE_TARGET_BAND[1] - half_h
+        bottom = self.base_position.y + PIPELINE_TARGET_BAND[1] + half_h
+        return ScreenRegion(strip.left, top, right - strip.left, bottom - top)
+
+    def _count_visible_rows(self, snapshot=None, origin=None):
+        """화면에 보이는 메뉴 버튼 수를 셉니다 (기준 이미지가 있을 때만)."""
+        if self.button_locator is None:
+            return
+        if snapshot is None:
+            feed = self._feed_region()
+            snapshot, origin = pa.screenshot(region=feed.box), feed.box[:2]
+        self.visible_rows = len(self.button_locator.find_all(snapshot, origin))
+
+    def _wait_for_next_row(self):
+        """기준 위치에 행이 없을 때 다음 행이 불러와질 때까지 기다립니다.
+
+        남은 영역이 계속 바뀌면(로딩 표시가 도는 중) 기다리고, 멈춰 있으면
+        스크롤해 다음 페이지를 불러오게 합니다. 고정 시간 대신 행이 보이는 즉시 돌아옵니다.
+
+        Returns:
+            찾은 메뉴 버튼 위치. load_timeout 안에 찾지 못하면 None.
+
+        Raises:
+            HistoryExhaustedError: 시간이 지나도 남은 영역이 비어 있을 때.
+        """
+        feed = self._feed_region()
+        previous = feed.capture()
+        start = last_scroll = time.perf_counter()
+        loading = False
+        changed = True  # 남은 영역이 바뀐 경우에만 위치를 다시 찾음
+        while self._should_continue():
+            target = self._locate_menu_button() if changed else None
+            if target is not None:
+                logger.info("다음 행 발견 (%.1f초 대기)", time.perf_counter() - start)
+                self._count_visible_rows()
+                return target
+            now = time.perf_counter()
+            if now - start >= self.load_timeout_s:
+                if is_blank(previous):
+                    self.visible_rows = 0
+                    raise HistoryExhaustedError("더 이상 삭제할 행이 없음")
+                return None
+            interval = LOADING_SCROLL_INTERVAL if loading else LOAD_SCROLL_INTERVAL
+            if now - last_scroll >= interval:
+                logger.debug("행 없음 - 다음 페이지를 불러오도록 스크롤")
+                self.input.scroll(-LOAD_SCROLL_CLICKS, self.base_position)
+                last_scroll = time.perf_counter()
+            self._sleep(LOAD_POLL_INTERVAL)
+            frame = feed.capture()
+            changed = frames_differ(previous, frame)
+            if changed and not loading:
+                logger.debug("로딩 중 - 대기")
+            loading = changed
+            previous = frame
+        return None
+
+    def _click_pair(self, target_pos_1):
+        """메뉴 버튼을 누르고 삭제 항목을 클릭합니다.
+
+        Returns:
+            클릭2까지 했으면 삭제 확인 단계가 남은 IterationTimer, 아니면 None.
+        """
+        expected_pos_2 = pa.Point(
+            target_pos_1.x + self.x_gap, target_pos_1.y + self.y_gap
+        )
+        if self.planner is not None:
+            # 메뉴가 어느 쪽으로 열릴지 모르므로 버튼 주변 전체를 감시
+            menu_region = menu_area(target_pos_1)
+        else:
+            menu_region = ScreenRegion.around(expected_pos_2, *MENU_PROBE_HALF_SIZE)
+        menu_before = menu_region.capture()
+        logger.debug("클릭1 목표: %s", target_pos_1)
+        timer = self.telemetry.start_iteration()
+        self.input.take_elapsed()  # 이전 반복 밖의 입력(스크롤 등)은 제외
+        # 이동은 클릭1과 한 번에 보내고, 커서가 이미 있으면 생략 (이동 시간은 클릭1에 포함)
+        self.input.click(target_pos_1)
+        timer.mark("click1")
+        if self.planner is not None:
+            layout = self._wait_for_menu_layout(menu_region, menu_before, target_pos_1)
+            menu_opened = layout is not None
+        else:
+            menu_opened = self._wait_for_menu(menu_region, menu_before)
+        timer.mark("menu_wait")
+        if not self._should_continue():
+            return None
+        if not menu_opened:
+            logger.warning("메뉴가 열리지 않음 - 클릭2 생략")
+            timer.add("input", self.input.take_elapsed())
+            timer.finish(False)
+            self._on_failure("메뉴가 열리지 않음", STEP_MENU)
+            return None
+        if self.planner is not None:
+            expected_pos_2 = pa.Point(*self.planner.target(target_pos_1, layout))
+        target_pos_2 = self._locate_remove_item(expected_pos_2)
+        if target_pos_2 is None:
+            self.input.press("esc")  # 잘못 열린 메뉴 닫기
+            timer.add("input", self.input.take_elapsed())
+            timer.finish(False)
+            self._on_failure("삭제 메뉴 항목을 찾지 못함", STEP_MENU)
+            return None
+        if self.planner is not None:
+            self.planner.learn(target_pos_1, layout, target_pos_2)
+            logger.debug("클릭2 목표: %s (메뉴 레이아웃: %s)", target_pos_2, layout)
+        else:
+            logger.debug(
+                "클릭2 목표: %s (간격: x=%s, y=%s)", target_pos_2, self.x_gap, self.y_gap
+            )
+        # 클릭2 후 커서를 메뉴 버튼 위로 돌려 두면 다음 반복은 이동 없이 클릭만 보냄
+        self.input.click_and_park(target_pos_2, target_pos_1)
+        timer.mark("click2")
+        timer.add("input", self.input.take_elapsed())
+        return timer
+
+    def _delete_one(self):
+        """기준 위치의 행 하나를 삭제합니다.
+
+        행이 사라진 것이 확인될 때까지 최대 row_retries 번 다시 시도하고,
+        그래도 남아 있으면 건너뛰고 스크롤합니다.
+        """
+        target_pos_1 = self._locate_menu_button()
+        if target_pos_1 is None:
+            target_pos_1 = self._wait_for_next_row()
+        if target_pos_1 is None:
+            if self._should_continue():
+                self._on_failure("메뉴 버튼을 찾지 못함")
+            return
+        row_region = ScreenRegion.row_strip(target_pos_1)
+        row_before = row_region.capture()
+        if not self._row_selected(target_pos_1):
+            self._pass_row(row_region, row_before)
+            return
+        for attempt in range(self.row_retries + 1):
+            if not self._should_continue():
+                return
+            if attempt:
+                logger.info("같은 행 삭제 재시도 (%d/%d)", attempt, self.row_retries)
+            if self._try_delete(target_pos_1, row_region, row_before):
+                return
+        self._skip_row(row_region, row_before)
+
+    def _try_delete(self, target_pos_1, row_region, row_before, pipelined=False):
+        """클릭 한 쌍 후 행이 사라졌는지 확인합니다. 확인되면 True.
+
+        pipelined 면 파이프라인의 판단 결과로 확인합니다 (행이 파이프라인 영역 안에 있어야 함).
+        """
+        timer = self._click_pair(target_pos_1)
+        if timer is None:
+            return False
+        if pipelined:
+            try:
+                removed = self._wait_for_row_removal_pipelined(row_region, row_before)
+            finally:
+                self.pipeline.deactivate()  # 다음 클릭2 이후까지 캡처할 필요 없음
+        else:
+            removed = self._wait_for_row_removal(row_region, row_before)
+        if not removed and not self._should_continue():
+            # 중지해도 클릭2까지 한 행은 세어야 하므로, 중지와 상관없이 삭제가 반영될 때까지만 기다림
+            removed = wait_for_change(row_region, row_before, self.pacer.row_wait()) is not None
+        timer.mark("confirm")
+        timer.finish(removed)
+        self._report_plan(removed)
+        if removed:
+            self._on_success()
+        elif self._should_continue():
+            logger.warning("행 변화 없음 - 삭제 실패로 판단")
+            self._on_failure("행 변화 없음")
+        return removed
+
+    def _pipeline_target(self, decision):
+        """판단 결과에서 기준 위치의 행에 있는 메뉴 버튼을 고릅니다. 없으면 None."""
+        base = self.base_position
+        near = [
+            hit
+            for hit in decision.value["targets"]
+            if abs(hit.x - base.x) <= PIPELINE_TARGET_BAND[0]
+            and abs(hit.y - base.y) <= PIPELINE_TARGET_BAND[1]
+        ]
+        if not near:
+            return None
+        return min(near, key=lambda hit: abs(hit.x - base.x) + abs(hit.y - base.y))
+
+    def _delete_one_pipelined(self):
+        """_delete_one 과 같지만 위치와 삭제 확인을 파이프라인의 판단 결과로 처리합니다.
+
+        삭제 확인 중에 분석 스레드가 이미 다음 행의 메뉴 버튼을 찾아 두므로,
+        다음 반복은 캡처나 템플릿 매칭 없이 바로 클릭합니다. 캡처 스레드는
+        판단 결과를 기다리는 동안(클릭2 이후)만 돌고 메뉴를 여는 동안에는 쉽니다.
+        """
+        decision, self._next_decision = self._next_decision, None
+        if decision is None:
+            decision = self.pipeline.wait(
+                lambda value: True,
+                self.pacer.row.max_s,
+                self._should_continue,
+                since=time.perf_counter(),
+            )
+            self.pipeline.deactivate()
+            if decision is None:
+                return
+        target_pos_1 = self._pipeline_target(decision)
+        if target_pos_1 is None:
+            # 기준 위치에 행이 없으면 다음 페이지 불러오기는 기존 방식으로 처리
+            self._delete_one()
+            return
+        row_region = ScreenRegion.row_strip(target_pos_1)
+        row_before = row_region.crop(decision.value["snapshot"], self.pipeline.origin)
+        if not self._row_selected(target_pos_1):
+            self._pass_row(row_region, row_before)
+            return
+        for attempt in range(self.row_retries + 1):
+            if not self._should_continue():
+                return
+            if attempt:
+                logger.info("같은 행 삭제 재시도 (%d/%d)", attempt, self.row_retries)
+            if self._try_delete(target_pos_1, row_region, row_before, pipelined=True):
+                return
+        self._next_decision = None
+        self._skip_row(row_region, row_before)
+
+    def _wait_for_row_removal_pipelined(self, row_region, row_before):
+        """파이프라인의 판단 결과로 행이 사라지고 안정될 때까지 기다립니다.
+
+        안정된 화면의 판단 결과는 다음 반복이 쓰도록 self._next_decision 에 남깁니다.
+        """
+        origin = self.pipeline.origin
+        clicked_at = time.perf_counter()
+
+        def row_frame(item):
+            return row_region.crop(item.value["snapshot"], origin)
+
+        changed = self.pipeline.wait(
+            lambda value: frames_differ(row_before, row_region.crop(value["snapshot"], origin)),
+            self.pacer.row.max_s,
+            self._should_continue,
+            since=clicked_at,
+        )
+        if changed is None:
+            return False
+        self.pacer.record_row_latency(max(0.0, changed.captured_at - clicked_at))
+        # 연속된 판단 결과에서 행 영역이 같으면 애니메이션이 끝난 것
+        previous, last = row_frame(changed), changed
+        same_count = 0
+        deadline = time.perf_counter() + self.pacer.row_wait()
+        while self._should_continue():
+            item = self.pipeline.wait(
+                lambda value: True,
+                deadline - time.perf_counter(),
+                self._should_continue,
+                after=last.seq,
+            )
+            if item is None:
+                break
+            frame = row_frame(item)
+            if frames_differ(previous, frame):
+                same_count = 0
+            else:
+                same_count += 1
+                if same_count >= STABLE_FRAMES:
+                    self._next_decision = item
+                    break
+            previous, last = frame, item
+        return True
+
+    def _skip_row(self, row_region, row_before):
+        """지워지지 않는 행을 스크롤해 기준 위치 밖으로 밀어냅니다."""
+        logger.warning("행이 지워지지 않음 - 건너뛰고 스크롤")
+        self.input.press("esc")  # 열려 있을 수 있는 메뉴 닫기
+        self.skipped_rows += 1
+        self._scroll_past(row_region, row_before)
+
+    def _pass_row(self, row_region, row_before):
+        """필터에 맞지 않는 행을 클릭하지 않고 스크롤해 기준 위치 밖으로 밀어냅니다."""
+        logger.debug("필터에 맞지 않는 행 - 남기고 스크롤")
+        self.filtered_rows += 1
+        self._scroll_past(row_region, row_before)
+
+    def _scroll_past(self, row_region, row_before):
+        """기준 위치의 행이 바뀔 때까지 조금씩 스크롤합니다."""
+        for _ in range(SKIP_SCROLL_ATTEMPTS):
+            if not self._should_continue():
+                return
+            self.input.scroll(-SKIP_SCROLL_CLICKS, self.base_position)
+            wait_until_stable(row_region, self.pacer.row_wait(), self._should_continue)
+            if frames_differ(row_before, row_region.capture()):
+                return
+        logger.warning("스크롤해도 기준 위치의 행이 바뀌지 않음")
+
+    def _delete_visible_batch(self):
+        """스냅샷 한 장으로 보이는 모든 행을 찾아 연속으로 삭제합니다.
+
+        아래 행을 지워도 위 행의 위치는 바뀌지 않으므로 아래에서 위 순서로
+        클릭하고, 행이 사라지는 것을 매번 기다리지 않고 다음 행으로 넘어갑니다.
+        삭제 여부는 배치가 끝난 뒤 스냅샷 한 장으로 한꺼번에 확인합니다.
+        """
+        _, screen_height = pa.size()
+        origin = (max(0, self.base_position.x - BATCH_BAND_LEFT), 0)
+        band = (
+            origin[0],
+            origin[1],
+            self.base_position.x + BATCH_BAND_RIGHT - origin[0],
+            screen_height,
+        )
+        snapshot = pa.screenshot(region=band)
+        targets = self.button_locator.find_all(snapshot, origin)
+        self.visible_rows = len(targets)
+        if not targets:
+            logger.info("보이는 행 없음 - 다음 행을 기다림")
+            if self._wait_for_next_row() is None and self._should_continue():
+                self._on_failure("보이는 행 없음")
+            return
+        selected = [self._row_selected(target) for target in targets]
+        if not any(selected):
+            # 보이는 행이 모두 남길 행이면 화면 밖으로 넘김 (남긴 행은 넘길 때 한 번만 셈)
+            logger.debug("보이는 행 %d개 모두 필터에 맞지 않음 - 스크롤", len(targets))
+            self.filtered_rows += len(targets)
+            self.input.scroll(-SKIP_SCROLL_CLICKS * len(targets), self.base_position)
+            wait_until_stable(self._feed_region(), self.pacer.row_wait(), self._should_continue)
+            return
+        logger.debug("일괄 삭제 대상 %d/%d개: %s", sum(selected), len(targets), targets)
+        rows = [ScreenRegion.row_strip(target) for target in targets]
+        befores = [row.crop(snapshot, origin) for row in rows]
+
+        # (행 번호, 삭제 확인을 기다리는 IterationTimer, 클릭2 때의 메뉴 레이아웃)
+        clicked = []
+        for index in reversed(range(len(targets))):  # 아래에서 위로
+            if not self._should_continue():
+                break
+            if not selected[index]:
+                continue
+            timer = self._click_pair(targets[index])
+            if timer is not None:
+                layout = self.planner.last_layout if self.planner is not None else None
+                clicked.append((index, timer, layout))
+        if not clicked:
+            return
+
+        top, top_timer, _ = clicked[-1]
+        stopping = not self._should_continue()
+        if stopping:
+            # 중지해도 이미 누른 행은 세어야 하므로, 중지와 상관없이 삭제가 반영될 때까지만 기다림
+            wait_for_change(rows[top], befores[top], self.pacer.row_wait())
+        else:
+            # 마지막으로 클릭한(가장 위) 행이 바뀌는 시간으로 페이싱을 학습
+            self._wait_for_row_removal(rows[top], befores[top])
+        top_timer.mark("confirm")
+        after = pa.screenshot(region=band)
+        afters = [row.crop(after, origin) for row in rows]
+        removed_any = False
+        for index, timer, layout in clicked:
+            # 위쪽 행이 지워지면 남은 행은 위로 당겨지므로, 원래 자리나 그 위
+            # 어디에도 보이지 않을 때만 삭제된 것으로 봄
+            removed = all(
+                frames_differ(befores[index], frame) for frame in afters[: index + 1]
+            )
+            timer.finish(removed)
+            if self.planner is not None:
+                self.planner.report(layout, removed)
+            if removed:
+                removed_any = True
+                self._on_success()
+            elif not stopping:
+                logger.warning("행 변화 없음 - 삭제 실패로 판단: %s", targets[index])
+                self._on_failure("행 변화 없음")
+        # 보이는 행이 하나도 지워지지 않으면 남은 행들을 건너뜀
+        if not removed_any and not stopping:
+            self._skip_row(rows[top], afters[top])
@@ -0,0 +1,157 @@
+"""삭제 백엔드(드라이버) 공통 인터페이스.
+
+DeleteWorker 는 드라이버가 무엇으로 삭제하는지(실제 마우스, 헤드리스 브라우저 등)
+알지 못하고, step() 을 반복 호출하면서 삭제 수와 상태만 전달받습니다.
+"""
+
+import importlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+
+from telemetry import Telemetry
+
+logger = logging.getLogger(__name__)
+
+# --- Backends ---
+DEFAULT_BACKEND = "desktop"
+# 백엔드 이름 → (모듈, 클래스). 선택된 백엔드 모듈만 가져옵니다.
+BACKENDS = {
+    "desktop": ("desktop_driver", "PyAutoGuiDriver"),
+    "browser": ("browser_driver", "BrowserDriver"),
+}
+BACKEND_LABELS = {
+    "desktop": "화면 클릭 (마우스 사용)",
+    "browser": "헤드리스 브라우저 (화면 불필요)",
+}
+# 삭제 확인과 다음 행 불러오기 관련 기본값
+DEFAULT_VERIFY_SETTINGS = {
+    "row_retries": 2,  # 같은 행 삭제를 다시 시도하는 횟수 (넘으면 건너뜀)
+    "max_consecutive_failures": 10,  # 연속으로 이만큼 실패하면 작업 중지
+    "load_timeout_ms": 10000,  # 행이 없을 때 다음 행이 불러와지기를 기다리는 최대 시간
+}
+
+
+class DriverStopped(Exception):
+    """드라이버가 스스로 작업을 끝낼 때 발생합니다 (오류가 아닌 자동 중지)."""
+
+
+class TooManyFailuresError(DriverStopped):
+    """연속 실패가 한도를 넘어 드라이버가 작업을 포기했을 때 발생합니다."""
+
+
+class HistoryExhaustedError(DriverStopped):
+    """더 불러올 행이 없어 삭제할 것이 남지 않았을 때 발생합니다."""
+
+
+class DeletionDriver(ABC):
+    """삭제 백엔드의 공통 인터페이스."""
+
+    name = ""
+    # True 면 실제 마우스/키보드를 사용하므로 한 번에 하나만 실행할 수 있음
+    uses_desktop_input = False
+
+    def __init__(
+        self,
+        row_retries=DEFAULT_VERIFY_SETTINGS["row_retries"],
+        max_consecutive_failures=DEFAULT_VERIFY_SETTINGS["max_consecutive_failures"],
+        load_timeout_ms=DEFAULT_VERIFY_SETTINGS["load_timeout_ms"],
+        row_filter=None,
+    ):
+        self.row_retries = row_retries
+        self.max_consecutive_failures = max_consecutive_failures
+        self.load_timeout_s = load_timeout_ms / 1000
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.skipped_rows = 0
+        # 삭제할 행을 고르는 RowFilter (None 이면 모두 삭제)와 규칙에 맞지 않아 남긴 행 수
+        self.row_filter = row_filter
+        self.filtered_rows = 0
+        self.visible_rows = None  # 마지막으로 센 화면(또는 페이지)의 남은 행 수
+        self.telemetry = Telemetry()  # 반복별 단계 소요 시간 기록
+        self._should_continue = lambda: True
+        self._on_deleted = lambda: None
+        self._stop_event = threading.Event()  # 설정되면 _sleep() 이 바로 깨어남
+
+    def attach(self, should_continue, on_deleted, stop_event=None):
+        """작업 중단 여부 확인 함수, 삭제 알림 함수와 중지 이벤트를 연결합니다."""
+        self._should_continue = should_continue
+        self._on_deleted = on_deleted
+        if stop_event is not None:
+            self._stop_event = stop_event
+
+    def _sleep(self, seconds):
+        """seconds 동안 쉬되 중지 요청이 오면 바로 돌아옵니다. 중지되었으면 False."""
+        return not self._stop_event.wait(seconds)
+
+    def start(self):
+        """삭제 시작 전 준비 (브라우저 실행 등)."""
+
+    @abstractmethod
+    def step(self):
+        """삭제 단위(한 행 또는 한 배치)를 한 번 수행합니다.
+
+        행이 실제로 사라진 것을 확인한 경우에만 _record_deleted() 를,
+        실패하면 _record_failure() 를 호출합니다.
+        반복마다 self.telemetry 에 단계별 시간을 기록합니다.
+        """
+
+    def _record_deleted(self):
+        """삭제가 확인된 행 하나를 알립니다."""
+        self.consecutive_failures = 0
+        self._on_deleted()
+
+    def _record_failure(self, reason):
+        """실패를 세고, 연속 실패가 한도에 이르면 TooManyFailuresError 를 발생시킵니다."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.max_consecutive_failures:
+            raise TooManyFailuresError(
+                f"연속 {self.consecutive_failures}회 삭제 실패로 작업 중지 (마지막: {reason})"
+            )
+
+    def status_lines(self):
+        """상태 표시에 덧붙일 백엔드별 정보."""
+        return []
+
+    def _filter_status(self):
+        """필터를 쓰는 경우 상태 표시에 덧붙일 한 줄. 필터가 없으면 None."""
+        if self.row_filter is None:
+            return None
+        return (
+            f"필터: {self.row_filter.describe()} (남긴 행 {self.filtered_rows}개, "
+            f"판정 캐시 적중 {self.row_filter.cache_hit_rate():.0%})"
+        )
+
+    def page_state(self):
+        """실행 기록에 남길 페이지 상태."""
+        return {
+            "visible_rows": self.visible_rows,
+            "skipped_rows": self.skipped_rows,
+            "filtered_rows": self.filtered_rows,
+        }
+
+    def restore_page_state(self, state):
+        """이전 실행의 페이지 상태를 이어받습니다 (백엔드가 필요할 때만 재정의)."""
+
+    def refocus(self):
+        """감시자의 복구 동작: 입력이 다시 기록 페이지로 가게 합니다 (start() 직후 호출)."""
+
+    def recalibrate(self):
+        """감시자의 복구 동작: 학습한 위치와 대기 시간을 버리고 다시 맞춥니다 (start() 직후 호출)."""
+
+    def close(self):
+        """사용한 자원을 정리합니다."""
+
+
+def verify_settings(get):
+    """드라이버 생성자에 넘길 삭제 확인 설정을 읽습니다."""
+    return {key: get(key, default) for key, default in DEFAULT_VERIFY_SETTINGS.items()}
+
+
+def load_driver_class(backend):
+    """백엔드 이름에 해당하는 드라이버 클래스를 가져옵니다."""
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 백엔드: {backend}")
+    module_name, class_name = BACKENDS[backend]
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,268 @@
+"""규칙(채널, 제목 키워드, 시청 날짜)에 맞는 시청 기록만 골라 삭제하는 필터.
+
+규칙은 settings.json 에 적습니다. 규칙이 하나도 없으면 필터를 쓰지 않고 모두 삭제합니다.
+
+    "filter_channels": ["채널 이름", ...]        채널 이름으로 시작하는 행 (대소문자 무시, 뒤에 붙은 배지나 인식 잡음은 무시)
+    "filter_title_keywords": ["키워드", ...]     제목에 키워드가 들어 있는 행 (대소문자 무시)
+    "filter_watched_after": "2024-01-01"       이 날짜 이후에 본 행 (그날 포함)
+    "filter_watched_before": "2024-12-31"      이 날짜 이전에 본 행 (그날 포함)
+
+채널과 키워드 규칙은 하나라도 맞으면 되고, 날짜 규칙은 함께 만족해야 합니다.
+제목이나 날짜를 읽지 못한 행은 지우지 않고 남깁니다.
+
+규칙은 시작할 때 한 번 컴파일하고(키워드는 정규식 하나로 묶음), 판정 결과는 (제목, 채널, 날짜)별로
+캐시하므로 수천 행을 걸러도 전체 삭제와 비슷한 속도를 유지합니다.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+DEFAULT_FILTER_SETTINGS = {
+    "filter_channels": [],
+    "filter_title_keywords": [],
+    "filter_watched_after": None,
+    "filter_watched_before": None,
+}
+MATCH_CACHE_SIZE = 8192  # 판정 결과 캐시 크기 (행 정보별)
+TEXT_CACHE_SIZE = 1024  # 화면 글자 인식 결과 캐시 크기 (행 이미지별)
+# 화면 글자 인식 영역: 메뉴 버튼 중심 기준 (왼쪽, 위, 너비, 높이). 제목과 채널 두 줄을 포함
+DEFAULT_OCR_BOX = (-640, -30, 620, 60)
+DEFAULT_OCR_LANG = "kor+eng"
+# 글자 인식한 채널 줄에서 채널 이름과 조회수 등을 나누는 구분 기호 ("채널 • 조회수 1.2만회")
+OCR_SEPARATOR = re.compile(r"\s*[•·]\s*")
+
+# 행에서 읽은 정보. watched 는 datetime.date 또는 None (알 수 없음)
+RowInfo = namedtuple("RowInfo", "title channel watched")
+
+WEEKDAYS = {
+    **{name: i for i, name in enumerate(("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"))},
+    **{
+        name: i
+        for i, name in enumerate(
+            ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+        )
+    },
+}
+ENGLISH_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%b %d", "%B %d")
+
+
+def _parse_setting_date(value):
+    if not value:
+        return None
+    return date.fromisoformat(value)
+
+
+def parse_watch_date(text, today=None):
+    """시청 기록의 날짜 제목("오늘", "어제", "월요일", "3월 5일", "2023. 3. 5.", "Mar 5, 2023" 등)을 날짜로 바꿉니다.
+
+    알 수 없는 형식이면 None.
+    """
+    if not text:
+        return None
+    try:
+        return _parse_watch_date(text.strip(), today or date.today())
+    except ValueError:  # "2023. 2. 30." 처럼 없는 날짜
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_watch_date(text, today):
+    """parse_watch_date 의 본체. 같은 날짜 제목이 여러 행에 반복되므로 결과를 캐시합니다."""
+    lowered = text.lower()
+    if lowered in ("오늘", "today"):
+        return today
+    if lowered in ("어제", "yesterday"):
+        return today - timedelta(days=1)
+    if lowered in WEEKDAYS:
+        # 최근 일주일 안의 날짜는 요일로 표시됨 (오늘은 "오늘")
+        days = (today.weekday() - WEEKDAYS[lowered]) % 7 or 7
+        return today - timedelta(days=days)
+    match = re.fullmatch(r"(\d+)\s*(?:일 전|days? ago)", lowered)
+    if match:
+        return today - timedelta(days=int(match.group(1)))
+    match = re.fullmatch(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?", text)
+    if match:
+        return date(*map(int, match.groups()))
+    match = re.fullmatch(r"(?:(\d{4})년\s*)?(\d{1,2})월\s*(\d{1,2})일", text)
+    if match:
+        year, month, day = match.groups()
+        return _with_year(int(year) if year else None, int(month), int(day), today)
+    for fmt in ENGLISH_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        year = parsed.year if "%Y" in fmt else None
+        return _with_year(year, parsed.month, parsed.day, today)
+    return None
+
+
+def _with_year(year, month, day, today):
+    """연도가 없는 날짜는 올해로 보고, 미래가 되면 작년으로 봅니다."""
+    if year is not None:
+        return date(year, month, day)
+    result = date(today.year, month, day)
+    return result if result <= today else date(today.year - 1, month, day)
+
+
+class RowFilter:
+    """미리 컴파일한 규칙으로 행을 지울지 판단하고 결과를 캐시합니다."""
+
+    def __init__(
+        self,
+        channels=(),
+        title_keywords=(),
+        watched_after=None,
+        watched_before=None,
+        cache_size=MATCH_CACHE_SIZE,
+    ):
+        self.channels = frozenset(c.strip().casefold() for c in channels if c.strip())
+        # 채널 이름 뒤에 단어가 이어지지 않을 때만 맞음 ("채널 1" 은 "채널 12" 에 맞지 않음)
+        self.channel_pattern = (
+            re.compile("(?:" + "|".join(map(re.escape, self.channels)) + r")(?!\w)")
+            if self.channels
+            else None
+        )
+        keywords = [k.strip() for k in title_keywords if k.strip()]
+        # 키워드 여러 개를 정규식 하나로 묶어 제목을 한 번만 훑음
+        self.keyword_pattern = (
+            re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE) if keywords else None
+        )
+        self.keyword_count = len(keywords)
+        self.watched_after = watched_after
+        self.watched_before = watched_before
+        self.matches = lru_cache(maxsize=cache_size)(self._matches)
+
+    @classmethod
+    def from_settings(cls, get):
+        """설정에서 규칙을 읽습니다. 규칙이 하나도 없으면 None (모두 삭제)."""
+
+        def value(key):
+            return get(key, DEFAULT_FILTER_SETTINGS[key])
+
+        row_filter = cls(
+            channels=value("filter_channels") or (),
+            title_keywords=value("filter_title_keywords") or (),
+            watched_after=_parse_setting_date(value("filter_watched_after")),
+            watched_before=_parse_setting_date(value("filter_watched_before")),
+        )
+        if not (row_filter.has_text_rules or row_filter.has_date_rules):
+            return None
+        logger.info(f"삭제 필터 사용: {row_filter.describe()}")
+        return row_filter
+
+    @property
+    def has_text_rules(self):
+        return self.channel_pattern is not None or self.keyword_pattern is not None
+
+    @property
+    def has_date_rules(self):
+        return self.watched_after is not None or self.watched_before is not None
+
+    def _matches(self, info):
+        """RowInfo 가 규칙에 맞으면 True (캐시되는 원래 판정 함수)."""
+        if self.has_text_rules:
+            channel = (info.channel or "").strip().casefold()
+            title = info.title or ""
+            if not (
+                (self.channel_pattern is not None and self.channel_pattern.match(channel))
+                or (self.keyword_pattern is not None and self.keyword_pattern.search(title))
+            ):
+                return False
+        if self.has_date_rules:
+            if info.watched is None:
+                return False
+            if self.watched_after is not None and info.watched < self.watched_after:
+                return False
+            if self.watched_before is not None and info.watched > self.watched_before:
+                return False
+        return True
+
+    def describe(self):
+        parts = []
+        if self.channels:
+            parts.append(f"채널 {len(self.channels)}개")
+        if self.keyword_pattern is not None:
+            parts.append(f"키워드 {self.keyword_count}개")
+        if self.watched_after is not None:
+            parts.append(f"{self.watched_after} 이후")
+        if self.watched_before is not None:
+            parts.append(f"{self.watched_before} 이전")
+        return ", ".join(parts)
+
+    def cache_hit_rate(self):
+        info = self.matches.cache_info()
+        total = info.hits + info.misses
+        return info.hits / total if total else 0.0
+
+
+def parse_ocr_row(text):
+    """행을 글자 인식한 결과를 RowInfo 로 나눕니다.
+
+    실제 행은 제목(길면 두 줄로 넘어감) 아래에 "채널 • 조회수 N회" 줄이 있으므로,
+    구분 기호가 있는 첫 줄의 앞부분을 채널로, 그 위의 줄들을 제목으로 봅니다.
+    구분 기호를 읽지 못했으면 첫 줄을 제목, 둘째 줄을 채널로 봅니다.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    for index, line in enumerate(lines[1:], start=1):
+        channel = OCR_SEPARATOR.split(line, maxsplit=1)
+        if len(channel) > 1:
+            return RowInfo(" ".join(lines[:index]), channel[0] or None, None)
+    return RowInfo(
+        title=lines[0] if lines else None,
+        channel=lines[1] if len(lines) > 1 else None,
+        watched=None,
+    )
+
+
+class OcrRowReader:
+    """화면 클릭 백엔드용: 메뉴 버튼 왼쪽의 제목과 채널을 글자 인식으로 읽습니다.
+
+    pytesseract 와 Tesseract 가 필요합니다 (선택 설치). 같은 행 이미지는 다시 인식하지 않도록
+    이미지 해시별로 결과를 캐시합니다. 시청 날짜는 행 안에 없으므로 읽지 않습니다 (None).
+    """
+
+    def __init__(self, box=DEFAULT_OCR_BOX, lang=DEFAULT_OCR_LANG, cache_size=TEXT_CACHE_SIZE):
+        # 필터를 쓸 때만 필요하므로 여기서 가져옵니다
+        import pytesseract
+        import pyautogui as pa
+
+        self._pytesseract = pytesseract
+        self._pa = pa
+        self.box = tuple(box)
+        self.lang = lang
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.last_read_ms = 0.0
+
+    @classmethod
+    def from_settings(cls, get):
+        return cls(box=get("ocr_box", DEFAULT_OCR_BOX), lang=get("ocr_lang", DEFAULT_OCR_LANG))
+
+    def read(self, button_point):
+        dx, dy, width, height = self.box
+        image = self._pa.screenshot(
+            region=(max(0, button_point.x + dx), max(0, button_point.y + dy), width, height)
+        )
+        key = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        info = self._cache.get(key)
+        if info is not None:
+            self._cache.move_to_end(key)
+            return info
+        start = time.perf_counter()
+        text = self._pytesseract.image_to_string(image.convert("L"), lang=self.lang)
+        self.last_read_ms = (time.perf_counter() - start) * 1000
+        info = parse_ocr_row(text)
+        logger.debug("행 글자 인식: %s (%.0fms)", info, self.last_read_ms)
+        self._cache[key] = info
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return info
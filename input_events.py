@@ -0,0 +1,187 @@
+"""마우스/키보드 입력을 적은 비용으로 보내는 입력 계층.
+
+pyautogui 는 호출마다 pa.PAUSE(기본 0.1초)만큼 쉬므로, 이동 → 클릭1 → 클릭2 → 이동으로
+이루어진 반복 한 번에 보이지 않는 대기가 최대 0.4초 더해집니다. 대기는 페이싱과 화면 변화
+감지가 이미 맡고 있으므로 여기서는 다음과 같이 입력만 보냅니다.
+
+- pyautogui 의 내장 대기를 끄고(_pause=False) 호출합니다.
+- 커서가 이미 목표 위치에 있으면 이동을 생략하고, 이동과 클릭은 한 번의 호출로 보냅니다.
+- Windows 에서는 "클릭2 + 메뉴 버튼 위로 복귀" 같은 연속 입력을 SendInput 한 번으로 보냅니다.
+  pyautogui 를 거치지 않으므로 보내기 전에 모서리 비상 정지(FAILSAFE)를 직접 확인합니다.
+
+입력을 보내는 데 걸린 시간은 take_elapsed() 로 반복마다 가져가 통계에 기록합니다.
+"""
+
+import logging
+import sys
+import time
+
+import pyautogui as pa
+
+logger = logging.getLogger(__name__)
+
+
+class PyAutoGuiInput:
+    """pyautogui 로 입력을 보내되 내장 대기와 불필요한 이동을 생략합니다.
+
+    Args:
+        fast: False 면 이전처럼 호출마다 pa.PAUSE 만큼 쉬고 이동과 클릭을 따로 보냅니다 (비교용).
+    """
+
+    name = "pyautogui"
+
+    def __init__(self, fast=True):
+        self.fast = fast
+        self.skipped_moves = 0  # 커서가 이미 있어 생략한 이동 수
+        self._elapsed = 0.0
+
+    def take_elapsed(self):
+        """마지막 호출 이후 입력을 보내는 데 쓴 시간(초)을 반환하고 초기화합니다."""
+        elapsed, self._elapsed = self._elapsed, 0.0
+        return elapsed
+
+    def _timed(self, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            if self.fast:
+                kwargs["_pause"] = False
+            return func(*args, **kwargs)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def _at(self, point):
+        """커서가 이미 point 에 있는지 확인합니다 (커서 위치 조회는 입력 주입보다 훨씬 쌈)."""
+        current = pa.position()
+        return (current[0], current[1]) == (point[0], point[1])
+
+    def move(self, point):
+        if self.fast and self._at(point):
+            self.skipped_moves += 1
+            return
+        self._timed(pa.moveTo, point[0], point[1])
+
+    def click(self, point):
+        """point 를 클릭합니다. 이동이 필요하면 클릭과 한 번에 보냅니다."""
+        if not self.fast:
+            self._timed(pa.moveTo, point[0], point[1])
+            self._timed(pa.click)
+        elif self._at(point):
+            self.skipped_moves += 1
+            self._timed(pa.click)
+        else:
+            self._timed(pa.click, point[0], point[1])
+
+    def click_and_park(self, point, park):
+        """point 를 클릭한 뒤 커서를 park 로 옮겨 둡니다 (다음 반복의 이동을 없앰)."""
+        if not self.fast:
+            self._timed(pa.click, point[0], point[1])
+            self._timed(pa.moveTo, park[0], park[1])
+            return
+        self.click(point)
+        self.move(park)
+
+    def press(self, key):
+        self._timed(pa.press, key)
+
+    def scroll(self, clicks, point):
+        self._timed(pa.scroll, clicks, x=point[0], y=point[1])
+
+
+class SendInputInput(PyAutoGuiInput):
+    """Windows: 연속된 마우스 입력을 SendInput 한 번으로 보냅니다."""
+
+    name = "sendinput"
+
+    # winuser.h
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+    SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN = 76, 77
+    SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN = 78, 79
+
+    def __init__(self):
+        super().__init__(fast=True)
+        import ctypes
+        from ctypes import wintypes
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class INPUT(ctypes.Structure):
+            # 마우스 입력만 보내지만 공용체 중 MOUSEINPUT 이 가장 커서 크기가 같음
+            _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+
+        self._ctypes = ctypes
+        self._INPUT = INPUT
+        self._user32 = ctypes.windll.user32
+        self._user32.SendInput.argtypes = (
+            wintypes.UINT,
+            ctypes.POINTER(INPUT),
+            ctypes.c_int,
+        )
+        self._user32.SendInput.restype = wintypes.UINT
+
+    def _event(self, flags, point=None):
+        event = self._INPUT(type=self.INPUT_MOUSE)
+        event.mi.dwFlags = flags
+        if point is not None:
+            # 가상 데스크톱 전체를 0~65535 로 정규화한 절대 좌표
+            metric = self._user32.GetSystemMetrics
+            left, top = metric(self.SM_XVIRTUALSCREEN), metric(self.SM_YVIRTUALSCREEN)
+            width = max(2, metric(self.SM_CXVIRTUALSCREEN))
+            height = max(2, metric(self.SM_CYVIRTUALSCREEN))
+            event.mi.dx = round((point[0] - left) * 65535 / (width - 1))
+            event.mi.dy = round((point[1] - top) * 65535 / (height - 1))
+            event.mi.dwFlags |= (
+                self.MOUSEEVENTF_MOVE | self.MOUSEEVENTF_ABSOLUTE | self.MOUSEEVENTF_VIRTUALDESK
+            )
+        return event
+
+    def _send(self, events):
+        start = time.perf_counter()
+        try:
+            pa.failSafeCheck()  # pyautogui 를 거치지 않으므로 비상 정지를 직접 확인
+            array = (self._INPUT * len(events))(*events)
+            sent = self._user32.SendInput(
+                len(events), array, self._ctypes.sizeof(self._INPUT)
+            )
+            if sent != len(events):
+                logger.warning("SendInput: %d/%d개만 전송됨", sent, len(events))
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def _click_events(self, point):
+        events = []
+        if self._at(point):
+            self.skipped_moves += 1
+        else:
+            events.append(self._event(0, point))
+        events.append(self._event(self.MOUSEEVENTF_LEFTDOWN))
+        events.append(self._event(self.MOUSEEVENTF_LEFTUP))
+        return events
+
+    def click(self, point):
+        self._send(self._click_events(point))
+
+    def click_and_park(self, point, park):
+        self._send(self._click_events(point) + [self._event(0, park)])
+
+
+def create_input(fast=True):
+    """플랫폼에 맞는 입력 계층을 생성합니다."""
+    if fast and sys.platform == "win32":
+        try:
+            return SendInputInput()
+        except Exception as e:
+            logger.warning(f"SendInput 을 사용할 수 없어 pyautogui 로 입력 - {e}")
+    return PyAutoGuiInput(fast=fast)
@@ -0,0 +1,194 @@
+"""중단되어도 진행 상황이 남는 실행 기록(저널)과 원자적 파일 쓰기.
+
+실행 기록은 한 줄에 JSON 레코드 하나인 추가 전용 파일입니다.
+삭제할 때마다 쓰지 않고 JOURNAL_FLUSH_INTERVAL 마다 진행 상황 한 줄을 덧붙이므로
+삭제 한 번당 비용은 시간 비교 한 번뿐입니다. 강제 종료로 마지막 줄이 잘려도
+읽을 때 건너뛰므로, 다시 시작하면 직전 기록까지의 누적 처리량을 이어서 보여 줍니다.
+
+레코드 종류:
+    start     실행 시작 (run, session, backend)
+    progress  진행 상황 (deleted, failures, skipped, elapsed, rate, page)
+    end       실행 종료 (reason)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+JOURNAL_FILE_NAME = "run_journal.jsonl"
+JOURNAL_FLUSH_INTERVAL = 2.0  # 진행 상황을 파일에 덧붙이는 간격 (초)
+JOURNAL_COMPACT_BYTES = 1_000_000  # 파일이 이보다 크면 열 때 실행별 마지막 상태만 남김
+
+
+def atomic_write_text(path, text, encoding="utf-8"):
+    """임시 파일에 쓴 뒤 교체해, 쓰는 도중 종료되어도 기존 파일이 깨지지 않게 합니다."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class RunJournal:
+    """세션별 삭제 진행 상황을 추가 전용 파일에 모아 두고 누적 처리량을 계산합니다."""
+
+    def __init__(self, path=JOURNAL_FILE_NAME, flush_interval=JOURNAL_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()  # 여러 세션이 한 파일에 씀
+        self._last_flush = {}  # run id → 마지막으로 덧붙인 시각
+        self._runs = {}  # run id → 실행별 마지막 상태 (읽은 기록 + 이번 실행)
+        self._load()
+
+    # --- 읽기 ---
+    def _read_records(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # 강제 종료로 잘린 마지막 줄 등은 건너뜀
+                logger.debug("실행 기록의 깨진 줄 무시: %r", line[:80])
+        return records
+
+    def _load(self):
+        for record in self._read_records():
+            run = self._runs.setdefault(
+                record.get("run"), {"session": record.get("session"), "last": None}
+            )
+            if record.get("type") == "progress":
+                run["last"] = record
+            elif record.get("type") == "end":
+                run["end"] = record
+            elif record.get("type") == "start":
+                run["start"] = record
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size > JOURNAL_COMPACT_BYTES:
+            self._compact()
+
+    def _compact(self):
+        """실행마다 시작, 마지막 진행 상황, 종료 레코드만 남기고 다시 씁니다."""
+        lines = []
+        for run in self._runs.values():
+            for key in ("start", "last", "end"):
+                if run.get(key) is not None:
+                    lines.append(json.dumps(run[key], ensure_ascii=False) + "\n")
+        with self._lock:
+            atomic_write_text(self.path, "".join(lines))
+        logger.info(f"실행 기록 정리: 실행 {len(self._runs)}개")
+
+    def totals(self, session_name):
+        """이전 실행들의 누적 삭제 수와 시간, 마지막 페이지 상태를 반환합니다."""
+        deleted = 0
+        elapsed = 0.0
+        runs = 0
+        page = None
+        for run in self._runs.values():
+            last = run.get("last")
+            if run.get("session") != session_name or last is None:
+                continue
+            runs += 1
+            deleted += last["deleted"]
+            elapsed += last["elapsed"]
+            page = last.get("page")
+        return {"deleted": deleted, "elapsed": elapsed, "runs": runs, "page": page}
+
+    # --- 쓰기 ---
+    def _append(self, records):
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with self._lock:
+            # O_APPEND 로 한 번에 써서 여러 세션의 줄이 섞이지 않게 함
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _progress_record(self, run_id, session):
+        driver = session.driver
+        return {
+            "type": "progress",
+            "run": run_id,
+            "session": session.name,
+            "t": round(time.time(), 3),
+            "deleted": session.delete_count,
+            "failures": driver.failures,
+            "skipped": driver.skipped_rows,
+            "elapsed": round(session.elapsed(), 3),
+            "rate": round(session.rate(), 3),
+            "page": driver.page_state(),
+        }
+
+    def begin(self, session):
+        """실행 시작을 기록하고 run id 를 반환합니다."""
+        run_id = uuid.uuid4().hex[:12]
+        record = {
+            "type": "start",
+            "run": run_id,
+            "session": session.name,
+            "backend": session.driver.name,
+            "t": round(time.time(), 3),
+        }
+        try:
+            self._append([record])
+        except OSError as e:
+            logger.error(f"실행 기록 저장 실패 - {e}")
+        self._last_flush[run_id] = time.monotonic()
+        return run_id
+
+    def maybe_flush(self, run_id, session):
+        """마지막 기록 후 flush_interval 이 지났으면 진행 상황을 덧붙입니다."""
+        now = time.monotonic()
+        if now - self._last_flush.get(run_id, 0.0) < self.flush_interval:
+            return
+        self._last_flush[run_id] = now
+        try:
+            self._append([self._progress_record(run_id, session)])
+        except OSError as e:
+            logger.error(f"실행 기록 저장 실패 - {e}")
+
+    def end(self, run_id, session, reason=None):
+        """마지막 진행 상황과 종료 사유를 기록합니다."""
+        self._last_flush.pop(run_id, None)
+        progress = self._progress_record(run_id, session)
+        end = {"type": "end", "run": run_id, "session": session.name, "reason": reason}
+        try:
+            self._append([progress, end])
+        except OSError as e:
+            logger.error(f"실행 기록 저장 실패 - {e}")
+            return
+        self._runs[run_id] = {"session": session.name, "last": progress, "end": end}
+
+    def reset(self):
+        """누적 기록을 지우고 처음부터 다시 셉니다."""
+        with self._lock:
+            atomic_write_text(self.path, "")
+        self._runs.clear()
+        logger.info("실행 기록 초기화")
@@ -0,0 +1,231 @@
+"""기준 이미지(템플릿) 매칭으로 메뉴 버튼("⋮")과 삭제 메뉴 항목의 위치를 찾는 모듈.
+
+F8/F9 로 위치를 설정할 때 마우스 주변을 잘라 템플릿으로 저장하고,
+삭제 중에는 마지막으로 찾은 위치 주변의 좁은 범위만 검색합니다.
+찾지 못했을 때만 최근 위치 캐시와 넓은 범위로 검색을 확장합니다.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+
+from startup import lazy_import
+
+# 위치를 처음 찾거나 기준 이미지를 저장할 때 가져옴
+np = lazy_import("numpy")
+pa = lazy_import("pyautogui")
+Image = lazy_import("PIL.Image")
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+TEMPLATE_DIR = "templates"
+MENU_BUTTON_TEMPLATE = "menu_button.png"
+REMOVE_ITEM_TEMPLATE = "remove_item.png"
+# 템플릿으로 잘라낼 크기 (절반 너비, 절반 높이)
+MENU_BUTTON_HALF_SIZE = (12, 12)
+REMOVE_ITEM_HALF_SIZE = (60, 12)
+MATCH_SCALE = 2  # 검색 전 1/2 로 축소
+MATCH_THRESHOLD = 0.8  # 정규화 상관계수가 이 값 이상이면 일치
+SEARCH_BAND = (80, 60)  # 마지막 위치 기준 검색 범위 (절반 너비, 절반 높이)
+WIDEN_FACTORS = (1, 4)  # 실패 시 검색 범위 확장 배수
+RECENT_HITS = 4  # 최근 일치 위치 캐시 크기
+BATCH_MAX_HITS = 20  # 한 번의 스냅샷에서 찾을 최대 행 수
+
+
+def capture_gray(left, top, width, height) -> "np.ndarray":
+    """화면 영역을 캡처해 축소된 흑백 float32 배열로 반환합니다."""
+    image = pa.screenshot(region=(left, top, width, height))
+    return to_gray(image)
+
+
+def to_gray(image) -> "np.ndarray":
+    """PIL 이미지를 매칭용 축소 흑백 배열로 변환합니다."""
+    return np.asarray(image.convert("L").reduce(MATCH_SCALE), dtype=np.float32)
+
+
+def match_template(image: "np.ndarray", template: "np.ndarray") -> "np.ndarray":
+    """정규화 상호상관(NCC) 맵을 계산합니다.
+
+    FFT 로 상관을, 적분 영상으로 창별 분산을 구해 모든 위치를 한 번에 계산합니다.
+    결과 맵의 (y, x) 는 템플릿 왼쪽 위 모서리가 image[y, x] 에 놓였을 때의 점수입니다.
+    """
+    h, w = template.shape
+    H, W = image.shape
+    if H < h or W < w:
+        return np.zeros((0, 0), dtype=np.float32)
+    t = template - template.mean()
+    t_norm = np.sqrt(np.sum(t * t))
+    if t_norm == 0:
+        return np.zeros((H - h + 1, W - w + 1), dtype=np.float32)
+
+    shape = (H + h - 1, W + w - 1)
+    spectrum = np.fft.rfft2(image, shape) * np.fft.rfft2(t[::-1, ::-1], shape)
+    corr = np.fft.irfft2(spectrum, shape)[h - 1 : H, w - 1 : W]
+
+    integral = np.pad(image.cumsum(0).cumsum(1), ((1, 0), (1, 0)))
+    integral_sq = np.pad((image * image).cumsum(0).cumsum(1), ((1, 0), (1, 0)))
+
+    def window_sum(table):
+        return table[h:, w:] - table[:-h, w:] - table[h:, :-w] + table[:-h, :-w]
+
+    n = h * w
+    s1 = window_sum(integral)
+    variance = np.maximum(window_sum(integral_sq) - s1 * s1 / n, 0)
+    denom = np.sqrt(variance) * t_norm
+    return np.where(denom > 1e-6, corr / np.maximum(denom, 1e-6), 0).astype(
+        np.float32
+    )
+
+
+class TemplateLocator:
+    """템플릿 하나의 화면 위치를 찾고 최근 위치를 캐시합니다."""
+
+    def __init__(self, name, template_image, threshold=MATCH_THRESHOLD, scale=1.0):
+        self.name = name
+        if scale != 1.0:
+            # 다른 배율의 모니터에서 저장한 기준 이미지는 현재 배율에 맞게 늘리거나 줄임
+            template_image = template_image.resize(
+                (
+                    max(MATCH_SCALE, round(template_image.width * scale)),
+                    max(MATCH_SCALE, round(template_image.height * scale)),
+                ),
+                Image.LANCZOS,
+            )
+        self.template = to_gray(template_image)
+        self.threshold = threshold
+        # 템플릿 중심까지의 거리 (원본 픽셀)
+        self.half_w = template_image.width // 2
+        self.half_h = template_image.height // 2
+        self.last_hit = None
+        self.recent = deque(maxlen=RECENT_HITS)
+        self.last_locate_ms = 0.0
+
+    @classmethod
+    def load(cls, filename, template_dir=TEMPLATE_DIR, scale=1.0):
+        """저장된 템플릿 파일로부터 생성합니다. 파일이 없으면 None."""
+        path = os.path.join(template_dir, filename)
+        if not os.path.exists(path):
+            return None
+        with Image.open(path) as image:
+            return cls(filename, image.copy(), scale=scale)
+
+    def copy(self):
+        """같은 템플릿으로 위치 캐시만 따로 쓰는 탐색기 (다른 스레드용)."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.recent = deque(self.recent, maxlen=RECENT_HITS)
+        return clone
+
+    def _search(self, center, half_w, half_h):
+        """center 주변 영역에서 가장 잘 맞는 위치를 찾습니다."""
+        left = max(0, center.x - half_w - self.half_w)
+        top = max(0, center.y - half_h - self.half_h)
+        width = (half_w + self.half_w) * 2
+        height = (half_h + self.half_h) * 2
+        scores = match_template(capture_gray(left, top, width, height), self.template)
+        if scores.size == 0:
+            return None
+        y, x = np.unravel_index(np.argmax(scores), scores.shape)
+        if scores[y, x] < self.threshold:
+            return None
+        return pa.Point(
+            left + int(x) * MATCH_SCALE + self.half_w,
+            top + int(y) * MATCH_SCALE + self.half_h,
+        )
+
+    def forget(self):
+        """마지막 위치와 최근 위치 캐시를 비웁니다 (화면 배치가 바뀌었을 때)."""
+        self.last_hit = None
+        self.recent.clear()
+
+    def _remember(self, hit):
+        self.last_hit = hit
+        if hit in self.recent:
+            self.recent.remove(hit)
+        self.recent.appendleft(hit)
+
+    def locate(self, expected, prefer_expected=False):
+        """템플릿 위치를 찾습니다. 찾지 못하면 None.
+
+        마지막 위치 → 최근 위치 캐시 → 예상 위치 순으로 좁은 범위를 먼저 찾고,
+        모두 실패했을 때만 범위를 넓혀 다시 찾습니다. prefer_expected 면 예상 위치를 먼저 찾습니다
+        (예상 위치가 마지막 위치보다 정확할 때, 예: 메뉴 레이아웃별 클릭 계획).
+        """
+        start = time.perf_counter()
+        points = (
+            (expected, self.last_hit, *self.recent)
+            if prefer_expected
+            else (self.last_hit, *self.recent, expected)
+        )
+        centers = []
+        for point in points:
+            if point is not None and point not in centers:
+                centers.append(point)
+        hit = None
+        for factor in WIDEN_FACTORS:
+            for center in centers:
+                hit = self._search(center, SEARCH_BAND[0] * factor, SEARCH_BAND[1] * factor)
+                if hit is not None:
+                    break
+            if hit is not None:
+                break
+        self.last_locate_ms = (time.perf_counter() - start) * 1000
+        if hit is None:
+            logger.debug(
+                "%s 위치를 찾지 못함 (예상: %s, %.1fms)",
+                self.name,
+                expected,
+                self.last_locate_ms,
+            )
+            return None
+        self._remember(hit)
+        logger.debug("%s 위치: %s (%.1fms)", self.name, hit, self.last_locate_ms)
+        return hit
+
+    def find_all(self, snapshot, origin, max_hits=BATCH_MAX_HITS):
+        """스냅샷 한 장에서 일치하는 모든 위치를 찾아 위에서 아래 순으로 반환합니다.
+
+        상관 맵은 한 번에 계산하고, 찾은 위치 주변은 템플릿 크기만큼 지워
+        같은 버튼이 중복으로 잡히지 않게 합니다.
+
+        Args:
+            snapshot: 화면 일부를 캡처한 PIL 이미지.
+            origin: 스냅샷 왼쪽 위 모서리의 화면 좌표 (x, y).
+        """
+        start = time.perf_counter()
+        scores = match_template(to_gray(snapshot), self.template)
+        th, tw = self.template.shape
+        hits = []
+        while scores.size and len(hits) < max_hits:
+            y, x = np.unravel_index(np.argmax(scores), scores.shape)
+            if scores[y, x] < self.threshold:
+                break
+            hits.append(
+                pa.Point(
+                    origin[0] + int(x) * MATCH_SCALE + self.half_w,
+                    origin[1] + int(y) * MATCH_SCALE + self.half_h,
+                )
+            )
+            scores[max(0, y - th) : y + th + 1, max(0, x - tw) : x + tw + 1] = -1
+        self.last_locate_ms = (time.perf_counter() - start) * 1000
+        if hits:
+            self._remember(hits[0])
+        logger.debug(
+            "%s %d개 발견 (%.1fms)", self.name, len(hits), self.last_locate_ms
+        )
+        return sorted(hits, key=lambda point: point.y)
+
+
+def save_reference_crop(point, half_size, filename, template_dir=TEMPLATE_DIR):
+    """마우스 위치 주변을 잘라 템플릿 파일로 저장합니다."""
+    half_w, half_h = half_size
+    left = max(0, point.x - half_w)
+    top = max(0, point.y - half_h)
+    image = pa.screenshot(region=(left, top, half_w * 2, half_h * 2))
+    os.makedirs(template_dir, exist_ok=True)
+    path = os.path.join(template_dir, filename)
+    image.save(path)
+    logger.info(f"기준 이미지 저장: {path}")
+    return path
@@ -0,0 +1,115 @@
+"""로깅 설정: 콘솔 출력은 백그라운드 스레드에서 처리하고, 반복되는 디버그 로그는 요약합니다.
+
+삭제 루프(워커 스레드)는 로그 레코드를 큐에 넣기만 하고, 메시지 포맷과 콘솔 I/O 는
+QueueListener 스레드가 맡습니다. 같은 위치에서 반복되는 DEBUG 로그는 구간마다
+첫 번째 것만 내보내고 나머지는 "N회 반복" 요약 한 줄로 합칩니다.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+# --- Constants ---
+LOG_FORMAT = (
+    "%(asctime)s - %(levelname)s - [%(module)s:%(funcName)s:%(lineno)d] - %(message)s"
+)
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+DEFAULT_LOG_LEVEL = "DEBUG"
+SUMMARY_INTERVAL = 5.0  # 같은 DEBUG 로그를 요약하는 구간 (초)
+
+_listener = None
+
+
+class SummarizingQueueHandler(QueueHandler):
+    """레코드를 포맷하지 않은 채 큐에 넣고, 반복되는 DEBUG 로그를 요약합니다."""
+
+    def __init__(self, log_queue, interval=SUMMARY_INTERVAL):
+        super().__init__(log_queue)
+        self.interval = interval
+        # (로거 이름, 메시지 템플릿) → [구간 시작 시각, 생략한 횟수, 마지막 레코드]
+        self._windows = {}
+        self._windows_lock = threading.Lock()
+
+    def prepare(self, record):
+        # 기본 구현은 여기(호출 스레드)서 메시지를 포맷하므로, 포맷은 리스너에 맡김
+        return record
+
+    def emit(self, record):
+        if record.levelno > logging.DEBUG:
+            self.enqueue(record)
+            return
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._windows_lock:
+            window = self._windows.get(key)
+            if window is not None and now - window[0] < self.interval:
+                window[1] += 1
+                window[2] = record
+                return
+            self._windows[key] = [now, 0, record]
+        if window is not None and window[1]:
+            self.enqueue(self._summary_record(window, now))
+        self.enqueue(record)
+
+    def _summary_record(self, window, now):
+        started, suppressed, last = window
+        summary = logging.makeLogRecord(last.__dict__)
+        summary.msg = f"(최근 {now - started:.0f}초간 같은 로그 {suppressed}회 생략, 마지막: %s)"
+        summary.args = (last.getMessage(),)
+        summary.exc_info = summary.exc_text = None
+        return summary
+
+    def flush_summaries(self):
+        """아직 내보내지 않은 요약을 모두 큐에 넣습니다 (종료 시 호출)."""
+        now = time.monotonic()
+        with self._windows_lock:
+            windows = [window for window in self._windows.values() if window[1]]
+            self._windows.clear()
+        for window in windows:
+            self.enqueue(self._summary_record(window, now))
+
+
+def configure_logging(level=DEFAULT_LOG_LEVEL, async_mode=True):
+    """루트 로거를 설정합니다.
+
+    Args:
+        level: 로그 레벨 이름 (LOG_LEVELS 중 하나).
+        async_mode: True 면 콘솔 출력을 백그라운드 스레드에서 처리합니다.
+    """
+    global _listener
+    shutdown_logging()
+    root = logging.getLogger()
+    root.setLevel(level)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+    if not async_mode:
+        root.handlers[:] = [stream_handler]
+        return
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = SummarizingQueueHandler(log_queue)
+    root.handlers[:] = [queue_handler]
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def set_log_level(level):
+    """실행 중에 로그 레벨을 바꿉니다."""
+    logging.getLogger().setLevel(level)
+
+
+def shutdown_logging():
+    """남은 요약과 큐의 로그를 모두 출력하고 리스너를 멈춥니다."""
+    global _listener
+    if _listener is None:
+        return
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, SummarizingQueueHandler):
+            handler.flush_summaries()
+    _listener.stop()
+    _listener = None
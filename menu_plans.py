@@ -0,0 +1,346 @@
+"""열린 메뉴의 모양(레이아웃)별로 삭제 항목을 누를 위치(클릭 계획)를 배우는 모듈.
+
+클릭2 위치를 "메뉴 버튼 + 고정 간격" 하나로만 정하면, 화면 아래쪽에서 위로 열리는 메뉴나
+항목 수가 다른 메뉴(Shorts, 실시간, 게시물 등)에서 엉뚱한 곳을 누르게 됩니다.
+여기서는 클릭1 전후 화면의 차이로 열린 메뉴의 범위를 구해 레이아웃 서명
+("down 10" 처럼 열린 방향과 높이)을 만들고, 서명마다 삭제 항목의 위치를
+오프셋(가로는 메뉴 버튼 기준, 세로는 메뉴 위쪽 끝 기준)으로 기억합니다.
+메뉴는 가로로는 버튼에 맞춰 열리므로 가로 오프셋은 열린 방향과 상관없이 같습니다.
+
+- 처음 보는 레이아웃은 높이가 같은 다른 레이아웃의 오프셋(같은 메뉴가 반대 방향으로 열린 경우),
+  다른 레이아웃의 오프셋을 위쪽 끝과 아래쪽 끝 기준으로 옮긴 것(항목 수가 다른 메뉴),
+  설정한 간격 순서로 후보를 만듭니다.
+- 위치 자동 탐색으로 삭제 항목을 찾으면 그 위치를 해당 레이아웃의 계획으로 바로 배웁니다.
+- 같은 후보로 MAX_PLAN_FAILURES 번 연속 실패하면 다음 후보로 바꿉니다.
+
+배운 계획은 모니터 구성별 기준 이미지 폴더의 click_plans.json 에 저장해 다음 실행에서 이어 씁니다.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, namedtuple
+
+from journal import atomic_write_text
+from startup import lazy_import
+
+# 메뉴를 분류할 때 가져옴 (F9 에서 계획만 지울 때는 필요 없음)
+np = lazy_import("numpy")
+screen_watch = lazy_import("screen_watch")
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+PLANS_FILE_NAME = "click_plans.json"
+# 메뉴가 열릴 수 있는 범위: 메뉴 버튼 중심 기준 (절반 너비, 절반 높이)
+MENU_AREA_HALF_SIZE = (320, 360)
+# 메뉴 버튼 자체의 변화(누를 때 생기는 원형 배경)는 메뉴로 보지 않음 (절반 너비, 절반 높이)
+BUTTON_MASK_HALF_SIZE = (20, 20)
+MIN_CHANGED_CELLS = 2  # 축소 프레임의 한 줄에서 이만큼 바뀌어야 메뉴의 일부로 봄
+# 버튼과 메뉴 사이, 메뉴 항목 글자 사이의 빈 줄은 이 높이(픽셀)까지 같은 메뉴로 이어 봄
+MAX_ROW_GAP = 24
+SIGNATURE_STEP = 16  # 메뉴 높이를 이 픽셀 단위로 묶어 같은 레이아웃으로 봄
+MAX_PLAN_FAILURES = 2  # 한 후보로 이만큼 연속 실패하면 다음 후보로 바꿈
+PLAN_CACHE_SIZE = 32  # 기억할 레이아웃 수 (오래 쓰지 않은 것부터 버림)
+
+# 열린 메뉴의 레이아웃 서명과 화면 좌표 범위 (right, bottom 은 포함하지 않음)
+MenuLayout = namedtuple("MenuLayout", "signature left top right bottom")
+
+
+def menu_area(button):
+    """메뉴 버튼을 눌렀을 때 메뉴가 열릴 수 있는 영역."""
+    return screen_watch.ScreenRegion.around(button, *MENU_AREA_HALF_SIZE)
+
+
+def _run_from(rows, start, step, limit):
+    """start 부터 step 방향으로, 빈 줄을 max_gap 까지 건너뛰며 이어지는 바뀐 줄의 (처음, 끝)."""
+    max_gap = MAX_ROW_GAP // screen_watch.DOWNSCALE_FACTOR
+    first = last = None
+    gap = 0
+    index = start
+    while 0 <= index < limit:
+        if rows[index]:
+            if first is None:
+                first = index
+            last = index
+            gap = 0
+        else:
+            gap += 1
+            if gap > max_gap:
+                break
+        index += step
+    return first, last
+
+
+def classify_menu(before, after, region, button):
+    """클릭1 전후 프레임의 차이로 열린 메뉴의 범위와 레이아웃 서명을 구합니다.
+
+    메뉴 버튼 높이에서 위나 아래로 이어지는 바뀐 줄만 메뉴로 보므로, 멀리 떨어진 곳의
+    변화(다른 행이 지워지며 당겨지는 것 등)는 대부분 섞이지 않습니다. 서명은 열린 방향과 높이입니다.
+
+    Args:
+        before, after: region 을 캡처한 축소 프레임 (screen_watch.ScreenRegion.capture).
+        region: 두 프레임을 캡처한 영역.
+        button: 누른 메뉴 버튼의 화면 좌표.
+
+    Returns:
+        MenuLayout. 버튼 주변에 바뀐 곳이 없으면 None.
+    """
+    if before.shape != after.shape:
+        return None
+    scale = screen_watch.DOWNSCALE_FACTOR
+    changed = np.abs(after - before) >= screen_watch.PIXEL_DIFF_THRESHOLD
+    # 버튼 주변의 변화는 메뉴가 아님
+    mask_left = (button.x - BUTTON_MASK_HALF_SIZE[0] - region.left) // scale
+    mask_right = (button.x + BUTTON_MASK_HALF_SIZE[0] - region.left) // scale + 1
+    mask_top = (button.y - BUTTON_MASK_HALF_SIZE[1] - region.top) // scale
+    mask_bottom = (button.y + BUTTON_MASK_HALF_SIZE[1] - region.top) // scale + 1
+    changed[max(0, mask_top) : max(0, mask_bottom), max(0, mask_left) : max(0, mask_right)] = False
+    rows = changed.sum(axis=1) >= MIN_CHANGED_CELLS
+    center = (button.y - region.top) // scale
+    below = _run_from(rows, center, 1, len(rows))
+    above = _run_from(rows, center - 1, -1, len(rows))
+    below_size = 0 if below[0] is None else below[1] - below[0] + 1
+    above_size = 0 if above[0] is None else above[0] - above[1] + 1
+    if not (below_size or above_size):
+        return None
+    if below_size >= above_size:
+        vertical, first, last = "down", below[0], below[1]
+    else:
+        vertical, first, last = "up", above[1], above[0]
+    cols = np.flatnonzero(changed[first : last + 1].sum(axis=0) >= MIN_CHANGED_CELLS)
+    if not cols.size:
+        return None
+    left = region.left + int(cols[0]) * scale
+    right = region.left + (int(cols[-1]) + 1) * scale
+    top = region.top + first * scale
+    bottom = region.top + (last + 1) * scale
+    signature = f"{vertical} {round((bottom - top) / SIGNATURE_STEP)}"
+    return MenuLayout(signature, left, top, right, bottom)
+
+
+def wait_for_menu(region, before, button, timeout, settle, should_continue=lambda: True):
+    """메뉴 버튼에 붙은 메뉴가 나타나 모양이 안정될 때까지 기다립니다.
+
+    영역 전체의 변화가 아니라 classify_menu 의 결과로 판단하므로, 버튼에서 떨어진 곳의
+    변화(지워진 행이 당겨지는 것 등)로 메뉴가 열렸다고 잘못 보거나 안정을 기다리지 않습니다.
+
+    Args:
+        timeout: 메뉴가 나타나기를 기다리는 최대 시간 (초).
+        settle: 메뉴가 나타난 뒤 모양이 안정되기를 기다리는 최대 시간 (초).
+
+    Returns:
+        (MenuLayout, 나타날 때까지 걸린 시간(초)). 나타나지 않았거나 중단되면 (None, None).
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    layout = latency = None
+    same_count = 0
+    while should_continue():
+        current = classify_menu(before, region.capture(), region, button)
+        now = time.perf_counter()
+        if current is not None:
+            if latency is None:
+                latency = now - start
+                deadline = now + settle
+            if current == layout:
+                same_count += 1
+                if same_count >= screen_watch.STABLE_FRAMES:
+                    return current, latency
+            else:
+                same_count = 0
+            layout = current
+        if now >= deadline:
+            # 안정되지 않았어도 마지막으로 본 모양을 씀
+            return (layout, latency) if layout is not None else (None, None)
+        time.sleep(screen_watch.POLL_INTERVAL)
+    return None, None
+
+
+def clear_plans(template_dir):
+    """template_dir 에 저장된 클릭 계획을 지웁니다 (F9 로 간격을 다시 설정했을 때)."""
+    path = os.path.join(template_dir, PLANS_FILE_NAME)
+    try:
+        os.remove(path)
+        logger.info(f"클릭 계획 초기화: {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"클릭 계획 초기화 실패 - {e}")
+
+
+def _height_of(signature):
+    return signature.split(" ", 1)[-1]
+
+
+class ClickPlan:
+    """레이아웃 하나에서 삭제 항목을 누를 후보 오프셋 (버튼 기준 x, 메뉴 위쪽 끝 기준 y)과 결과."""
+
+    def __init__(self, candidates, height, successes=0):
+        self.candidates = [tuple(offset) for offset in candidates]  # 첫 번째가 현재 계획
+        self.height = height  # 메뉴 높이 (픽셀)
+        self.successes = successes
+        self.failures = 0  # 현재 후보의 연속 실패 수
+
+    @property
+    def offset(self):
+        return self.candidates[0]
+
+    def learn(self, offset):
+        """실제로 찾은 위치를 현재 계획으로 삼습니다."""
+        offset = tuple(offset)
+        if offset != self.offset:
+            if offset in self.candidates:
+                self.candidates.remove(offset)
+            self.candidates.insert(0, offset)
+            self.failures = 0
+
+    def report(self, success):
+        """결과를 기록합니다. 연속 실패로 다음 후보로 바꿨으면 True."""
+        if success:
+            self.successes += 1
+            self.failures = 0
+            return False
+        self.failures += 1
+        if self.failures < MAX_PLAN_FAILURES or len(self.candidates) < 2:
+            return False
+        self.candidates.append(self.candidates.pop(0))
+        self.failures = 0
+        return True
+
+
+class ClickPlanner:
+    """레이아웃 서명별 클릭 계획을 고르고 결과로 고쳐 나갑니다."""
+
+    def __init__(self, gap, plans=None, path=None, cache_size=PLAN_CACHE_SIZE):
+        self.gap = tuple(gap)  # F8/F9 로 설정한 간격 (후보가 없을 때 사용)
+        self.path = path  # 계획을 저장할 파일 (None 이면 저장하지 않음)
+        self.cache_size = cache_size
+        self._plans = OrderedDict(plans or ())
+        self.last_layout = None
+
+    @classmethod
+    def load(cls, path, gap):
+        """저장된 계획을 읽습니다. 파일이 없거나 깨졌으면 빈 계획으로 시작합니다."""
+        plans = OrderedDict()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for signature, data in json.load(f).items():
+                    plans[signature] = ClickPlan(
+                        data["candidates"], data["height"], data.get("successes", 0)
+                    )
+            logger.info(f"클릭 계획 {len(plans)}개 로드 from {path}")
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"클릭 계획 파일 분석 오류: {e}. 새로 배움")
+            plans.clear()
+        return cls(gap, plans, path)
+
+    def save(self):
+        if self.path is None or not self._plans:
+            return
+        data = {
+            signature: {
+                "candidates": plan.candidates,
+                "height": plan.height,
+                "successes": plan.successes,
+            }
+            for signature, plan in self._plans.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            atomic_write_text(self.path, json.dumps(data, indent=4, ensure_ascii=False))
+        except OSError as e:
+            logger.error(f"클릭 계획 저장 실패 - {e}")
+
+    def __len__(self):
+        return len(self._plans)
+
+    def _plan_for(self, button, layout):
+        plan = self._plans.get(layout.signature)
+        if plan is not None:
+            self._plans.move_to_end(layout.signature)
+            return plan
+        plan = ClickPlan(self._candidates(button, layout), layout.bottom - layout.top)
+        logger.info(
+            "새 메뉴 레이아웃 %s - 후보 %d개, 첫 후보 %s",
+            layout.signature,
+            len(plan.candidates),
+            plan.offset,
+        )
+        self._plans[layout.signature] = plan
+        if len(self._plans) > self.cache_size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def _candidates(self, button, layout):
+        """처음 보는 레이아웃의 후보 오프셋: 높이가 같은 레이아웃 → 다른 레이아웃 → 설정한 간격."""
+        height = _height_of(layout.signature)
+        known = sorted(
+            self._plans.items(),
+            key=lambda item: (_height_of(item[0]) != height, -item[1].successes),
+        )
+        offsets = []
+        for signature, plan in known:
+            dx, dy = plan.offset
+            offsets.append((dx, dy))  # 위쪽 끝에서 같은 거리
+            if _height_of(signature) != height:
+                # 아래쪽 끝에서 같은 거리 (삭제 항목 위에 항목이 더 있거나 적은 메뉴)
+                offsets.append((dx, layout.bottom - layout.top - (plan.height - dy)))
+        offsets.append(
+            self._offset(button, layout, button.x + self.gap[0], button.y + self.gap[1])
+        )
+        candidates = []
+        for offset in offsets:
+            if offset not in candidates and self._inside(button, layout, offset):
+                candidates.append(offset)
+        if not candidates:
+            # 어떤 후보도 메뉴 안에 들지 않으면 간격을 메뉴 안으로 당겨서 사용
+            dx, dy = offsets[-1]
+            candidates.append(
+                (
+                    min(max(dx, layout.left - button.x), layout.right - 1 - button.x),
+                    min(max(dy, 0), layout.bottom - 1 - layout.top),
+                )
+            )
+        return candidates
+
+    @staticmethod
+    def _offset(button, layout, x, y):
+        return x - button.x, y - layout.top
+
+    @staticmethod
+    def _inside(button, layout, offset):
+        x, y = button.x + offset[0], layout.top + offset[1]
+        return layout.left <= x < layout.right and layout.top <= y < layout.bottom
+
+    def target(self, button, layout):
+        """삭제 항목을 누를 화면 좌표 (x, y). layout 이 None 이면 설정한 간격을 사용합니다."""
+        self.last_layout = layout
+        if layout is None:
+            return button.x + self.gap[0], button.y + self.gap[1]
+        dx, dy = self._plan_for(button, layout).offset
+        return button.x + dx, layout.top + dy
+
+    def learn(self, button, layout, point):
+        """위치 자동 탐색으로 찾은 삭제 항목 위치를 layout 의 계획으로 배웁니다."""
+        if layout is None:
+            return
+        plan = self._plans.get(layout.signature)
+        if plan is not None:
+            plan.learn(self._offset(button, layout, point.x, point.y))
+
+    def report(self, layout, success):
+        """클릭2 결과(행이 사라졌는지)를 layout 의 계획에 반영합니다."""
+        if layout is None:
+            return
+        plan = self._plans.get(layout.signature)
+        if plan is not None and plan.report(success):
+            logger.info("메뉴 레이아웃 %s - 다음 후보로 바꿈: %s", layout.signature, plan.offset)
+
+    def describe(self):
+        layout = self.last_layout
+        current = layout.signature if layout is not None else "알 수 없음"
+        return f"메뉴 레이아웃 {len(self._plans)}개 (현재 {current})"
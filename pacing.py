@@ -0,0 +1,176 @@
+"""삭제 루프의 대기 시간을 실제 페이지 반응 속도에 맞춰 조절하는 페이싱 엔진."""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# --- Pacing Defaults (밀리초) ---
+DEFAULT_PACING_SETTINGS = {
+    "adaptive_pacing": True,
+    "event_driven_waits": True,  # 화면 변화 감지로 대기 (False 면 타이머)
+    "menu_wait_ms": 300,
+    "menu_wait_min_ms": 50,
+    "menu_wait_max_ms": 1500,
+    "row_wait_ms": 1000,
+    "row_wait_min_ms": 50,
+    "row_wait_max_ms": 3000,
+}
+
+# on_failure 에 넘기는 실패한 단계
+STEP_MENU = "menu"  # 클릭1 후 메뉴가 열리지 않았거나 삭제 항목이 없음
+STEP_ROW = "row"  # 클릭2 후 행이 사라지지 않았거나 다음 행이 나오지 않음
+
+# 측정값 평활 계수 (TCP RTO 계산과 같은 방식)
+LATENCY_ALPHA = 0.125
+LATENCY_BETA = 0.25
+LATENCY_DEV_MULTIPLIER = 4
+# 성공 시 대기 시간을 줄이는 비율, 실패 시 늘리는 비율
+RELAX_FACTOR = 0.9
+BACKOFF_FACTOR = 2.0
+# 실패가 발생했던 대기 시간보다 이만큼 여유를 두고 다시 줄여 나감
+LEARNED_FLOOR_MARGIN = 1.2
+# 실패 없이 이만큼 연속으로 성공하면 학습된 하한을 이 비율로 낮춤 (가끔 난 실패가 쌓이지 않게)
+FLOOR_DECAY_SUCCESSES = 50
+FLOOR_DECAY_FACTOR = 0.8
+
+
+class StepPacer:
+    """단일 단계(메뉴 열림 또는 행 삭제)의 대기 시간을 학습합니다.
+
+    측정된 지연 시간이 있으면 평균과 편차로 대기 시간을 정하고,
+    측정값이 없으면 성공할 때마다 조금씩 줄이고 실패하면 크게 늘립니다.
+    """
+
+    def __init__(self, name, initial_ms, min_ms, max_ms):
+        self.name = name
+        self.min_s = max(0, min_ms) / 1000
+        self.max_s = max(self.min_s, max_ms / 1000)
+        self.initial_s = self._clamp(initial_ms / 1000)
+        self.wait_s = self.initial_s
+        self.learned_floor_s = self.min_s
+        self.successes = 0  # 마지막 실패(또는 하한을 낮춘 때) 이후 연속 성공 수
+        self.latency_avg = None
+        self.latency_dev = 0.0
+
+    def _clamp(self, seconds):
+        return min(self.max_s, max(self.min_s, seconds))
+
+    def current(self) -> float:
+        """현재 대기 시간(초)을 반환합니다."""
+        return self.wait_s
+
+    def observe(self, latency_s):
+        """실제로 측정된 지연 시간을 반영합니다."""
+        if self.latency_avg is None:
+            self.latency_avg = latency_s
+            self.latency_dev = latency_s / 2
+        else:
+            error = latency_s - self.latency_avg
+            self.latency_avg += LATENCY_ALPHA * error
+            self.latency_dev += LATENCY_BETA * (abs(error) - self.latency_dev)
+        target = self.latency_avg + LATENCY_DEV_MULTIPLIER * self.latency_dev
+        self.wait_s = self._clamp(max(target, self.learned_floor_s))
+
+    def reset(self):
+        """학습한 대기 시간과 지연 통계를 버리고 처음 값으로 돌아갑니다."""
+        self.wait_s = self.initial_s
+        self.learned_floor_s = self.min_s
+        self.successes = 0
+        self.latency_avg = None
+        self.latency_dev = 0.0
+
+    def relax(self):
+        """성공한 반복 후 대기 시간을 학습된 하한 쪽으로 줄입니다.
+
+        FLOOR_DECAY_SUCCESSES 번 연속으로 성공하면 하한도 min_s 쪽으로 낮춥니다.
+        """
+        self.successes += 1
+        if self.successes >= FLOOR_DECAY_SUCCESSES and self.learned_floor_s > self.min_s:
+            self.learned_floor_s = self._clamp(self.learned_floor_s * FLOOR_DECAY_FACTOR)
+            self.successes = 0
+        self.wait_s = self._clamp(max(self.wait_s * RELAX_FACTOR, self.learned_floor_s))
+
+    def back_off(self):
+        """실패한 반복 후 대기 시간을 늘리고, 실패 지점을 하한으로 기억합니다."""
+        self.learned_floor_s = self._clamp(self.wait_s * LEARNED_FLOOR_MARGIN)
+        self.successes = 0
+        self.wait_s = self._clamp(self.wait_s * BACKOFF_FACTOR)
+        logger.info(
+            "%s 대기 시간 증가: %.0fms (하한 %.0fms)",
+            self.name,
+            self.wait_s * 1000,
+            self.learned_floor_s * 1000,
+        )
+
+
+class AdaptivePacer:
+    """메뉴 열림 대기와 행 삭제 대기를 함께 관리하는 페이싱 엔진."""
+
+    def __init__(
+        self,
+        menu_wait_ms,
+        row_wait_ms,
+        menu_bounds_ms=(50, 1500),
+        row_bounds_ms=(50, 3000),
+        adaptive=True,
+    ):
+        self.adaptive = adaptive
+        self.menu = StepPacer("메뉴", menu_wait_ms, *menu_bounds_ms)
+        self.row = StepPacer("행 삭제", row_wait_ms, *row_bounds_ms)
+        self.failures = 0
+
+    @classmethod
+    def from_settings(cls, get, row_wait_ms=None, adaptive=None):
+        """SettingsManager.get 과 같은 형태의 함수로부터 페이서를 생성합니다."""
+
+        def value(key):
+            return get(key, DEFAULT_PACING_SETTINGS[key])
+
+        return cls(
+            menu_wait_ms=value("menu_wait_ms"),
+            row_wait_ms=value("row_wait_ms") if row_wait_ms is None else row_wait_ms,
+            menu_bounds_ms=(value("menu_wait_min_ms"), value("menu_wait_max_ms")),
+            row_bounds_ms=(value("row_wait_min_ms"), value("row_wait_max_ms")),
+            adaptive=value("adaptive_pacing") if adaptive is None else adaptive,
+        )
+
+    def menu_wait(self) -> float:
+        """클릭1 이후 메뉴가 열릴 때까지 기다릴 시간(초)."""
+        return self.menu.current()
+
+    def row_wait(self) -> float:
+        """클릭2 이후 행이 사라질 때까지 기다릴 시간(초)."""
+        return self.row.current()
+
+    def record_menu_latency(self, latency_s):
+        """화면 감지로 측정한 메뉴 열림 지연을 반영합니다."""
+        if self.adaptive:
+            self.menu.observe(latency_s)
+
+    def record_row_latency(self, latency_s):
+        """화면 감지로 측정한 행 삭제 지연을 반영합니다."""
+        if self.adaptive:
+            self.row.observe(latency_s)
+
+    def on_success(self):
+        """삭제가 확인된 반복을 반영합니다."""
+        if not self.adaptive:
+            return
+        self.menu.relax()
+        self.row.relax()
+
+    def on_failure(self, step):
+        """삭제에 실패한 반복을 반영합니다. 실패한 단계(STEP_MENU 또는 STEP_ROW)의 대기만 늘립니다."""
+        self.failures += 1
+        if not self.adaptive:
+            return
+        {STEP_MENU: self.menu, STEP_ROW: self.row}[step].back_off()
+
+    def reset(self):
+        """두 단계의 학습 결과를 모두 버립니다 (감시자의 재보정)."""
+        self.menu.reset()
+        self.row.reset()
+
+    def describe(self) -> str:
+        """UI 표시용 현재 대기 시간 문자열."""
+        return f"메뉴 {self.menu_wait() * 1000:.0f}ms / 행 {self.row_wait() * 1000:.0f}ms"
@@ -0,0 +1,180 @@
+"""캡처 → 분석 → 동작을 스레드로 나눈 화면 처리 파이프라인.
+
+한 스레드에서 "캡처, 분석, 클릭, 대기"를 차례로 하면 화면을 분석하는 시간이 매 반복에 그대로 더해집니다.
+여기서는 세 단계를 나눕니다.
+
+    캡처 스레드   감시 영역을 계속 캡처해 가장 최근 프레임 하나만 버퍼에 둡니다 (오래된 프레임은 버림).
+    분석 스레드   가장 최근 프레임으로 판단 결과(다음 클릭 위치 등)를 계산해 역시 최근 것 하나만 둡니다.
+    동작 단계     드라이버 스레드. 준비된 판단 결과만 꺼내 클릭합니다. 마우스는 이 단계만 사용합니다.
+
+그래서 N 번째 행의 입력과 삭제 확인을 기다리는 동안 N+1 번째 행의 위치가 미리 계산됩니다.
+"""
+
+import logging
+import threading
+import time
+from collections import namedtuple
+
+import pyautogui as pa
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+CAPTURE_INTERVAL = 0.01  # 캡처 스레드의 최소 캡처 간격 (초, screen_watch 의 폴링 간격과 같음)
+WAIT_SLICE = 0.05  # 기다리는 동안 중단 여부를 확인하는 간격 (초)
+
+# seq: 증가하는 번호, captured_at: 캡처를 시작한 perf_counter 시각, value: 프레임 또는 판단 결과
+Item = namedtuple("Item", "seq captured_at value")
+
+
+class LatestBuffer:
+    """가장 최근 항목 하나만 보관하는 버퍼. 소비보다 생산이 빠르면 이전 항목을 버립니다."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.dropped = 0  # 소비되기 전에 덮어쓴 항목 수
+        self._taken_seq = 0
+
+    def put(self, captured_at, value):
+        with self._cond:
+            seq = self._item.seq + 1 if self._item is not None else 1
+            if self._item is not None and self._item.seq > self._taken_seq:
+                self.dropped += 1
+            self._item = Item(seq, captured_at, value)
+            self._cond.notify_all()
+
+    def wait_newer(self, seq, timeout=None):
+        """seq 보다 새 항목이 생길 때까지 기다립니다. 시간 초과나 종료 시 None."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._closed or (self._item is not None and self._item.seq > seq),
+                timeout,
+            ):
+                return None
+            if self._closed:
+                return None
+            self._taken_seq = max(self._taken_seq, self._item.seq)
+            return self._item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class FramePipeline:
+    """화면 영역 하나를 캡처 스레드와 분석 스레드로 처리합니다.
+
+    Args:
+        region: 감시할 ScreenRegion.
+        analyze: 캡처한 PIL 이미지를 받아 판단 결과를 반환하는 함수 (분석 스레드에서 실행).
+    """
+
+    def __init__(self, region, analyze, capture_interval=CAPTURE_INTERVAL):
+        self.region = region
+        self.analyze = analyze
+        self.capture_interval = capture_interval
+        self.frames = LatestBuffer()
+        self.decisions = LatestBuffer()
+        self.last_analyze_ms = 0.0
+        self._active = threading.Event()  # 판단 결과가 필요할 때만 캡처
+        self._stop = threading.Event()
+        self._threads = []
+
+    @property
+    def origin(self):
+        return self.region.box[:2]
+
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="pipeline-capture", daemon=True),
+            threading.Thread(target=self._analyze_loop, name="pipeline-analyze", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.debug("파이프라인 시작: %s", self.region)
+
+    def activate(self):
+        """캡처를 다시 시작합니다. 이전 판단 결과는 since/after 로 걸러 냅니다."""
+        self._active.set()
+
+    def deactivate(self):
+        """다음 activate() 까지 캡처를 멈춰 CPU 를 쓰지 않습니다."""
+        self._active.clear()
+
+    def stop(self):
+        self._stop.set()
+        self._active.set()  # 쉬고 있는 캡처 스레드를 깨움
+        self.frames.close()
+        self.decisions.close()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        logger.debug(
+            "파이프라인 중지 (버린 프레임 %d개, 버린 판단 %d개)",
+            self.frames.dropped,
+            self.decisions.dropped,
+        )
+
+    def _capture_loop(self):
+        while not self._stop.is_set():
+            self._active.wait()
+            if self._stop.is_set():
+                break
+            started = time.perf_counter()
+            try:
+                image = pa.screenshot(region=self.region.box)
+            except Exception as e:
+                logger.error(f"파이프라인 캡처 실패 - {e}")
+                self._stop.wait(self.capture_interval)
+                continue
+            self.frames.put(started, image)
+            self._stop.wait(max(0.0, self.capture_interval - (time.perf_counter() - started)))
+
+    def _analyze_loop(self):
+        seq = 0
+        while not self._stop.is_set():
+            frame = self.frames.wait_newer(seq, WAIT_SLICE)
+            if frame is None:
+                continue
+            seq = frame.seq
+            start = time.perf_counter()
+            try:
+                result = self.analyze(frame.value)
+            except Exception as e:
+                logger.error(f"파이프라인 분석 실패 - {e}", exc_info=True)
+                continue
+            self.last_analyze_ms = (time.perf_counter() - start) * 1000
+            self.decisions.put(frame.captured_at, result)
+
+    def wait(self, predicate, timeout, should_continue=lambda: True, since=None, after=0):
+        """조건을 만족하는 판단 결과를 기다립니다 (캡처가 멈춰 있으면 다시 시작).
+
+        Args:
+            predicate: 판단 결과(value)를 받아 bool 을 반환하는 함수.
+            since: 이 perf_counter 시각 이후에 캡처한 프레임의 결과만 봄 (클릭 전 화면 제외).
+            after: 이 seq 보다 새 결과만 봄.
+
+        Returns:
+            조건을 만족한 Item. 시간 초과나 중단 시 None.
+        """
+        self.activate()
+        deadline = time.perf_counter() + timeout
+        seq = after
+        while should_continue():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            item = self.decisions.wait_newer(seq, min(remaining, WAIT_SLICE))
+            if item is None:
+                if self._stop.is_set():
+                    return None
+                continue
+            seq = item.seq
+            if since is not None and item.captured_at < since:
+                continue
+            if predicate(item.value):
+                return item
+        return None
@@ -0,0 +1,247 @@
+"""실행마다 결과를 SQLite 에 쌓아 두고 설정별 처리량을 비교하는 통계 저장소.
+
+실행 기록(journal.py)은 중단된 실행을 이어 세기 위한 것이고, 여기서는 끝난 실행 하나당
+한 행(백엔드, 페이싱 설정, 삭제/실패 수, 단계별 지연 백분위)을 오래 보관합니다.
+
+삭제 루프는 실행이 끝날 때 큐에 dict 하나를 넣기만 하고, 파일 쓰기는 별도 스레드가
+STATS_FLUSH_INTERVAL 동안 모은 행을 트랜잭션 한 번으로 씁니다.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+from drivers import DEFAULT_VERIFY_SETTINGS
+from pacing import DEFAULT_PACING_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+STATS_FILE_NAME = "run_stats.sqlite3"
+STATS_FLUSH_INTERVAL = 2.0  # 쓰기 스레드가 행을 모으는 최대 시간 (초)
+# 실행별로 남겨 비교하는 설정과 설정 파일에 없을 때의 값
+STATS_SETTING_DEFAULTS = {
+    **DEFAULT_PACING_SETTINGS,
+    "use_locator": True,
+    "batch_mode": False,
+    "fast_input": True,
+    "pipelined": True,
+    "adaptive_menu": True,
+    "row_retries": DEFAULT_VERIFY_SETTINGS["row_retries"],
+}
+RUN_COLUMNS = (
+    "session",
+    "backend",
+    "started_at",
+    "elapsed",
+    "deleted",
+    "failures",
+    "skipped",
+    "filtered",
+    "iterations",
+    "rate",
+    "stop_reason",
+    "settings",  # JSON (키 정렬)
+    "latency",  # JSON: 단계 → {"p50": ms, "p95": ms, "p99": ms}
+)
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    {", ".join(RUN_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+"""
+
+
+def settings_snapshot(get):
+    """통계에 남길 설정 값을 읽습니다 (SettingsManager.get 과 같은 형태의 함수)."""
+    return {key: get(key, default) for key, default in STATS_SETTING_DEFAULTS.items()}
+
+
+class RunStatsStore:
+    """끝난 실행을 SQLite 파일에 모으고 설정별 유효 속도를 비교합니다."""
+
+    def __init__(self, path=STATS_FILE_NAME, flush_interval=STATS_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        # 쓰는 동안에도 통계 화면에서 읽을 수 있도록
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    # --- 쓰기 ---
+    def record(self, session):
+        """끝난 DeletionSession 하나를 기록하도록 큐에 넣습니다 (파일은 쓰기 스레드가 씀)."""
+        if session.start_time is None:
+            return
+        driver = session.driver
+        summary = driver.telemetry.summary()
+        self._queue.put(
+            {
+                "session": session.name,
+                "backend": driver.name,
+                "started_at": round(session.start_time, 3),
+                "elapsed": round(session.elapsed(), 3),
+                "deleted": session.delete_count,
+                "failures": driver.failures,
+                "skipped": driver.skipped_rows,
+                "filtered": driver.filtered_rows,
+                "iterations": summary["iterations"],
+                "rate": round(session.rate(), 3),
+                "stop_reason": session.stop_reason or session.error,
+                "settings": json.dumps(session.settings or {}, sort_keys=True, ensure_ascii=False),
+                "latency": json.dumps(summary["steps"]),
+            }
+        )
+        self._ensure_writer()
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="run-stats-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            batch, waiters, closing = [], [], False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    closing = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if closing or waiters:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+            if closing:
+                return
+
+    def _write(self, rows):
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) "
+                        f"VALUES ({', '.join(':' + c for c in RUN_COLUMNS)})",
+                        rows,
+                    )
+            finally:
+                connection.close()
+            logger.debug("실행 통계 %d개 저장", len(rows))
+        except sqlite3.Error as e:
+            logger.error(f"실행 통계 저장 실패 - {e}")
+
+    def flush(self, timeout=5.0):
+        """큐에 남은 행을 바로 쓰고 끝날 때까지 기다립니다."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """남은 행을 쓰고 쓰기 스레드를 끝냅니다."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        self._queue.put(None)
+        self._writer.join(timeout)
+
+    # --- 읽기 ---
+    def _query(self, sql, params=()):
+        self.flush()
+        try:
+            connection = self._connect()
+        except sqlite3.Error as e:
+            logger.error(f"실행 통계 읽기 실패 - {e}")
+            return []
+        try:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+    def recent_runs(self, limit=20):
+        """최근 실행을 새것부터 반환합니다. settings 와 latency 는 dict 로 풀어 줍니다."""
+        runs = self._query("SELECT * FROM runs ORDER BY started_at DESC LIMIT ?", (limit,))
+        for run in runs:
+            run["settings"] = json.loads(run["settings"] or "{}")
+            run["latency"] = json.loads(run["latency"] or "{}")
+        return runs
+
+    def compare_settings(self):
+        """백엔드와 설정이 같은 실행끼리 묶어 유효 속도가 높은 순서로 반환합니다.
+
+        label 에는 묶음끼리 값이 다른 설정만 적습니다.
+        """
+        groups = self._query(
+            """
+            SELECT backend, settings,
+                   COUNT(*) AS runs,
+                   SUM(deleted) AS deleted,
+                   SUM(failures) AS failures,
+                   SUM(elapsed) AS elapsed,
+                   MAX(started_at) AS last_run
+            FROM runs
+            WHERE elapsed > 0
+            GROUP BY backend, settings
+            """
+        )
+        parsed = [json.loads(group["settings"] or "{}") for group in groups]
+        varying = sorted(
+            {key for settings in parsed for key in settings}
+            if len(parsed) < 2
+            else {
+                key
+                for settings in parsed
+                for key in settings
+                if any(other.get(key) != settings[key] for other in parsed)
+            }
+        )
+        for group, settings in zip(groups, parsed):
+            attempts = group["deleted"] + group["failures"]
+            group["rate"] = group["deleted"] / group["elapsed"]
+            group["failure_rate"] = group["failures"] / attempts if attempts else 0.0
+            group["settings"] = settings
+            group["label"] = ", ".join(
+                f"{key}={json.dumps(settings[key])}" for key in varying if key in settings
+            )
+        return sorted(groups, key=lambda group: group["rate"], reverse=True)
+
+    def comparison_lines(self):
+        """설정별 비교를 사람이 읽기 쉬운 문자열 목록으로 만듭니다."""
+        groups = self.compare_settings()
+        if not groups:
+            return ["기록된 실행 없음"]
+        lines = []
+        for rank, group in enumerate(groups, 1):
+            last_run = time.strftime("%m-%d %H:%M", time.localtime(group["last_run"]))
+            lines.append(
+                f"{rank}. [{group['backend']}] {group['rate']:.2f}개/초, "
+                f"실패율 {group['failure_rate'] * 100:.1f}%, "
+                f"{group['runs']}회 {group['deleted']}개 (마지막 {last_run})"
+            )
+            if group["label"]:
+                lines.append(f"   {group['label']}")
+        return lines
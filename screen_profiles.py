@@ -0,0 +1,231 @@
+"""모니터 구성(해상도, 배치, 배율)별 위치 설정 프로필.
+
+F8/F9 로 설정한 좌표는 한 모니터 구성에서만 맞는 픽셀 값입니다. 그래서 설정을
+모니터 구성 키("1920x1080+0+0@1.25|...")별 프로필로 settings.json 의 "screen_profiles" 에 보관하고,
+좌표는 절대 픽셀과 함께 기준 모니터 왼쪽 위를 기준으로 한 논리 좌표(배율로 나눈 값)로도 저장합니다.
+
+시작할 때는 현재 구성의 키로 프로필을 바로 찾고, 없으면 다음 순서로 다른 프로필에서 옮겨 옵니다.
+    exact     같은 구성: 저장된 픽셀 좌표를 그대로 사용
+    moved     같은 크기와 배율의 모니터가 다른 자리에 있음: 모니터 위치만큼 옮김
+    rescaled  논리 크기가 같은 모니터(예: 4K 200% ↔ FHD 100%): 배율 비율로 좌표와 기준 이미지를 늘리거나 줄임
+어느 것도 맞지 않으면 잘못 클릭하지 않도록 위치를 적용하지 않습니다 (F8/F9 로 다시 설정).
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+
+from locator import TEMPLATE_DIR
+from startup import lazy_import
+
+pa = lazy_import("pyautogui")  # Windows 가 아니면 모니터 크기를 읽을 때 가져옴
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+PROFILES_KEY = "screen_profiles"  # settings.json 안의 프로필 목록 키
+DEFAULT_SCALE = 1.0
+BASE_DPI = 96  # 배율 100% 의 DPI
+
+
+def _windows_displays():
+    """Windows: 모든 모니터의 물리 픽셀 영역과 배율을 구합니다."""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    try:
+        shcore = ctypes.windll.shcore  # Windows 8.1 이상
+    except OSError:
+        shcore = None
+    displays = []
+
+    def callback(hmonitor, hdc, rect, lparam):
+        r = rect.contents
+        scale = DEFAULT_SCALE
+        if shcore is not None:
+            dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+            # MDT_EFFECTIVE_DPI = 0
+            if shcore.GetDpiForMonitor(hmonitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+                scale = dpi_x.value / BASE_DPI
+        displays.append(
+            {
+                "x": r.left,
+                "y": r.top,
+                "width": r.right - r.left,
+                "height": r.bottom - r.top,
+                "scale": round(scale, 2),
+            }
+        )
+        return True
+
+    enum_proc = ctypes.WINFUNCTYPE(
+        wintypes.BOOL,
+        wintypes.HANDLE,
+        wintypes.HDC,
+        ctypes.POINTER(wintypes.RECT),
+        wintypes.LPARAM,
+    )
+    user32.EnumDisplayMonitors(None, None, enum_proc(callback), 0)
+    return displays
+
+
+def detect_displays():
+    """현재 모니터 구성을 왼쪽 위부터 정렬한 목록으로 반환합니다.
+
+    Windows 가 아니거나 조회에 실패하면 pyautogui 가 아는 주 모니터 하나만 반환합니다.
+    """
+    displays = []
+    if sys.platform == "win32":
+        try:
+            displays = _windows_displays()
+        except Exception as e:
+            logger.warning(f"모니터 구성 조회 실패, 주 모니터만 사용 - {e}")
+    if not displays:
+        width, height = pa.size()
+        displays = [{"x": 0, "y": 0, "width": width, "height": height, "scale": DEFAULT_SCALE}]
+    return sorted(displays, key=lambda d: (d["x"], d["y"]))
+
+
+def display_key(displays):
+    """모니터 구성을 프로필 키 문자열로 만듭니다."""
+    return "|".join(
+        f"{d['width']}x{d['height']}{d['x']:+d}{d['y']:+d}@{d['scale']:g}" for d in displays
+    )
+
+
+def profile_template_dir(displays):
+    """모니터 구성별 기준 이미지 폴더 (배율이 다르면 기준 이미지도 달라짐)."""
+    return os.path.join(TEMPLATE_DIR, re.sub(r"[^0-9A-Za-z@.+-]+", "_", display_key(displays)))
+
+
+def _monitor_index(displays, point):
+    """점이 들어 있는 모니터 번호. 어느 모니터에도 없으면 가장 가까운 모니터."""
+
+    def distance(d):
+        dx = max(d["x"] - point[0], 0, point[0] - (d["x"] + d["width"] - 1))
+        dy = max(d["y"] - point[1], 0, point[1] - (d["y"] + d["height"] - 1))
+        return dx * dx + dy * dy
+
+    return min(range(len(displays)), key=lambda i: distance(displays[i]))
+
+
+def make_profile(displays, pos1, x_gap, y_gap, template_dir, template_scale=DEFAULT_SCALE):
+    """현재 모니터 구성에서 설정한 좌표로 프로필을 만듭니다."""
+    monitor = displays[_monitor_index(displays, pos1)]
+    scale = monitor["scale"]
+    return {
+        "name": display_key(displays),  # 사용자가 알아보기 쉽게 바꿔도 됨
+        "displays": displays,
+        "monitor": dict(monitor),
+        "offset": [(pos1[0] - monitor["x"]) / scale, (pos1[1] - monitor["y"]) / scale],
+        "gap": [x_gap / scale, y_gap / scale],
+        "pos1": [pos1[0], pos1[1]],
+        "x_gap": x_gap,
+        "y_gap": y_gap,
+        "template_dir": template_dir,
+        "template_scale": template_scale,
+        "saved": round(time.time()),
+    }
+
+
+def _logical_size(monitor):
+    return (
+        round(monitor["width"] / monitor["scale"]),
+        round(monitor["height"] / monitor["scale"]),
+    )
+
+
+def _placed(profile, monitor):
+    """프로필의 논리 좌표를 주어진 모니터 위의 픽셀 좌표로 옮긴 설정."""
+    scale = monitor["scale"]
+    ratio = scale / profile["monitor"]["scale"]
+    return {
+        "pos1_x": monitor["x"] + round(profile["offset"][0] * scale),
+        "pos1_y": monitor["y"] + round(profile["offset"][1] * scale),
+        "x_gap": round(profile["gap"][0] * scale),
+        "y_gap": round(profile["gap"][1] * scale),
+        "template_dir": profile["template_dir"],
+        "template_scale": round(profile.get("template_scale", DEFAULT_SCALE) * ratio, 4),
+    }
+
+
+def resolve_profile(profiles, displays):
+    """현재 모니터 구성에 맞는 위치 설정을 찾습니다.
+
+    Returns:
+        {"name", "match", "settings"} 또는 None. settings 는 드라이버 설정
+        (pos1_x, pos1_y, x_gap, y_gap, template_dir, template_scale) 입니다.
+    """
+    key = display_key(displays)
+    profile = profiles.get(key)
+    if profile is not None:
+        return {
+            "name": profile.get("name", key),
+            "match": "exact",
+            "settings": {
+                "pos1_x": profile["pos1"][0],
+                "pos1_y": profile["pos1"][1],
+                "x_gap": profile["x_gap"],
+                "y_gap": profile["y_gap"],
+                "template_dir": profile["template_dir"],
+                "template_scale": profile.get("template_scale", DEFAULT_SCALE),
+            },
+        }
+
+    # 최근에 저장한 프로필부터 옮길 수 있는지 확인
+    candidates = sorted(profiles.values(), key=lambda p: p.get("saved", 0), reverse=True)
+    for match, same in (
+        (
+            "moved",
+            lambda old, new: (old["width"], old["height"], old["scale"])
+            == (new["width"], new["height"], new["scale"]),
+        ),
+        ("rescaled", lambda old, new: _logical_size(old) == _logical_size(new)),
+    ):
+        for profile in candidates:
+            old_monitor = profile["monitor"]
+            # 같은 모니터가 여러 대면 원래 자리에 가까운 모니터부터
+            nearest = sorted(
+                displays,
+                key=lambda m: abs(m["x"] - old_monitor["x"]) + abs(m["y"] - old_monitor["y"]),
+            )
+            for monitor in nearest:
+                if same(old_monitor, monitor):
+                    return {
+                        "name": profile.get("name", key),
+                        "match": match,
+                        "settings": _placed(profile, monitor),
+                    }
+    return None
+
+
+def resolve_positions(get, displays):
+    """설정에서 현재 모니터 구성에 맞는 위치 설정을 고릅니다.
+
+    프로필이 하나도 없는 이전 버전 설정이면 저장된 절대 좌표를 그대로 씁니다 (match="legacy").
+    프로필은 있지만 맞는 것이 없으면 None 을 반환합니다.
+    """
+    profiles = get(PROFILES_KEY) or {}
+    if profiles:
+        resolved = resolve_profile(profiles, displays)
+        if resolved is None:
+            logger.warning(
+                f"현재 모니터 구성({display_key(displays)})에 맞는 위치 프로필 없음. F8, F9로 다시 설정 필요."
+            )
+        else:
+            logger.info(
+                f"위치 프로필 적용: {resolved['name']} ({resolved['match']}) - {resolved['settings']}"
+            )
+        return resolved
+
+    legacy = {key: get(key) for key in ("pos1_x", "pos1_y", "x_gap", "y_gap")}
+    if None in legacy.values():
+        return None
+    legacy.update(
+        template_dir=get("template_dir", TEMPLATE_DIR),
+        template_scale=get("template_scale", DEFAULT_SCALE),
+    )
+    return {"name": display_key(displays), "match": "legacy", "settings": legacy}
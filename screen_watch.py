@@ -0,0 +1,127 @@
+"""작은 화면 영역을 저해상도로 캡처해 변화 여부를 감지하는 모듈.
+
+클릭 후 고정 시간 대신 "영역이 바뀔 때까지" 기다리는 데 사용합니다.
+"""
+
+import logging
+import time
+
+import numpy as np
+import pyautogui as pa
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+DOWNSCALE_FACTOR = 4  # 캡처 영역을 1/4 로 줄여 비교
+PIXEL_DIFF_THRESHOLD = 24  # 이 값 이상 밝기가 바뀐 픽셀을 "변화"로 봄
+CHANGED_FRACTION = 0.02  # 변화 픽셀 비율이 이 값을 넘으면 영역이 바뀐 것
+POLL_INTERVAL = 0.01  # 영역 폴링 간격 (초)
+STABLE_FRAMES = 2  # 연속으로 이만큼 같으면 화면이 안정된 것
+BLANK_STD_THRESHOLD = 6  # 밝기 표준편차가 이보다 작으면 빈 영역 (행 없음)
+
+
+class ScreenRegion:
+    """화면의 고정된 사각형 영역 하나를 감시합니다."""
+
+    def __init__(self, left, top, width, height):
+        self.left = max(0, int(left))
+        self.top = max(0, int(top))
+        self.width = max(DOWNSCALE_FACTOR, int(width))
+        self.height = max(DOWNSCALE_FACTOR, int(height))
+
+    @classmethod
+    def around(cls, point, half_width, half_height):
+        """점을 중심으로 하는 영역을 생성합니다."""
+        return cls(
+            point.x - half_width, point.y - half_height, half_width * 2, half_height * 2
+        )
+
+    @classmethod
+    def row_strip(cls, base_point, width=400, height=20):
+        """메뉴 버튼 왼쪽의 제목 줄을 포함하는 영역을 생성합니다.
+
+        메뉴 버튼("⋮")은 모든 행에서 모양이 같으므로 행이 바뀌었는지는
+        제목이 있는 왼쪽 영역으로 판단합니다.
+        """
+        return cls(base_point.x - width, base_point.y - height // 2, width + 20, height)
+
+    @property
+    def box(self):
+        return (self.left, self.top, self.width, self.height)
+
+    def capture(self) -> np.ndarray:
+        """영역을 캡처해 축소된 흑백 배열로 반환합니다."""
+        return to_frame(pa.screenshot(region=self.box))
+
+    def crop(self, snapshot, origin) -> np.ndarray:
+        """이미 캡처한 더 큰 스냅샷에서 이 영역만 잘라 축소 배열로 반환합니다.
+
+        Args:
+            snapshot: 화면 일부를 캡처한 PIL 이미지.
+            origin: 스냅샷 왼쪽 위 모서리의 화면 좌표 (x, y).
+        """
+        left = self.left - origin[0]
+        top = self.top - origin[1]
+        return to_frame(
+            snapshot.crop((left, top, left + self.width, top + self.height))
+        )
+
+    def __repr__(self):
+        return f"ScreenRegion{self.box}"
+
+
+def to_frame(image) -> np.ndarray:
+    """PIL 이미지를 비교용 축소 흑백 배열로 변환합니다."""
+    return np.asarray(image.convert("L").reduce(DOWNSCALE_FACTOR), dtype=np.int16)
+
+
+def frames_differ(baseline: np.ndarray, frame: np.ndarray) -> bool:
+    """두 축소 프레임이 의미 있게 다른지 판단합니다."""
+    if baseline.shape != frame.shape:
+        return True
+    changed = np.count_nonzero(np.abs(frame - baseline) >= PIXEL_DIFF_THRESHOLD)
+    return changed > CHANGED_FRACTION * baseline.size
+
+
+def is_blank(frame: np.ndarray) -> bool:
+    """축소 프레임에 글자나 그림 없이 배경만 있는지 판단합니다."""
+    return float(frame.std()) < BLANK_STD_THRESHOLD
+
+
+def wait_for_change(region, baseline, timeout, should_continue=lambda: True):
+    """영역이 기준 프레임과 달라질 때까지 기다립니다.
+
+    Returns:
+        변화까지 걸린 시간(초). 시간 초과 또는 중단 시 None.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    while should_continue():
+        if frames_differ(baseline, region.capture()):
+            return time.perf_counter() - start
+        if time.perf_counter() >= deadline:
+            return None
+        time.sleep(POLL_INTERVAL)
+    return None
+
+
+def wait_until_stable(region, timeout, should_continue=lambda: True):
+    """애니메이션이 끝나 영역이 더 이상 바뀌지 않을 때까지 기다립니다.
+
+    Returns:
+        안정되었으면 True, 시간 초과 또는 중단 시 False.
+    """
+    deadline = time.perf_counter() + timeout
+    previous = region.capture()
+    same_count = 0
+    while should_continue() and time.perf_counter() < deadline:
+        time.sleep(POLL_INTERVAL)
+        frame = region.capture()
+        if frames_differ(previous, frame):
+            same_count = 0
+        else:
+            same_count += 1
+            if same_count >= STABLE_FRAMES:
+                return True
+        previous = frame
+    return False
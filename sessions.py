@@ -0,0 +1,261 @@
+"""여러 삭제 세션(계정/브라우저 프로필)을 동시에 실행하는 스케줄러.
+
+각 세션은 자기 드라이버, 페이싱, 카운터를 가집니다.
+헤드리스 백엔드 세션은 스레드 풀에서 동시에 실행하고,
+실제 마우스를 쓰는 세션은 풀의 한 자리(데스크톱 차례)에서 서로 겹치지 않게 하나씩 차례로 실행합니다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from drivers import DEFAULT_BACKEND, DriverStopped, load_driver_class
+from run_stats import settings_snapshot
+from supervisor import supervise
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+DEFAULT_MAX_PARALLEL_SESSIONS = 4
+
+
+class DeletionSession:
+    """드라이버 하나로 삭제를 반복하는 Qt 독립 실행 단위."""
+
+    def __init__(self, name, driver, on_deleted=None, journal=None, stats=None, settings=None):
+        self.name = name
+        self.driver = driver
+        self.on_deleted = on_deleted or (lambda count: None)
+        self.journal = journal  # RunJournal (None 이면 기록하지 않음)
+        self.stats = stats  # RunStatsStore (None 이면 실행 통계를 남기지 않음)
+        self.settings = settings  # 통계에 함께 남길 설정 값 (settings_snapshot)
+        self.previous = {"deleted": 0, "elapsed": 0.0, "runs": 0, "page": None}
+        if journal is not None:
+            self.previous = journal.totals(name)
+            if self.previous["page"]:
+                driver.restore_page_state(self.previous["page"])
+        # 설정되면 중지. 드라이버의 대기도 이 이벤트로 바로 깨어남 (run() 전에 stop() 하면 바로 끝남)
+        self._stop_event = threading.Event()
+        self.delete_count = 0
+        self.start_time = None
+        self.end_time = None
+        self.error = None
+        self.stop_reason = None  # 드라이버가 스스로 멈춘 이유
+        self.stop_exception = None  # stop_reason 의 DriverStopped (종류 구분용)
+        self.on_start = None  # 드라이버 start() 직후 호출할 함수 (감시자의 복구 동작)
+
+    @property
+    def is_running(self):
+        return not self._stop_event.is_set()
+
+    def _on_deleted(self):
+        self.delete_count += 1
+        self.on_deleted(self.delete_count)
+
+    def run(self, on_step=None):
+        """중지되거나 오류가 날 때까지 삭제를 반복합니다.
+
+        Args:
+            on_step: 삭제 단위가 끝날 때마다 호출할 함수 (상태 갱신용).
+        """
+        if not self.is_running:
+            return
+        self.start_time = time.time()
+        self.end_time = None
+        self.driver.attach(lambda: self.is_running, self._on_deleted, self._stop_event)
+        run_id = self.journal.begin(self) if self.journal is not None else None
+        try:
+            self.driver.start()
+            if self.on_start is not None:
+                self.on_start()
+            while self.is_running:
+                self.driver.step()
+                if on_step is not None:
+                    on_step()
+                if run_id is not None:
+                    self.journal.maybe_flush(run_id, self)
+        except DriverStopped as e:
+            # 연속 실패나 기록 끝에 도달해 드라이버가 멈춘 경우는 오류가 아닌 자동 중지
+            self.stop_reason = str(e)
+            self.stop_exception = e
+            logger.warning(f"[{self.name}] {e}")
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"[{self.name}] 오류 발생: {e}", exc_info=True)
+            raise
+        finally:
+            self._stop_event.set()
+            self.end_time = time.time()
+            self.driver.close()
+            if run_id is not None:
+                self.journal.end(run_id, self, self.stop_reason or self.error)
+            if self.stats is not None:
+                self.stats.record(self)
+
+    def renew(self, driver=None):
+        """같은 이름과 기록 설정으로 다시 실행할 새 세션을 만듭니다.
+
+        driver 가 None 이면 지금 드라이버를 다시 씁니다 (start() 가 다시 준비함).
+        """
+        return DeletionSession(
+            self.name,
+            driver or self.driver,
+            on_deleted=self.on_deleted,
+            journal=self.journal,
+            stats=self.stats,
+            settings=self.settings,
+        )
+
+    def stop(self):
+        """중지를 요청합니다. 기다리지 않으며, 드라이버는 진행 중인 대기에서 바로 깨어납니다."""
+        self._stop_event.set()
+
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+    def rate(self):
+        """확인된 삭제 기준 초당 삭제 수 (유효 속도)."""
+        elapsed = self.elapsed()
+        return self.delete_count / elapsed if elapsed > 0 else 0.0
+
+    def total_deleted(self):
+        """이전 실행을 포함한 누적 삭제 수."""
+        return self.previous["deleted"] + self.delete_count
+
+    def total_rate(self):
+        """이전 실행을 포함한 누적 초당 삭제 수."""
+        elapsed = self.previous["elapsed"] + self.elapsed()
+        return self.total_deleted() / elapsed if elapsed > 0 else 0.0
+
+    def status_lines(self):
+        """UI 표시용 상태 문자열 목록."""
+        lines = [
+            f"삭제된 항목: {self.delete_count}개",
+            f"경과 시간: {int(self.elapsed())}초",
+            f"유효 속도: {self.rate():.1f}개/초 (삭제 확인 기준)",
+        ]
+        if self.previous["runs"]:
+            lines.append(
+                f"누적: {self.total_deleted()}개, {self.total_rate():.1f}개/초 "
+                f"(이전 실행 {self.previous['runs']}회 포함)"
+            )
+        return lines + self.driver.status_lines()
+
+
+def session_settings_getter(session_config, get):
+    """세션별 설정을 먼저 보고, 없으면 전체 설정을 보는 get 함수를 만듭니다."""
+
+    def session_get(key, default=None):
+        if key in session_config:
+            return session_config[key]
+        return get(key, default)
+
+    return session_get
+
+
+def create_session(session_config, get, journal=None, stats=None):
+    """settings.json 의 "sessions" 항목 하나로 세션을 생성합니다.
+
+    감시를 켜 두면(기본) 오류나 멈춤에서 스스로 복구하는 SupervisedSession 으로 감쌉니다.
+    """
+    session_get = session_settings_getter(session_config, get)
+    backend = session_get("backend", DEFAULT_BACKEND)
+    driver_class = load_driver_class(backend)
+    driver = driver_class.from_settings(session_get)
+    name = session_config.get("name", f"{backend}:{id(driver):x}")
+    session = DeletionSession(
+        name, driver, journal=journal, stats=stats, settings=settings_snapshot(session_get)
+    )
+    return supervise(session, lambda: driver_class.from_settings(session_get), session_get)
+
+
+class SessionScheduler:
+    """여러 DeletionSession 을 동시에 실행하고 처리량을 집계합니다."""
+
+    def __init__(self, max_parallel=DEFAULT_MAX_PARALLEL_SESSIONS):
+        self.max_parallel = max_parallel
+        self.sessions = []
+        self._executor = None
+        self._futures = []
+        self._stopping = False
+
+    def add(self, session):
+        self.sessions.append(session)
+
+    def _run_desktop_lane(self, sessions):
+        """실제 마우스를 쓰는 세션을 한 스레드에서 하나씩 차례로 실행합니다."""
+        for session in sessions:
+            if self._stopping:
+                return
+            try:
+                session.run()
+            except Exception:
+                continue  # 세션이 오류를 기록하고 로그를 남김. 다음 세션은 그대로 실행
+
+    def start(self):
+        """모든 세션을 시작합니다."""
+        self._stopping = False
+        desktop = [s for s in self.sessions if s.driver.uses_desktop_input]
+        headless = [s for s in self.sessions if not s.driver.uses_desktop_input]
+        # 데스크톱 세션은 모두 합쳐 한 자리만 쓰므로 기다리며 헤드리스 세션의 자리를 막지 않음
+        lanes = len(headless) + (1 if desktop else 0)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_parallel, lanes)),
+            thread_name_prefix="deletion-session",
+        )
+        self._futures = []
+        if desktop:
+            self._futures.append(self._executor.submit(self._run_desktop_lane, desktop))
+        self._futures += [self._executor.submit(session.run) for session in headless]
+        logger.info(f"세션 {len(self.sessions)}개 시작 (동시 실행 최대 {self.max_parallel})")
+
+    def stop(self):
+        """모든 세션에 중지를 요청합니다. 대기 중인 데스크톱 세션은 실행하지 않습니다."""
+        self._stopping = True
+        for session in self.sessions:
+            session.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_running(self):
+        return any(not future.done() for future in self._futures)
+
+    def wait(self, timeout=None):
+        """실행 중인 세션이 모두 끝날 때까지 최대 timeout 초 기다립니다."""
+        wait(self._futures, timeout)
+
+    def total_deleted(self):
+        return sum(session.total_deleted() for session in self.sessions)
+
+    def aggregate_rate(self):
+        """실행 중인 세션들의 초당 삭제 수 합계."""
+        return sum(
+            session.rate()
+            for session in self.sessions
+            if session.is_running and session.start_time is not None
+        )
+
+    def status_lines(self):
+        """UI 표시용 전체 및 세션별 처리량 문자열 목록."""
+        lines = [
+            f"전체: {self.total_deleted()}개, 합계 속도 {self.aggregate_rate():.1f}개/초"
+        ]
+        for session in self.sessions:
+            if session.error:
+                state = f"오류: {session.error}"
+            elif session.stop_reason:
+                state = f"자동 중지: {session.stop_reason}"
+            elif session.start_time is None:
+                state = "대기 중"
+            elif session.is_running:
+                state = "실행 중"
+            else:
+                state = "종료"
+            lines.append(
+                f"[{session.name}] {session.delete_count}개, "
+                f"{session.rate():.1f}개/초 ({state})"
+            )
+        return lines
@@ -0,0 +1,50 @@
+"""설정 파일(settings.json) 읽기 및 쓰기.
+
+GUI 와 명령줄 실행(cli.py)이 함께 쓰므로 Qt 에 의존하지 않습니다.
+"""
+
+import json
+import logging
+
+from journal import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+SETTINGS_FILE_NAME = "settings.json"
+
+
+class SettingsManager:
+    """설정 파일(JSON) 읽기 및 쓰기를 관리하는 클래스."""
+
+    def __init__(self, filename=SETTINGS_FILE_NAME):
+        self.filename = filename
+        self.settings = {}
+        self._load()
+
+    def _load(self):
+        """파일에서 설정을 로드합니다."""
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                self.settings = json.load(f)
+                logger.info(f"설정 로드 완료 from {self.filename}")
+        except FileNotFoundError:
+            logger.warning(f"{self.filename} 파일을 찾을 수 없음. 기본 설정 사용.")
+            self.settings = {}  # 기본값은 호출하는 쪽에서 처리하거나 여기서 정의
+        except json.JSONDecodeError as e:
+            logger.error(f"{self.filename} 파일 분석 오류: {e}. 기본 설정 사용.")
+            self.settings = {}
+
+    def save(self, data_to_save):
+        """주어진 데이터를 파일에 설정으로 저장합니다."""
+        try:
+            # 저장 중 강제 종료되어도 기존 파일이 깨지지 않도록 임시 파일을 거쳐 교체
+            atomic_write_text(self.filename, json.dumps(data_to_save, indent=4))
+            self.settings = dict(data_to_save)
+            logger.info(f"설정 저장 완료 to {self.filename}")
+        except Exception as e:
+            logger.error(f"설정 저장 실패 - {e}", exc_info=True)
+
+    def get(self, key, default=None):
+        """설정 값을 가져옵니다. 없으면 기본값을 반환합니다."""
+        return self.settings.get(key, default)
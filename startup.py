@@ -0,0 +1,81 @@
+"""프로그램 시작 시간을 줄이고 재는 도구.
+
+lazy_import 는 모듈을 바로 실행하지 않고 등록만 해 두었다가, 처음으로 속성을 쓸 때 실제로
+가져옵니다. pyautogui, keyboard, numpy 처럼 가져오는 데 오래 걸리지만 첫 화면에는 필요 없는
+모듈에 씁니다.
+
+시작 단계별 시간은 다음 중 하나로 켜면 표준 오류로 출력됩니다.
+
+    python youtube_history_deleter.py --profile-startup
+    YT_HISTORY_PROFILE_STARTUP=1 python youtube_history_deleter.py
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+# --- Constants ---
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "YT_HISTORY_PROFILE_STARTUP"
+
+
+def lazy_import(name):
+    """name 모듈을 처음 속성에 접근할 때 가져오도록 등록하고 모듈 객체를 반환합니다.
+
+    이미 가져온 모듈(다른 곳에서 먼저 import 했거나 대체 모듈을 넣어 둔 경우)은 그대로 반환합니다.
+    모듈이 설치되어 있지 않으면 일반 import 와 같이 바로 ImportError 가 납니다.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class StartupProfiler:
+    """시작 단계별 소요 시간을 모았다가 한 번에 출력합니다. 꺼져 있으면 아무것도 하지 않습니다."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases = []  # (단계 이름, 소요 시간 ms)
+        self.reported = False
+
+    @classmethod
+    def from_environment(cls, argv=None):
+        argv = sys.argv if argv is None else argv
+        return cls(PROFILE_FLAG in argv or os.environ.get(PROFILE_ENV) == "1")
+
+    def mark(self, phase):
+        """직전 mark 이후 지난 시간을 phase 의 소요 시간으로 기록합니다."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    def report(self, stream=None):
+        """기록한 단계와 전체 시간을 한 번만 출력합니다."""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        stream = stream or sys.stderr
+        width = max((len(phase) for phase, _ in self.phases), default=0)
+        print("시작 단계별 시간:", file=stream)
+        for phase, ms in self.phases:
+            print(f"  {phase:<{width}}  {ms:8.1f}ms", file=stream)
+        total = (self._last - self.start) * 1000
+        print(f"  {'합계':<{width}}  {total:8.1f}ms", file=stream, flush=True)
+
+
+# 프로그램 전체에서 하나만 사용 (이 모듈을 가져온 시점부터 잼)
+profiler = StartupProfiler.from_environment()
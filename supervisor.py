@@ -0,0 +1,382 @@
+"""오래 켜 두는 실행을 위한 감시자.
+
+SupervisedSession 은 DeletionSession 과 같은 모양(run, stop, status_lines, 카운터)으로 쓰며,
+안쪽 세션이 오류로 끝나거나 삭제가 멈추면 원인에 맞는 복구를 한 뒤 새 세션으로 이어서 실행합니다.
+
+    하트비트   처리한 행 수(삭제 확인, 필터로 남김, 건너뜀)가 늘어날 때 시각을 남깁니다.
+    감시 스레드 stall_timeout_s 동안 처리한 행이 없으면 멈춘 것으로 보고 세션을 중지합니다.
+    복구       원인별로 창 초점 복구 → 재보정 → 백엔드 재시작 순으로, 처리한 행 없이 다시 실패할수록
+              한 단계씩 강한 동작을 씁니다.
+    백오프     재시작 사이 대기는 처리한 행 없이 실패할 때마다 두 배로 늘고, 행을 처리하면 처음으로 돌아옵니다.
+
+실행 기록(journal)과 실행 통계(stats)는 안쪽 세션에서 떼어 와 감시자가 직접 남기므로,
+여러 번 다시 시작해도 감시 실행 하나가 기록 하나로 남습니다.
+
+기록 끝(HistoryExhaustedError)과 사용자 중지는 복구하지 않고 그대로 끝냅니다.
+다시 시도해도 나아질 수 없는 오류(Playwright 나 Chromium 이 설치되지 않음 등)는 바로 실패로 끝냅니다.
+비상 정지(마우스를 화면 모서리로)는 한 번은 복구하지만, 처리한 행 없이 연속으로 일어나면 사용자가
+멈춘 것으로 보고 끝냅니다.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+
+from drivers import HistoryExhaustedError, TooManyFailuresError
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+DEFAULT_SUPERVISOR_SETTINGS = {
+    "supervise": True,  # 오류나 멈춤에서 스스로 복구하며 계속 실행
+    "stall_timeout_s": 120,  # 이 시간 동안 삭제가 확인되지 않으면 멈춘 것으로 봄
+    "restart_backoff_s": 5,  # 첫 재시작 전 대기 (처리한 행 없이 실패할 때마다 두 배)
+    "restart_backoff_max_s": 300,  # 재시작 전 대기의 최대값
+    "max_restarts": 8,  # 처리한 행 없이 연속으로 이만큼 재시작하면 포기
+}
+HEARTBEAT_INTERVAL = 1.0  # 감시 스레드가 하트비트를 확인하는 간격 (초)
+
+# 세션이 끝난 원인
+CATEGORY_FAILSAFE = "failsafe"
+CATEGORY_FAILURES = "failures"
+CATEGORY_STALLED = "stalled"
+CATEGORY_ERROR = "error"
+CATEGORY_FATAL = "fatal"  # 다시 시도해도 같은 오류 (복구하지 않음)
+CATEGORY_LABELS = {
+    CATEGORY_FAILSAFE: "비상 정지",
+    CATEGORY_FAILURES: "연속 삭제 실패",
+    CATEGORY_STALLED: "삭제 멈춤",
+    CATEGORY_ERROR: "오류",
+    CATEGORY_FATAL: "복구할 수 없는 오류",
+}
+# Playwright 는 설치됐지만 브라우저를 내려받지 않았을 때의 오류 메시지 일부
+MISSING_BROWSER_MESSAGE = "Executable doesn't exist"
+
+# 복구 동작 (약한 것부터). 처리한 행 없이 다시 실패하면 다음 동작으로 올림
+ACTION_REFOCUS = "refocus"
+ACTION_RECALIBRATE = "recalibrate"
+ACTION_RESTART = "restart"
+ACTIONS = (ACTION_REFOCUS, ACTION_RECALIBRATE, ACTION_RESTART)
+ACTION_LABELS = {
+    ACTION_REFOCUS: "창 초점 복구",
+    ACTION_RECALIBRATE: "재보정",
+    ACTION_RESTART: "백엔드 재시작",
+}
+# 원인별 첫 복구 동작
+CATEGORY_ACTIONS = {
+    CATEGORY_FAILSAFE: ACTION_REFOCUS,  # 커서가 모서리로 갔거나 다른 창이 입력을 가져감
+    CATEGORY_FAILURES: ACTION_REFOCUS,  # 메뉴가 열리지 않음 (대개 팝업이나 초점 문제)
+    CATEGORY_STALLED: ACTION_RECALIBRATE,  # 반복은 도는데 삭제가 안 됨 (위치/대기 시간이 틀어짐)
+    CATEGORY_ERROR: ACTION_RESTART,  # 그 밖의 예외 (브라우저 종료 등)
+}
+
+
+def classify_error(error):
+    """세션을 끝낸 예외의 원인 분류를 반환합니다."""
+    # pyautogui 를 가져오지 않고 비교 (브라우저 백엔드만 쓰는 화면 없는 환경에서도 동작)
+    if any(cls.__name__ == "FailSafeException" for cls in type(error).__mro__):
+        return CATEGORY_FAILSAFE
+    if isinstance(error, ImportError) or MISSING_BROWSER_MESSAGE in str(error):
+        return CATEGORY_FATAL
+    return CATEGORY_ERROR
+
+
+def supervise(session, create_driver, get):
+    """설정에서 감시를 켰으면 session 을 SupervisedSession 으로 감싸 반환합니다.
+
+    Args:
+        create_driver: 백엔드를 다시 시작할 때 새 드라이버를 만드는 함수.
+        get: SettingsManager.get 과 같은 형태의 함수.
+    """
+
+    def value(key):
+        return get(key, DEFAULT_SUPERVISOR_SETTINGS[key])
+
+    if not value("supervise"):
+        return session
+    return SupervisedSession(
+        session,
+        create_driver,
+        stall_timeout=value("stall_timeout_s"),
+        backoff=value("restart_backoff_s"),
+        backoff_max=value("restart_backoff_max_s"),
+        max_restarts=value("max_restarts"),
+    )
+
+
+def carry_over(old, new):
+    """백엔드를 다시 만들 때 앞 드라이버의 페이지 상태와 실행 전체 카운터를 새 드라이버로 넘깁니다."""
+    new.restore_page_state(old.page_state())
+    new.failures = old.failures
+    new.skipped_rows = old.skipped_rows
+    new.filtered_rows = old.filtered_rows
+    new.telemetry = old.telemetry  # 반복 기록도 실행 전체로 이어서 남김
+
+
+class SupervisedSession:
+    """DeletionSession 을 감싸 오류나 멈춤에서 스스로 복구하며 계속 실행합니다."""
+
+    def __init__(
+        self,
+        session,
+        create_driver,
+        stall_timeout=DEFAULT_SUPERVISOR_SETTINGS["stall_timeout_s"],
+        backoff=DEFAULT_SUPERVISOR_SETTINGS["restart_backoff_s"],
+        backoff_max=DEFAULT_SUPERVISOR_SETTINGS["restart_backoff_max_s"],
+        max_restarts=DEFAULT_SUPERVISOR_SETTINGS["max_restarts"],
+        on_deleted=None,
+    ):
+        self.session = session  # 지금 실행 중인(또는 마지막) DeletionSession
+        self.create_driver = create_driver
+        self.name = session.name
+        self.settings = session.settings
+        # 재시작마다 새 실행으로 남지 않도록 기록은 감시자가 실행 전체에 대해 한 번만 남김
+        self.journal, session.journal = session.journal, None
+        self.stats, session.stats = session.stats, None
+        self.previous = session.previous  # 안쪽 세션이 만들 때 읽은 이전 실행 누적
+        self.stall_timeout = stall_timeout
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_restarts = max_restarts
+        self.on_deleted = on_deleted or (lambda count: None)
+        self._stop_event = threading.Event()
+        self.deleted_before = 0  # 앞선 세션들에서 확인된 삭제 수
+        self.restarts = 0
+        self.recoveries = Counter()  # 복구 동작별 횟수
+        self.last_category = None
+        self.retry_at = None  # 재시작을 기다리는 중이면 다시 시작할 시각 (monotonic)
+        # 하트비트 (monotonic). 감시 스레드는 last_progress_at 으로 멈춤을 판단
+        self.last_deleted_at = None
+        self.last_progress_at = None
+        self.last_step_at = None
+        self._handled = 0  # 감시 스레드가 마지막으로 본 처리한 행 수
+        self._handled_before = 0  # 지금 세션을 시작할 때의 처리한 행 수
+        self._stalled = False
+        self.start_time = None
+        self.end_time = None
+        self.error = None
+        self.stop_reason = None
+
+    @property
+    def driver(self):
+        return self.session.driver
+
+    @property
+    def is_running(self):
+        return not self._stop_event.is_set()
+
+    @property
+    def delete_count(self):
+        return self.deleted_before + self.session.delete_count
+
+    def _handled_rows(self):
+        """삭제 확인, 필터로 남김, 건너뜀을 합친 처리한 행 수 (재시작해도 이어서 셈)."""
+        driver = self.driver
+        return self.delete_count + driver.filtered_rows + driver.skipped_rows
+
+    def _on_deleted(self, count):
+        self.last_deleted_at = time.monotonic()
+        self.on_deleted(self.delete_count)
+
+    def run(self, on_step=None):
+        """중지되거나 복구를 포기할 때까지 세션을 실행하고, 끝나면 다시 시작합니다.
+
+        포기한 원인이 예외면 그 예외를 다시 발생시킵니다.
+        """
+        if not self.is_running:
+            return
+        self.start_time = time.time()
+        self.end_time = None
+        watchdog = threading.Thread(
+            target=self._watch, name=f"supervisor-{self.name}", daemon=True
+        )
+        run_id = self.journal.begin(self) if self.journal is not None else None
+
+        def step():
+            if on_step is not None:
+                on_step()
+            if run_id is not None:
+                self.journal.maybe_flush(run_id, self)
+
+        watchdog.start()
+        streak = 0  # 처리한 행 없이 연속으로 복구한 횟수
+        try:
+            while True:
+                category, error = self._run_once(step)
+                if category is None:
+                    return
+                if category == CATEGORY_FATAL:
+                    self.error = str(error)
+                    logger.error(f"[{self.name}] {CATEGORY_LABELS[category]}로 중지: {error}")
+                    raise error
+                if self._handled_rows() > self._handled_before:
+                    streak = 0
+                if (
+                    category == CATEGORY_FAILSAFE
+                    and self.last_category == CATEGORY_FAILSAFE
+                    and streak
+                ):
+                    self.stop_reason = "비상 정지가 연속으로 일어나 사용자가 멈춘 것으로 봄"
+                    logger.warning(f"[{self.name}] {self.stop_reason}")
+                    return
+                self.last_category = category
+                if streak >= self.max_restarts:
+                    reason = f"처리한 행 없이 {streak}회 복구해도 나아지지 않아 포기"
+                    logger.error(f"[{self.name}] {reason}")
+                    if error is not None:
+                        self.error = str(error)
+                        raise error
+                    self.stop_reason = reason
+                    return
+                base = ACTIONS.index(CATEGORY_ACTIONS[category])
+                action = ACTIONS[min(base + streak, len(ACTIONS) - 1)]
+                delay = min(self.backoff_max, self.backoff * 2**streak)
+                streak += 1
+                self.restarts += 1
+                self.recoveries[action] += 1
+                logger.warning(
+                    f"[{self.name}] {CATEGORY_LABELS[category]}: {delay:.0f}초 뒤 "
+                    f"{ACTION_LABELS[action]} 후 다시 시작 ({self.restarts}회째)"
+                )
+                self.retry_at = time.monotonic() + delay
+                stopped = self._stop_event.wait(delay)
+                self.retry_at = None
+                if stopped:
+                    return
+                self._renew(action)
+        finally:
+            self._stop_event.set()
+            self.end_time = time.time()
+            watchdog.join()
+            if run_id is not None:
+                self.journal.end(run_id, self, self.stop_reason or self.error)
+            if self.stats is not None:
+                self.stats.record(self)
+
+    def _run_once(self, on_step):
+        """지금 세션을 끝날 때까지 실행하고 (원인 분류, 예외) 를 반환합니다.
+
+        다시 시작할 필요가 없으면 원인 분류는 None 입니다.
+        """
+        if not self.is_running:
+            return None, None  # 새 세션으로 바꾸는 동안 중지됨
+        session = self.session
+        session.on_deleted = self._on_deleted
+        self._stalled = False
+        self.last_deleted_at = self.last_progress_at = self.last_step_at = time.monotonic()
+        self._handled = self._handled_before = self._handled_rows()
+
+        def step():
+            self.last_step_at = time.monotonic()
+            if on_step is not None:
+                on_step()
+
+        try:
+            session.run(on_step=step)
+        except Exception as e:
+            return classify_error(e), e
+        if not self.is_running:
+            return None, None  # 사용자가 멈춤
+        if self._stalled:
+            return CATEGORY_STALLED, None
+        if isinstance(session.stop_exception, TooManyFailuresError):
+            return CATEGORY_FAILURES, None
+        if isinstance(session.stop_exception, HistoryExhaustedError) or session.stop_reason:
+            self.stop_reason = session.stop_reason
+            return None, None
+        return CATEGORY_STALLED, None
+
+    def _renew(self, action):
+        """복구 동작을 붙인 새 세션으로 바꿉니다."""
+        driver = None
+        if action == ACTION_RESTART:
+            try:
+                driver = self.create_driver()
+            except Exception as e:
+                self.error = f"백엔드를 다시 만들 수 없음: {e}"
+                raise
+            carry_over(self.session.driver, driver)
+        session = self.session.renew(driver)
+        if action == ACTION_REFOCUS:
+            session.on_start = session.driver.refocus
+        elif action == ACTION_RECALIBRATE:
+            session.on_start = session.driver.recalibrate
+        # 감시 스레드가 새 세션을 지난 하트비트로 판단하지 않도록 먼저 갱신
+        self.last_deleted_at = self.last_progress_at = time.monotonic()
+        self.deleted_before += self.session.delete_count
+        self.session = session
+
+    def _watch(self):
+        """하트비트를 확인하다가 처리하는 행이 없으면 지금 세션을 중지합니다."""
+        while not self._stop_event.wait(HEARTBEAT_INTERVAL):
+            session = self.session
+            if session.start_time is None or not session.is_running:
+                continue  # 시작 전이거나 재시작을 기다리는 중
+            # 필터로 남기거나 건너뛴 행도 진행으로 봄 (삭제할 행이 없는 구간을 지나는 중)
+            handled = self._handled_rows()
+            if handled != self._handled:
+                self._handled = handled
+                self.last_progress_at = time.monotonic()
+            idle = time.monotonic() - self.last_progress_at
+            if idle >= self.stall_timeout and not self._stalled:
+                self._stalled = True
+                logger.warning(
+                    f"[{self.name}] {idle:.0f}초 동안 처리한 행이 없어 세션을 중지"
+                )
+                session.stop()
+
+    def stop(self):
+        """중지를 요청합니다. 기다리지 않으며, 재시작 대기 중이면 바로 끝납니다."""
+        self._stop_event.set()
+        self.session.stop()
+
+    def elapsed(self):
+        """재시작 대기까지 포함한 전체 경과 시간 (오래 켜 둔 실행의 실제 처리량 기준)."""
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+    def rate(self):
+        """재시작 대기를 포함한 초당 삭제 수."""
+        elapsed = self.elapsed()
+        return self.delete_count / elapsed if elapsed > 0 else 0.0
+
+    def total_deleted(self):
+        """이전 실행을 포함한 누적 삭제 수."""
+        return self.previous["deleted"] + self.delete_count
+
+    def total_rate(self):
+        """이전 실행을 포함한 누적 초당 삭제 수."""
+        elapsed = self.previous["elapsed"] + self.elapsed()
+        return self.total_deleted() / elapsed if elapsed > 0 else 0.0
+
+    def describe(self):
+        """UI 표시용 감시 상태 문자열."""
+        if self.retry_at is not None:
+            state = f"{max(0, self.retry_at - time.monotonic()):.0f}초 뒤 다시 시작"
+        elif self.last_deleted_at is not None and self.is_running:
+            state = f"마지막 삭제 {time.monotonic() - self.last_deleted_at:.0f}초 전"
+        else:
+            state = "대기 중" if self.start_time is None else "종료"
+        text = f"감시: {state}, 재시작 {self.restarts}회"
+        if self.recoveries:
+            text += " (" + ", ".join(
+                f"{ACTION_LABELS[action]} {count}" for action, count in self.recoveries.items()
+            ) + ")"
+        return text
+
+    def status_lines(self):
+        """UI 표시용 상태 문자열 목록."""
+        lines = [
+            f"삭제된 항목: {self.delete_count}개",
+            f"경과 시간: {int(self.elapsed())}초",
+            f"유효 속도: {self.rate():.1f}개/초 (삭제 확인 기준, 재시작 대기 포함)",
+            self.describe(),
+        ]
+        if self.previous["runs"]:
+            lines.append(
+                f"누적: {self.total_deleted()}개, {self.total_rate():.1f}개/초 "
+                f"(이전 실행 {self.previous['runs']}회 포함)"
+            )
+        return lines + self.driver.status_lines()
@@ -0,0 +1,177 @@
+"""삭제 반복마다 단계별 소요 시간을 기록하는 고정 크기 링 버퍼와 통계.
+
+단계: 클릭1(click1) → 메뉴 대기(menu_wait) → 클릭2(click2) → 삭제 확인(confirm)
+커서 이동은 클릭1과 한 번의 입력으로 보내므로 따로 재지 않고 클릭1에 포함됩니다.
+입력 주입(input)은 단계가 아니라 반복 안에서 마우스/키 입력을 보내는 데 쓴 시간의 합입니다.
+기록은 미리 할당한 NumPy 배열에 덮어쓰므로 반복마다 메모리를 새로 쓰지 않습니다.
+"""
+
+import csv
+import json
+import logging
+import threading
+import time
+
+from startup import lazy_import
+
+np = lazy_import("numpy")  # 첫 기록 배열을 만들 때 가져옴
+
+logger = logging.getLogger(__name__)
+
+# --- Constants ---
+STEPS = ("click1", "menu_wait", "click2", "confirm", "input")
+STEP_LABELS = {
+    "click1": "클릭1",
+    "menu_wait": "메뉴 대기",
+    "click2": "클릭2",
+    "confirm": "삭제 확인",
+    "input": "입력 주입",
+}
+DEFAULT_CAPACITY = 4096  # 링 버퍼에 보관할 최근 반복 수
+INSTANT_RATE_WINDOW = 10.0  # 순간 속도 계산 구간 (초)
+PERCENTILES = (50, 95, 99)
+
+
+class IterationTimer:
+    """반복 하나의 단계별 시간을 잽니다. 단계를 건너뛰면 해당 값은 비어 있습니다."""
+
+    __slots__ = ("_telemetry", "started_at", "_last", "durations")
+
+    def __init__(self, telemetry):
+        self._telemetry = telemetry
+        self.started_at = time.time()
+        self._last = time.perf_counter()
+        self.durations = [np.nan] * len(STEPS)
+
+    def mark(self, step):
+        """직전 mark 이후 경과 시간을 step 의 소요 시간으로 기록합니다."""
+        now = time.perf_counter()
+        self.durations[STEPS.index(step)] = now - self._last
+        self._last = now
+
+    def add(self, step, seconds):
+        """다른 단계와 겹치는 시간(입력 주입 등)을 step 에 더합니다."""
+        index = STEPS.index(step)
+        current = self.durations[index]
+        self.durations[index] = seconds if np.isnan(current) else current + seconds
+
+    def finish(self, success):
+        """반복을 마치고 링 버퍼에 기록합니다."""
+        self._telemetry._append(self.started_at, self.durations, success)
+
+
+class Telemetry:
+    """최근 반복 기록을 보관하고 지연 백분위, 속도, 실패율을 계산합니다."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._started = np.zeros(capacity)
+        self._finished = np.zeros(capacity)
+        self._durations = np.full((capacity, len(STEPS)), np.nan)
+        self._success = np.zeros(capacity, dtype=bool)
+        self._next = 0
+        self.total = 0  # 링 버퍼 크기와 관계없는 전체 반복 수
+        self._lock = threading.Lock()  # 기록(워커)과 요약(GUI) 스레드 간 보호
+
+    def start_iteration(self):
+        return IterationTimer(self)
+
+    def _append(self, started_at, durations, success):
+        with self._lock:
+            index = self._next
+            self._started[index] = started_at
+            self._finished[index] = time.time()
+            self._durations[index] = durations
+            self._success[index] = success
+            self._next = (index + 1) % self.capacity
+            self.total += 1
+
+    def _filled(self):
+        """기록된 순서(오래된 것부터)대로 인덱스를 반환합니다."""
+        count = min(self.total, self.capacity)
+        start = self._next - count
+        return np.arange(start, start + count) % self.capacity
+
+    def summary(self):
+        """단계별 지연 백분위(ms), 순간/평균 속도, 실패율을 계산합니다."""
+        with self._lock:
+            order = self._filled()
+            durations = self._durations[order]
+            success = self._success[order]
+            finished = self._finished[order]
+            started = self._started[order]
+        result = {"iterations": int(order.size), "steps": {}}
+        if order.size == 0:
+            result.update(instant_rate=0.0, average_rate=0.0, failure_rate=0.0)
+            return result
+
+        for column, step in enumerate(STEPS):
+            values = durations[:, column]
+            values = values[~np.isnan(values)]
+            if values.size:
+                result["steps"][step] = dict(
+                    zip(
+                        (f"p{p}" for p in PERCENTILES),
+                        (np.percentile(values, PERCENTILES) * 1000).round(1).tolist(),
+                    )
+                )
+        now = time.time()
+        recent = finished >= now - INSTANT_RATE_WINDOW
+        span = max(now - started[0], 1e-9)
+        result["instant_rate"] = float(
+            np.count_nonzero(success & recent)
+            / min(INSTANT_RATE_WINDOW, span)
+        )
+        result["average_rate"] = float(np.count_nonzero(success) / span)
+        result["failure_rate"] = float(1 - np.count_nonzero(success) / order.size)
+        return result
+
+    def summary_lines(self):
+        """UI 대시보드용 문자열 목록."""
+        summary = self.summary()
+        lines = [
+            f"유효 속도: 순간 {summary['instant_rate']:.2f}개/초, 평균 {summary['average_rate']:.2f}개/초",
+            f"실패율: {summary['failure_rate'] * 100:.1f}% (최근 {summary['iterations']}회)",
+        ]
+        for step, values in summary["steps"].items():
+            lines.append(
+                f"{STEP_LABELS[step]:>6}: "
+                + "  ".join(f"{name} {value:7.1f}ms" for name, value in values.items())
+            )
+        return lines
+
+    def records(self):
+        """링 버퍼의 기록을 오래된 순서대로 dict 목록으로 반환합니다."""
+        with self._lock:
+            order = self._filled()
+            rows = []
+            for index in order:
+                row = {
+                    "started_at": float(self._started[index]),
+                    "finished_at": float(self._finished[index]),
+                    "success": bool(self._success[index]),
+                }
+                for column, step in enumerate(STEPS):
+                    value = self._durations[index, column]
+                    row[f"{step}_ms"] = (
+                        None if np.isnan(value) else round(float(value) * 1000, 2)
+                    )
+                rows.append(row)
+        return rows
+
+    def export_csv(self, path):
+        rows = self.records()
+        fieldnames = ["started_at", "finished_at", "success"] + [
+            f"{step}_ms" for step in STEPS
+        ]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        logger.info(f"반복 기록 {len(rows)}개 CSV 저장: {path}")
+
+    def export_json(self, path):
+        data = {"summary": self.summary(), "records": self.records()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        logger.info(f"반복 기록 {len(data['records'])}개 JSON 저장: {path}")
@@ -1,9 +1,12 @@
 import sys
-import json
-import time
 import os
 import logging
+import threading
+from collections import namedtuple
 from datetime import datetime
+from html import escape
+
+from startup import lazy_import, profiler  # 다른 모듈보다 먼저 가져와 시작 시간을 잼
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -13,6 +16,7 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QLabel,
     QSpinBox,
+    QComboBox,
     QCheckBox,
     QMessageBox,
     QSystemTrayIcon,
@@ -20,169 +24,248 @@ from PyQt5.QtWidgets import (
     QTextBrowser,
     QScrollArea,
     QFrame,
+    QFileDialog,
+    QDialog,
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt5.QtGui import QIcon
-import pyautogui as pa
-import keyboard as kb
 
-# --- Logging Configuration ---
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - [%(module)s:%(funcName)s:%(lineno)d] - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+# 첫 화면에는 필요 없으므로 처음 쓸 때 가져옴 (마우스 위치 확인, 단축키 등록)
+pa = lazy_import("pyautogui")
+kb = lazy_import("keyboard")
+
+from log_config import (
+    configure_logging,
+    set_log_level,
+    LOG_LEVELS,
+    DEFAULT_LOG_LEVEL,
+)
+from pacing import DEFAULT_PACING_SETTINGS
+from drivers import (
+    BACKEND_LABELS,
+    DEFAULT_BACKEND,
+    DEFAULT_VERIFY_SETTINGS,
+    load_driver_class,
 )
+from browser_driver import DEFAULT_BROWSER_SETTINGS
+from journal import RunJournal
+from run_stats import RunStatsStore, settings_snapshot
+from supervisor import DEFAULT_SUPERVISOR_SETTINGS, supervise
+from settings import SettingsManager
+from sessions import (
+    DeletionSession,
+    SessionScheduler,
+    create_session,
+    session_settings_getter,
+    DEFAULT_MAX_PARALLEL_SESSIONS,
+)
+from locator import (
+    save_reference_crop,
+    MENU_BUTTON_TEMPLATE,
+    MENU_BUTTON_HALF_SIZE,
+    REMOVE_ITEM_TEMPLATE,
+    REMOVE_ITEM_HALF_SIZE,
+    TEMPLATE_DIR,
+)
+from screen_profiles import (
+    PROFILES_KEY,
+    detect_displays,
+    display_key,
+    make_profile,
+    profile_template_dir,
+    resolve_positions,
+)
+
+profiler.mark("모듈 가져오기")
+
+# --- Logging Configuration ---
+# 콘솔 출력은 백그라운드 스레드에서 처리 (레벨과 모드는 설정 로드 후 다시 적용)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # --- Constants ---
-SETTINGS_FILE_NAME = "settings.json"
 ICON_FILE_NAME = "icon.png"
+POSITION_POLL_INTERVAL = 0.1  # 마우스 위치 확인 간격 (초)
+QUIT_WAIT_MS = 2000  # 종료할 때 작업 스레드가 끝나기를 기다리는 최대 시간
+# 저장된 좌표용. pyautogui.Point 와 같은 모양이지만 창을 만들 때 pyautogui 를 가져오지 않음
+Point = namedtuple("Point", ["x", "y"])
+# 단축키 → 실행할 메서드 이름. keyboard 의 콜백 스레드가 아닌 GUI 스레드에서 실행됨
+HOTKEYS = {
+    "f8": "setup_first_position",
+    "f9": "setup_second_position",
+    "f2": "toggle_deletion",
+    "f4": "force_quit",
+}
+DEBUG_LABEL_REFRESH_MS = 33  # 디버그 레이블 최대 갱신 주기 (약 30Hz)
+RECENT_RUNS_SHOWN = 20  # 실행 통계 창에 보여 줄 최근 실행 수
+# 도움말 내용 ("도움말 보기"를 처음 누를 때 위젯을 만들어 표시)
+HELP_HTML = """
+<h2>사용 방법</h2>
+<h3>1. YouTube 시청 기록 페이지 준비</h3>
+<ul>
+    <li>YouTube 시청 기록 페이지를 왼쪽 모니터에 전체 화면으로 엽니다</li>
+    <li><a href="https://www.youtube.com/feed/history">https://www.youtube.com/feed/history</a>에 접속합니다</li>
+</ul>
+<h3>2. 위치 설정</h3>
+<ul>
+    <li><b>F8:</b> 첫 번째 위치 (삭제할 항목의 메뉴 버튼)를 마우스로 클릭하여 설정합니다.</li>
+    <li><b>F9:</b> 두 번째 위치 (나타나는 메뉴의 '삭제' 항목)를 마우스로 클릭하여 설정합니다.</li>
+    <li>설정이 완료되면 "설정이 완료되었습니다!" 메시지가 표시됩니다.</li>
+    <li>또는, 이전에 저장된 설정이 있다면 프로그램 시작 시 자동으로 불러옵니다.</li>
+</ul>
+<h3>3. 삭제 시작/중지</h3>
+<ul>
+    <li><b>F2:</b> 삭제 작업을 시작하거나 중지합니다.</li>
+</ul>
+<h3>4. 프로그램 종료</h3>
+<ul>
+    <li><b>F4:</b> 프로그램을 종료합니다.</li>
+</ul>
+<h3>주의사항</h3>
+<ul>
+    <li>위치를 처음 설정할 때는 반드시 F8, F9 순서로 설정해야 합니다.</li>
+    <li>YouTube 페이지가 전체 화면이어야 정확하게 동작합니다.</li>
+    <li>삭제 중에는 마우스를 움직이지 마세요.</li>
+</ul>
+<h3>문제 해결</h3>
+<ul>
+    <li><b>위치 설정이 안 되는 경우:</b> F8, F9를 다시 눌러 설정 / YouTube 페이지 전체 화면 확인</li>
+    <li><b>삭제가 안 되는 경우:</b> 위치 설정 확인 / YouTube 페이지 변경 여부 확인</li>
+    <li><b>프로그램 응답 없음:</b> F4로 종료 후 재시작 / 작업 관리자에서 Python 프로세스 종료</li>
+</ul>
+"""
 
 
 # --- Worker Classes (상단으로 이동) ---
 class DebugWorker(QThread):
-    position_signal = pyqtSignal(str)
+    """마우스 위치가 바뀔 때만 알려주는 워커. 일시 정지 중에는 폴링하지 않습니다."""
 
-    def __init__(self):
-        super().__init__()
-        self.is_running = True
+    position_changed = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._stop = threading.Event()  # 설정되면 대기 중이어도 바로 끝남
+        self._active = threading.Event()  # 해제되면 폴링을 멈추고 대기
+        self._active.set()
 
     def run(self):
-        while self.is_running:
+        last_pos = None
+        while not self._stop.is_set():
+            self._active.wait()
+            if self._stop.is_set():
+                break
             pos = pa.position()
-            self.position_signal.emit(f"마우스 위치: x={pos.x}, y={pos.y}")
-            time.sleep(0.1)
+            if pos != last_pos:
+                last_pos = pos
+                self.position_changed.emit(pos.x, pos.y)
+            self._stop.wait(POSITION_POLL_INTERVAL)
+
+    def pause(self):
+        self._active.clear()
+
+    def resume(self):
+        self._active.set()
 
     def stop(self):
-        self.is_running = False
-        self.wait()
+        """중지를 요청합니다. 기다리지 않으며, 스레드가 끝나면 finished 시그널이 옵니다."""
+        self._stop.set()
+        self._active.set()
 
 
 class DeleteWorker(QThread):
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
 
-    def __init__(self, base_pos, x_gap, y_gap, delay, parent=None):
+    def __init__(self, session, parent=None):
         super().__init__(parent)
-        self.base_position = base_pos
-        self.x_gap = x_gap
-        self.y_gap = y_gap
-        self.delay = delay
-        self.is_running = True
-        self.delete_count = 0
-        self.start_time = None
+        # DeletionSession 또는 이를 감싼 SupervisedSession (드라이버와 카운터 보유)
+        self.session = session
+        self.session.on_deleted = self.progress.emit
 
-    def run(self):
-        self.start_time = time.time()
-        logger.debug(
-            f"삭제 작업 시작 - 기준: {self.base_position}, 간격: ({self.x_gap},{self.y_gap}), 딜레이: {self.delay}s"
-        )
-        while self.is_running:
-            try:
-                if not self.is_running:
-                    break
-                logger.debug(f"클릭1 목표: {self.base_position}")
-                pa.moveTo(self.base_position)
-                pa.click()
-                time.sleep(0.3)
-                if not self.is_running:
-                    break
-                target_x = self.base_position.x + self.x_gap
-                target_y = self.base_position.y + self.y_gap
-                target_pos_2 = pa.Point(target_x, target_y)  # pyautogui.Point로 생성
-                logger.debug(
-                    f"클릭2 목표: {target_pos_2} (간격: x={self.x_gap}, y={self.y_gap})"
-                )
-                pa.click(target_pos_2)
-                pa.moveTo(self.base_position)
-                self.delete_count += 1
-                self.progress.emit(self.delete_count)
-                elapsed = time.time() - self.start_time
-                speed = self.delete_count / elapsed if elapsed > 0 else 0
-                status_text = (
-                    f"삭제된 항목: {self.delete_count}개\n"
-                    f"경과 시간: {int(elapsed)}초\n"
-                    f"평균 속도: {speed:.1f}개/초"
-                )
-                self.status.emit(status_text)
-                if not self.is_running:
-                    break
-                time.sleep(self.delay)
-            except Exception as e:
-                error_msg = f"오류 발생: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                self.status.emit(error_msg)
-                self.is_running = False
-                break
+    @property
+    def is_running(self):
+        return self.session.is_running
 
-    def stop(self):
-        logger.debug("DeleteWorker 작업 중지 요청")
-        self.is_running = False
-        self.wait()
+    def _emit_status(self):
+        self.status.emit("\n".join(self.session.status_lines()))
 
-
-# --- Settings Manager Class ---
-class SettingsManager:
-    """설정 파일(JSON) 읽기 및 쓰기를 관리하는 클래스."""
-
-    def __init__(self, filename=SETTINGS_FILE_NAME):
-        self.filename = filename
-        self.settings = {}
-        self._load()
-
-    def _load(self):
-        """파일에서 설정을 로드합니다."""
-        try:
-            with open(self.filename, "r") as f:
-                self.settings = json.load(f)
-                logger.info(f"설정 로드 완료 from {self.filename}")
-        except FileNotFoundError:
-            logger.warning(f"{self.filename} 파일을 찾을 수 없음. 기본 설정 사용.")
-            self.settings = {}  # 기본값은 호출하는 쪽에서 처리하거나 여기서 정의
-        except json.JSONDecodeError as e:
-            logger.error(f"{self.filename} 파일 분석 오류: {e}. 기본 설정 사용.")
-            self.settings = {}
-
-    def save(self, data_to_save):
-        """주어진 데이터를 파일에 설정으로 저장합니다."""
+    def run(self):
+        logger.debug("삭제 작업 시작 - 백엔드: %s", self.session.driver.name)
         try:
-            with open(self.filename, "w") as f:
-                json.dump(data_to_save, f, indent=4)
-                logger.info(f"설정 저장 완료 to {self.filename}")
+            self.session.run(on_step=self._emit_status)
         except Exception as e:
-            logger.error(f"설정 저장 실패 - {e}", exc_info=True)
+            error_msg = f"오류 발생: {str(e)}"
+            self.status.emit(error_msg)
 
-    def get(self, key, default=None):
-        """설정 값을 가져옵니다. 없으면 기본값을 반환합니다."""
-        return self.settings.get(key, default)
+    def stop(self):
+        """중지를 요청합니다. 기다리지 않으며, 스레드가 끝나면 finished 시그널이 옵니다."""
+        logger.debug("DeleteWorker 작업 중지 요청")
+        self.session.stop()
 
 
 # --- Main Application Class ---
 class YouTubeHistoryDeleter(QMainWindow):
     """YouTube 시청 기록 삭제 도구의 메인 애플리케이션 클래스."""
 
+    # keyboard 콜백 스레드에서 emit 하면 GUI 스레드에서 처리됨 (인자: 단축키 이름)
+    hotkey_pressed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         logger.info("프로그램 시작")
 
         self.settings_manager = SettingsManager()
+        configure_logging(
+            self.settings_manager.get("log_level", DEFAULT_LOG_LEVEL),
+            async_mode=self.settings_manager.get("async_logging", True),
+        )
 
         self.pos_list = []
         self.x_gap = 0
         self.y_gap = 0
         self.is_setup = False  # 좌표 설정 완료 여부
+        self.displays = None  # 현재 모니터 구성 (위치 프로필 키)
+        self.profile_text = ""  # 적용된 위치 프로필 설명
+        self.template_dir = TEMPLATE_DIR  # 현재 위치 설정의 기준 이미지 폴더
+        self.template_scale = 1.0  # 기준 이미지를 저장한 배율 대비 현재 배율
         self.is_debugging = True  # 디버그 모드 기본 ON
 
         self.worker = None
         self.debug_worker = None
+        self.scheduler = None  # 다중 세션 실행 시 SessionScheduler
+        self.journal = RunJournal()  # 중단되어도 남는 실행 기록 (누적 처리량)
+        self.run_stats = RunStatsStore()  # 끝난 실행별 결과 (설정별 속도 비교)
+        self.last_telemetry = None  # 마지막 삭제 작업의 반복 기록 (내보내기용)
+        self._pending_mouse_pos = None  # 아직 화면에 반영하지 않은 마우스 위치
+        self._last_mouse_pos = None
+        self._debug_config_text = None  # 디버그 레이블의 설정 부분 (설정 변경 시 갱신)
+        self.tray_icon = None
+        self.help_text_widget = None  # 도움말은 처음 펼칠 때 생성
+        self._startup_finished = False  # 첫 화면 표시 후 작업(_finish_startup) 완료 여부
+        profiler.mark("설정 읽기")
 
         self.initUI()  # UI 요소 생성 및 초기화
+        profiler.mark("UI 생성")
         self._apply_loaded_settings()  # 로드된 설정 적용
+        profiler.mark("설정 적용")
+        # 단축키, 디버그 워커, 트레이 아이콘은 창이 처음 그려진 뒤 _finish_startup 에서 시작
 
+    def _finish_startup(self):
+        """첫 화면을 그린 뒤에 해도 되는 시작 작업을 합니다."""
+        if self._startup_finished:
+            return
+        self._startup_finished = True
+        profiler.mark("첫 화면 표시")
+        self._apply_position_profile()  # 모니터 조회에 pyautogui 가 필요할 수 있어 첫 화면 뒤에 함
+        profiler.mark("위치 프로필 적용")
+        self._setup_shortcuts()  # 단축키 설정 (keyboard 를 여기서 처음 가져옴)
+        profiler.mark("단축키 등록")
         if self.is_debugging:
             self.start_debug()  # 디버그 모드 자동 시작
-
+        profiler.mark("디버그 워커 시작")
         self._setup_tray_icon()  # 트레이 아이콘 설정
+        profiler.mark("트레이 아이콘")
+        profiler.report()
 
     def initUI(self):
         """UI 요소들을 초기화하고 배치합니다."""
@@ -209,10 +292,9 @@ class YouTubeHistoryDeleter(QMainWindow):
         line.setFrameShadow(QFrame.Sunken)
         content_layout.addWidget(line)
 
-        self._create_help_text_widget(content_layout)
+        self._create_help_toggle(content_layout)
 
         main_layout.addWidget(scroll_area)
-        self._setup_shortcuts()  # 단축키 설정
 
     def _create_scroll_area(self) -> QScrollArea:
         """메인 스크롤 영역을 생성합니다."""
@@ -233,22 +315,60 @@ class YouTubeHistoryDeleter(QMainWindow):
             "QLabel { background-color: #f0f0f0; padding: 5px; }"
         )
         parent_layout.addWidget(self.debug_label)
+        # 마우스 위치 변경을 모아 화면 갱신 주기에 한 번만 반영
+        self.debug_label_timer = QTimer(self)
+        self.debug_label_timer.setSingleShot(True)
+        self.debug_label_timer.setInterval(DEBUG_LABEL_REFRESH_MS)
+        self.debug_label_timer.timeout.connect(self._refresh_debug_label)
 
     def _create_settings_group(self, parent_layout: QVBoxLayout):
         """딜레이 및 자동 시작 설정 UI 그룹을 생성하여 레이아웃에 추가합니다."""
         settings_group = QWidget()
         settings_layout = QVBoxLayout(settings_group)
 
+        backend_layout = QHBoxLayout()
+        backend_layout.addWidget(QLabel("삭제 방식:"))
+        self.backend_combo = QComboBox()
+        for backend, label in BACKEND_LABELS.items():
+            self.backend_combo.addItem(label, backend)
+        backend_layout.addWidget(self.backend_combo)
+        settings_layout.addLayout(backend_layout)
+
         delay_layout = QHBoxLayout()
-        delay_layout.addWidget(QLabel("삭제 간격 (초):"))
+        delay_layout.addWidget(QLabel("삭제 간격 (ms):"))
         self.delay_spin = QSpinBox()
-        self.delay_spin.setRange(0, 10)
-        self.delay_spin.setValue(1)
+        self.delay_spin.setRange(0, 10000)
+        self.delay_spin.setSingleStep(50)
+        self.delay_spin.setSuffix(" ms")
+        self.delay_spin.setValue(DEFAULT_PACING_SETTINGS["row_wait_ms"])
         delay_layout.addWidget(self.delay_spin)
         settings_layout.addLayout(delay_layout)
 
+        self.adaptive_pacing_check = QCheckBox(
+            "적응형 대기 (페이지 반응 속도에 맞춰 간격 자동 조절)"
+        )
+        settings_layout.addWidget(self.adaptive_pacing_check)
+
+        self.batch_mode_check = QCheckBox(
+            "일괄 모드 (화면에 보이는 행을 한 번에 찾아 연속 삭제)"
+        )
+        settings_layout.addWidget(self.batch_mode_check)
+
+        self.resume_check = QCheckBox(
+            "이어서 집계 (중단된 이전 실행의 삭제 수와 속도를 누적해서 표시)"
+        )
+        settings_layout.addWidget(self.resume_check)
+
         self.auto_start_check = QCheckBox("프로그램 시작 시 자동으로 삭제 시작")
         settings_layout.addWidget(self.auto_start_check)
+
+        log_level_layout = QHBoxLayout()
+        log_level_layout.addWidget(QLabel("로그 레벨:"))
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(LOG_LEVELS)
+        self.log_level_combo.currentTextChanged.connect(self._on_log_level_changed)
+        log_level_layout.addWidget(self.log_level_combo)
+        settings_layout.addLayout(log_level_layout)
         parent_layout.addWidget(settings_group)
 
     def _create_control_buttons(self, parent_layout: QVBoxLayout):
@@ -263,6 +383,9 @@ class YouTubeHistoryDeleter(QMainWindow):
         self.start_btn = QPushButton("삭제 시작 (F2)")
         self.start_btn.clicked.connect(self.toggle_deletion)
         button_layout.addWidget(self.start_btn)
+        self.sessions_btn = QPushButton("다중 세션 시작")
+        self.sessions_btn.clicked.connect(self.toggle_sessions)
+        button_layout.addWidget(self.sessions_btn)
         parent_layout.addLayout(button_layout)
 
     def _create_progress_label(self, parent_layout: QVBoxLayout):
@@ -271,105 +394,201 @@ class YouTubeHistoryDeleter(QMainWindow):
         self.progress_label.setAlignment(Qt.AlignCenter)
         parent_layout.addWidget(self.progress_label)
 
+        self._create_dashboard(parent_layout)
+
+        # 다중 세션 실행 중 전체/세션별 처리량 (실행 중에만 표시)
+        self.sessions_label = QLabel()
+        self.sessions_label.setAlignment(Qt.AlignLeft)
+        self.sessions_label.hide()
+        parent_layout.addWidget(self.sessions_label)
+        self.sessions_timer = QTimer(self)
+        self.sessions_timer.setInterval(1000)
+        self.sessions_timer.timeout.connect(self._update_sessions_label)
+
+    def _create_dashboard(self, parent_layout: QVBoxLayout):
+        """단계별 지연 백분위, 속도, 실패율 대시보드와 내보내기 버튼을 생성합니다."""
+        self.dashboard_label = QLabel("반복 통계 없음")
+        self.dashboard_label.setAlignment(Qt.AlignLeft)
+        self.dashboard_label.setStyleSheet(
+            "QLabel { font-family: monospace; background-color: #f8f8f8; padding: 5px; }"
+        )
+        parent_layout.addWidget(self.dashboard_label)
+
+        export_layout = QHBoxLayout()
+        self.export_csv_btn = QPushButton("반복 기록 내보내기 (CSV)")
+        self.export_csv_btn.clicked.connect(lambda: self._export_telemetry("csv"))
+        export_layout.addWidget(self.export_csv_btn)
+        self.export_json_btn = QPushButton("반복 기록 내보내기 (JSON)")
+        self.export_json_btn.clicked.connect(lambda: self._export_telemetry("json"))
+        export_layout.addWidget(self.export_json_btn)
+        self.run_stats_btn = QPushButton("실행 통계")
+        self.run_stats_btn.clicked.connect(self._show_run_stats)
+        export_layout.addWidget(self.run_stats_btn)
+        parent_layout.addLayout(export_layout)
+        self._set_export_enabled(False)
+
+        self.dashboard_timer = QTimer(self)
+        self.dashboard_timer.setInterval(1000)
+        self.dashboard_timer.timeout.connect(self._update_dashboard)
+
+    def _create_help_toggle(self, parent_layout: QVBoxLayout):
+        """도움말 보기 버튼을 추가합니다. 도움말 위젯은 처음 펼칠 때 만듭니다."""
+        self.help_button = QPushButton("도움말 보기")
+        self.help_button.setCheckable(True)
+        self.help_button.toggled.connect(self._toggle_help)
+        parent_layout.addWidget(self.help_button)
+        self.help_layout = parent_layout
+
+    def _toggle_help(self, checked):
+        if checked and self.help_text_widget is None:
+            self._create_help_text_widget(self.help_layout)
+        if self.help_text_widget is not None:
+            self.help_text_widget.setVisible(checked)
+        self.help_button.setText("도움말 숨기기" if checked else "도움말 보기")
+
     def _create_help_text_widget(self, parent_layout: QVBoxLayout):
         """도움말 텍스트 위젯을 생성하여 레이아웃에 추가합니다."""
-        help_text_widget = QTextBrowser()
-        help_text_widget.setOpenExternalLinks(True)
-        help_text_widget.setHtml(
-            """
-        <h2>사용 방법</h2>
-        <h3>1. YouTube 시청 기록 페이지 준비</h3>
-        <ul>
-            <li>YouTube 시청 기록 페이지를 왼쪽 모니터에 전체 화면으로 엽니다</li>
-            <li><a href="https://www.youtube.com/feed/history">https://www.youtube.com/feed/history</a>에 접속합니다</li>
-        </ul>
-        <h3>2. 위치 설정</h3>
-        <ul>
-            <li><b>F8:</b> 첫 번째 위치 (삭제할 항목의 메뉴 버튼)를 마우스로 클릭하여 설정합니다.</li>
-            <li><b>F9:</b> 두 번째 위치 (나타나는 메뉴의 '삭제' 항목)를 마우스로 클릭하여 설정합니다.</li>
-            <li>설정이 완료되면 "설정이 완료되었습니다!" 메시지가 표시됩니다.</li>
-            <li>또는, 이전에 저장된 설정이 있다면 프로그램 시작 시 자동으로 불러옵니다.</li>
-        </ul>
-        <h3>3. 삭제 시작/중지</h3>
-        <ul>
-            <li><b>F2:</b> 삭제 작업을 시작하거나 중지합니다.</li>
-        </ul>
-        <h3>4. 프로그램 종료</h3>
-        <ul>
-            <li><b>F4:</b> 프로그램을 종료합니다.</li>
-        </ul>
-        <h3>주의사항</h3>
-        <ul>
-            <li>위치를 처음 설정할 때는 반드시 F8, F9 순서로 설정해야 합니다.</li>
-            <li>YouTube 페이지가 전체 화면이어야 정확하게 동작합니다.</li>
-            <li>삭제 중에는 마우스를 움직이지 마세요.</li>
-        </ul>
-        <h3>문제 해결</h3>
-        <ul>
-            <li><b>위치 설정이 안 되는 경우:</b> F8, F9를 다시 눌러 설정 / YouTube 페이지 전체 화면 확인</li>
-            <li><b>삭제가 안 되는 경우:</b> 위치 설정 확인 / YouTube 페이지 변경 여부 확인</li>
-            <li><b>프로그램 응답 없음:</b> F4로 종료 후 재시작 / 작업 관리자에서 Python 프로세스 종료</li>
-        </ul>
-        """
-        )
-        parent_layout.addWidget(help_text_widget)
+        self.help_text_widget = QTextBrowser()
+        self.help_text_widget.setOpenExternalLinks(True)
+        self.help_text_widget.setHtml(HELP_HTML)
+        parent_layout.addWidget(self.help_text_widget)
 
     def _apply_loaded_settings(self):
         """SettingsManager를 통해 로드된 설정을 애플리케이션 상태에 적용합니다."""
-        self.delay_spin.setValue(self.settings_manager.get("delay", 1))
+        backend_index = self.backend_combo.findData(
+            self.settings_manager.get("backend", DEFAULT_BACKEND)
+        )
+        self.backend_combo.setCurrentIndex(max(0, backend_index))
+        legacy_delay = self.settings_manager.get("delay")  # 이전 버전: 초 단위
+        self.delay_spin.setValue(
+            self.settings_manager.get(
+                "row_wait_ms",
+                legacy_delay * 1000
+                if legacy_delay is not None
+                else DEFAULT_PACING_SETTINGS["row_wait_ms"],
+            )
+        )
+        self.adaptive_pacing_check.setChecked(
+            self.settings_manager.get(
+                "adaptive_pacing", DEFAULT_PACING_SETTINGS["adaptive_pacing"]
+            )
+        )
+        self.batch_mode_check.setChecked(self.settings_manager.get("batch_mode", False))
+        self.resume_check.setChecked(self.settings_manager.get("resume_runs", True))
+        self.log_level_combo.setCurrentText(
+            self.settings_manager.get("log_level", DEFAULT_LOG_LEVEL)
+        )
         self.auto_start_check.setChecked(self.settings_manager.get("auto_start", False))
 
-        pos1_x = self.settings_manager.get("pos1_x")
-        pos1_y = self.settings_manager.get("pos1_y")
-        x_g = self.settings_manager.get("x_gap")
-        y_g = self.settings_manager.get("y_gap")
-
-        if (
-            pos1_x is not None
-            and pos1_y is not None
-            and x_g is not None
-            and y_g is not None
-        ):
-            first_pos = pa.Point(pos1_x, pos1_y)
-            second_pos = pa.Point(pos1_x + x_g, pos1_y + y_g)
+    def _apply_position_profile(self):
+        """절대 좌표 대신 현재 모니터 구성에 맞는 위치 프로필을 골라 적용합니다."""
+        self.displays = detect_displays()
+        resolved = resolve_positions(self.settings_manager.get, self.displays)
+
+        if resolved is not None:
+            positions = resolved["settings"]
+            pos1_x, pos1_y = positions["pos1_x"], positions["pos1_y"]
+            x_g, y_g = positions["x_gap"], positions["y_gap"]
+            first_pos = Point(pos1_x, pos1_y)
+            second_pos = Point(pos1_x + x_g, pos1_y + y_g)
             self.pos_list = [first_pos, second_pos]
             self.x_gap = x_g
             self.y_gap = y_g
+            self.template_dir = positions["template_dir"]
+            self.template_scale = positions["template_scale"]
+            self.profile_text = f"{resolved['name']} ({resolved['match']})"
             self.is_setup = True
             logger.info(
-                f"이전 설정 적용됨 - pos1={first_pos}, x_gap={x_g}, y_gap={y_g}"
+                f"이전 설정 적용됨 - pos1={first_pos}, x_gap={x_g}, y_gap={y_g}, 프로필={self.profile_text}"
             )
             self._update_status_and_debug_labels_after_config_change()
         else:
             self.is_setup = False
-            logger.info("저장된 이전 좌표 정보 없음. 새로 설정 필요.")
+            logger.info("현재 모니터 구성에 맞는 좌표 정보 없음. 새로 설정 필요.")
             self._update_status_and_debug_labels_after_config_change()
 
     def _save_current_settings(self):
         """현재 애플리케이션 설정을 SettingsManager를 통해 저장합니다."""
+        # 화면에 없는 설정(페이싱 하한/상한 등)은 파일에 있던 값을 유지
         current_settings = {
-            "delay": self.delay_spin.value(),
-            "auto_start": self.auto_start_check.isChecked(),
+            key: value
+            for key, value in self.settings_manager.settings.items()
+            if key != "delay"
         }
+        for key, default in DEFAULT_PACING_SETTINGS.items():
+            current_settings.setdefault(key, default)
+        for key, default in DEFAULT_BROWSER_SETTINGS.items():
+            current_settings.setdefault(key, default)
+        for key, default in DEFAULT_VERIFY_SETTINGS.items():
+            current_settings.setdefault(key, default)
+        for key, default in DEFAULT_SUPERVISOR_SETTINGS.items():
+            current_settings.setdefault(key, default)
+        current_settings.setdefault("use_locator", True)
+        current_settings.setdefault("fast_input", True)
+        current_settings.setdefault("pipelined", True)
+        current_settings.setdefault("adaptive_menu", True)
+        current_settings.setdefault("async_logging", True)
+        current_settings.update(
+            {
+                "backend": self._selected_backend(),
+                "row_wait_ms": self.delay_spin.value(),
+                "adaptive_pacing": self.adaptive_pacing_check.isChecked(),
+                "batch_mode": self.batch_mode_check.isChecked(),
+                "resume_runs": self.resume_check.isChecked(),
+                "log_level": self.log_level_combo.currentText(),
+                "auto_start": self.auto_start_check.isChecked(),
+            }
+        )
         if self.is_setup and self.pos_list and len(self.pos_list) == 2:
             current_settings["pos1_x"] = self.pos_list[0].x
             current_settings["pos1_y"] = self.pos_list[0].y
             current_settings["x_gap"] = self.x_gap
             current_settings["y_gap"] = self.y_gap
+            # 현재 모니터 구성의 프로필로도 저장 (다음 시작 때 바로 찾음)
+            profiles = dict(current_settings.get(PROFILES_KEY) or {})
+            key = display_key(self.displays)
+            profile = make_profile(
+                self.displays,
+                self.pos_list[0],
+                self.x_gap,
+                self.y_gap,
+                self.template_dir,
+                self.template_scale,
+            )
+            if key in profiles:
+                profile["name"] = profiles[key].get("name", profile["name"])
+            profiles[key] = profile
+            current_settings[PROFILES_KEY] = profiles
             logger.debug(
-                f"저장할 설정 - pos1=({self.pos_list[0].x},{self.pos_list[0].y}), x_gap={self.x_gap}, y_gap={self.y_gap}"
+                "저장할 설정 - pos1=(%s,%s), x_gap=%s, y_gap=%s",
+                self.pos_list[0].x,
+                self.pos_list[0].y,
+                self.x_gap,
+                self.y_gap,
             )
         else:
-            logger.debug(f"저장할 설정 - 위치 정보 없음 (is_setup: {self.is_setup})")
+            logger.debug("저장할 설정 - 위치 정보 없음 (is_setup: %s)", self.is_setup)
 
         self.settings_manager.save(current_settings)
 
+    def _on_log_level_changed(self, level):
+        """로그 레벨 콤보박스 변경 시 실행 중인 로거에 바로 적용합니다."""
+        set_log_level(level)
+        logger.info(f"로그 레벨 변경: {level}")
+
     def _setup_shortcuts(self):
-        """키보드 단축키를 설정합니다."""
-        kb.add_hotkey("f8", self.setup_first_position)
-        kb.add_hotkey("f9", self.setup_second_position)
-        kb.add_hotkey("f2", self.toggle_deletion)
-        kb.add_hotkey("f4", self.force_quit)
+        """키보드 단축키를 설정합니다.
+
+        keyboard 의 콜백은 별도 스레드에서 호출되므로 시그널만 보내고 바로 돌아오며,
+        실제 처리(위젯 변경, 작업 시작/중지)는 GUI 스레드에서 합니다.
+        """
+        self.hotkey_pressed.connect(self._on_hotkey)
+        for key in HOTKEYS:
+            kb.add_hotkey(key, self.hotkey_pressed.emit, args=(key,))
+
+    def _on_hotkey(self, key):
+        logger.debug("단축키 %s 처리", key)
+        getattr(self, HOTKEYS[key])()
 
     def _setup_tray_icon(self):
         """시스템 트레이 아이콘을 설정합니다."""
@@ -397,10 +616,13 @@ class YouTubeHistoryDeleter(QMainWindow):
 
     def _update_status_and_debug_labels_after_config_change(self):
         """좌표 설정 변경 또는 로드 후 상태 및 디버그 레이블을 업데이트합니다."""
+        self._debug_config_text = None
         if self.is_setup and self.pos_list and len(self.pos_list) == 2:
             pos1_text = f"위치1: {self.pos_list[0]}"
             gap_text = f"간격: (X: {self.x_gap}, Y: {self.y_gap})"
             current_status_msg = f"설정 완료: {pos1_text}, {gap_text}"
+            if self.profile_text:
+                current_status_msg += f" [프로필: {self.profile_text}]"
             self.status_label.setText(current_status_msg)
             if self.is_debugging:
                 self.debug_label.setText(f"현재 설정:\n{pos1_text}\n{gap_text}")
@@ -408,24 +630,41 @@ class YouTubeHistoryDeleter(QMainWindow):
             self.status_label.setText("준비 (F8, F9로 위치 설정 필요)")
             if self.is_debugging:
                 self.debug_label.setText("디버그 모드 ON. F8/F9로 위치를 설정하세요.")
-        logger.debug(f"UI 상태 레이블 업데이트: {self.status_label.text()}")
+        logger.debug("UI 상태 레이블 업데이트: %s", self.status_label.text())
+        if self._last_mouse_pos is not None:
+            # 마우스가 움직이지 않아도 바뀐 설정이 디버그 레이블에 반영되도록
+            self._on_mouse_position_changed(*self._last_mouse_pos)
 
     def setup_first_position(self):
         """F8: 첫 번째 위치를 설정합니다."""
         self.pos_list = []
         self.is_setup = False
+        # 설정하는 지금의 모니터 구성으로 프로필과 기준 이미지 폴더를 정함
+        self.displays = detect_displays()
+        self.template_dir = profile_template_dir(self.displays)
+        self.template_scale = 1.0
+        self.profile_text = display_key(self.displays)
         current_mouse_pos = pa.position()
         self.pos_list.append(pa.Point(current_mouse_pos.x, current_mouse_pos.y))
+        self._save_reference_crop(
+            self.pos_list[0], MENU_BUTTON_HALF_SIZE, MENU_BUTTON_TEMPLATE
+        )
         self._update_status_and_debug_labels_after_config_change()
-        logger.debug(f"위치 1 저장됨: {self.pos_list[0]}")
+        logger.debug("위치 1 저장됨: %s", self.pos_list[0])
 
     def setup_second_position(self):
         """F9: 두 번째 위치를 설정하고, 유효하면 전체 설정을 완료합니다."""
         if len(self.pos_list) == 1:
             current_mouse_pos = pa.position()
             self.pos_list.append(pa.Point(current_mouse_pos.x, current_mouse_pos.y))
+            self._save_reference_crop(
+                self.pos_list[1], REMOVE_ITEM_HALF_SIZE, REMOVE_ITEM_TEMPLATE
+            )
             self.x_gap = self.pos_list[1].x - self.pos_list[0].x
             self.y_gap = self.pos_list[1].y - self.pos_list[0].y
+            from menu_plans import clear_plans  # 시작 시간을 줄이려고 여기서 가져옴
+
+            clear_plans(self.template_dir)  # 이전 간격으로 배운 클릭 계획은 버림
             self.is_setup = True
             logger.info(
                 f"위치 2 저장 및 설정 완료! 위치1={self.pos_list[0]}, 위치2={self.pos_list[1]}, 간격=({self.x_gap},{self.y_gap})"
@@ -438,13 +677,20 @@ class YouTubeHistoryDeleter(QMainWindow):
             QMessageBox.warning(self, "경고", msg)
             logger.warning(msg)
 
+    def _save_reference_crop(self, point, half_size, filename):
+        """위치 설정 시 마우스 주변을 템플릿 매칭용 기준 이미지로 저장합니다."""
+        try:
+            save_reference_crop(point, half_size, filename, self.template_dir)
+        except Exception as e:
+            logger.error(f"기준 이미지 저장 실패 - {e}", exc_info=True)
+
     def start_debug(self):
         """디버그 정보 출력을 위한 Worker를 시작합니다."""
         if self.debug_worker is None or not self.debug_worker.isRunning():
-            self.debug_worker = DebugWorker()
-            self.debug_worker.position_signal.connect(
-                self._update_debug_label_continuous
-            )
+            # 창이 스레드 객체를 소유하므로 중지 요청 후 참조를 버려도 끝날 때까지 남아 있음
+            self.debug_worker = DebugWorker(self)
+            self.debug_worker.position_changed.connect(self._on_mouse_position_changed)
+            self.debug_worker.finished.connect(self.debug_worker.deleteLater)
             self.debug_worker.start()
             logger.info("디버그 워커 시작")
 
@@ -455,81 +701,343 @@ class YouTubeHistoryDeleter(QMainWindow):
             self.debug_worker = None
             logger.info("디버그 워커 중지")
 
-    def _update_debug_label_continuous(self, mouse_pos_info_from_worker):
-        """DebugWorker로부터 지속적으로 마우스 위치를 받아 디버그 레이블을 업데이트합니다."""
-        if not self.is_debugging:
-            return
-
-        current_config_info = ""
-        if self.is_setup and self.pos_list and len(self.pos_list) == 2:
-            current_config_info = f"설정된 위치1: {self.pos_list[0]}\n설정된 간격: (X:{self.x_gap}, Y:{self.y_gap})\n"
-        elif self.pos_list and len(self.pos_list) == 1:
-            current_config_info = (
-                f"설정된 위치1: {self.pos_list[0]}\n위치2 설정 대기 중...\n"
-            )
-        else:
-            current_config_info = "위치 설정 안됨 (F8, F9 필요)\n"
+    def _pause_debug(self):
+        """삭제 중이거나 창이 숨겨졌을 때 마우스 위치 확인을 멈춥니다."""
+        if self.debug_worker:
+            self.debug_worker.pause()
+
+    def _resume_debug(self):
+        """창이 보이고 삭제 중이 아닐 때만 마우스 위치 확인을 다시 시작합니다."""
+        if self.debug_worker and self.isVisible() and self.worker is None:
+            self.debug_worker.resume()
+
+    def _on_mouse_position_changed(self, x, y):
+        """DebugWorker의 위치 변경을 모아 두었다가 다음 갱신 주기에 반영합니다."""
+        self._pending_mouse_pos = (x, y)
+        if not self.debug_label_timer.isActive():
+            self.debug_label_timer.start()
+
+    def _debug_config_info(self):
+        if self._debug_config_text is None:
+            if self.is_setup and self.pos_list and len(self.pos_list) == 2:
+                self._debug_config_text = f"설정된 위치1: {self.pos_list[0]}\n설정된 간격: (X:{self.x_gap}, Y:{self.y_gap})\n"
+            elif self.pos_list and len(self.pos_list) == 1:
+                self._debug_config_text = (
+                    f"설정된 위치1: {self.pos_list[0]}\n위치2 설정 대기 중...\n"
+                )
+            else:
+                self._debug_config_text = "위치 설정 안됨 (F8, F9 필요)\n"
+        return self._debug_config_text
 
-        self.debug_label.setText(
-            f"{mouse_pos_info_from_worker}\n{current_config_info}---------------------"
+    def _refresh_debug_label(self):
+        """모아 둔 마지막 마우스 위치로 디버그 레이블을 갱신합니다."""
+        if not self.is_debugging or self._pending_mouse_pos is None:
+            return
+        x, y = self._last_mouse_pos = self._pending_mouse_pos
+        self._pending_mouse_pos = None
+        text = (
+            f"마우스 위치: x={x}, y={y}\n"
+            f"{self._debug_config_info()}---------------------"
         )
+        if text != self.debug_label.text():
+            self.debug_label.setText(text)
+
+    def _selected_backend(self):
+        return self.backend_combo.currentData()
 
     def toggle_deletion(self):
         """F2: 삭제 작업을 시작하거나 중지합니다."""
-        if not self.is_setup:
+        # 좌표는 화면 클릭 백엔드에서만 필요
+        if self._selected_backend() == "desktop" and not self.is_setup:
             msg = "먼저 위치를 설정해주세요 (F8, F9 또는 이전 설정 로드)"
             logger.warning(msg)
             QMessageBox.warning(self, "경고", msg)
             return
 
-        if self.worker is None or not self.worker.is_running:
+        if self.worker is not None and not self.worker.is_running:
+            # 중지를 요청했고 스레드가 끝나기를 기다리는 중 (finished 시그널에서 정리)
+            logger.info("이전 삭제 작업이 끝나는 중 - 잠시 후 다시 시도하세요")
+            return
+        if self.worker is None:
             logger.info("삭제 시작 요청")
+            if self._selected_backend() == "desktop" and self._sessions_use_desktop_input():
+                self._warn_desktop_input_busy("다중 세션")
+                return
             self._start_deletion_worker()
-            self.start_btn.setText("삭제 중지 (F2)")
+            if self.worker is not None:
+                self.start_btn.setText("삭제 중지 (F2)")
         else:
             logger.info("삭제 중지 요청")
             self._stop_deletion_worker()
-            self.start_btn.setText("삭제 시작 (F2)")
+            self.start_btn.setText("중지하는 중...")
+
+    def _position_overrides(self):
+        """현재 모니터 구성에 맞춘 좌표 설정 (파일의 절대 좌표 대신 사용)."""
+        if not (self.is_setup and self.pos_list):
+            # 맞는 위치 프로필이 없으면 파일의 절대 좌표로 클릭하지 않도록 비워 둠
+            return dict.fromkeys(("pos1_x", "pos1_y", "x_gap", "y_gap"))
+        return {
+            "pos1_x": self.pos_list[0].x,
+            "pos1_y": self.pos_list[0].y,
+            "x_gap": self.x_gap,
+            "y_gap": self.y_gap,
+            "template_dir": self.template_dir,
+            "template_scale": self.template_scale,
+        }
+
+    def _desktop_settings_getter(self):
+        """저장 전인 화면의 설정(좌표, 간격, 체크박스)을 우선하는 get 함수."""
+        overrides = {
+            "row_wait_ms": self.delay_spin.value(),
+            "adaptive_pacing": self.adaptive_pacing_check.isChecked(),
+            "batch_mode": self.batch_mode_check.isChecked(),
+            **self._position_overrides(),
+        }
+        return session_settings_getter(overrides, self.settings_manager.get)
+
+    def _create_driver(self, get):
+        """설정에서 선택한 백엔드의 드라이버를 생성합니다. 실패하면 None."""
+        backend = self._selected_backend()
+        try:
+            return load_driver_class(backend).from_settings(get)
+        except (ImportError, ValueError) as e:
+            msg = f"{BACKEND_LABELS[backend]} 백엔드를 사용할 수 없습니다: {e}"
+            logger.error(msg)
+            QMessageBox.warning(self, "경고", msg)
+            return None
 
     def _start_deletion_worker(self):
         """삭제 작업을 수행하는 DeleteWorker를 시작합니다."""
-        if not self.is_setup or not self.pos_list or len(self.pos_list) < 1:
-            QMessageBox.warning(self, "경고", "위치가 설정되지 않았습니다.")
+        get = self._desktop_settings_getter()
+        driver = self._create_driver(get)
+        if driver is None:
             return
 
-        base_pos_for_worker = self.pos_list[0]
-        logger.info(
-            f"DeleteWorker 시작 - 딜레이: {self.delay_spin.value()}s, 기준위치: {base_pos_for_worker}"
-        )
-        self.worker = DeleteWorker(
-            base_pos_for_worker, self.x_gap, self.y_gap, self.delay_spin.value()
+        logger.info(f"DeleteWorker 시작 - 백엔드: {driver.name}")
+        self._prepare_journal()
+        session = DeletionSession(
+            driver.name,
+            driver,
+            journal=self.journal,
+            stats=self.run_stats,
+            settings=settings_snapshot(get),
         )
+        # 오류나 멈춤으로 끝나면 감시자가 복구한 뒤 다시 시작 (백엔드 재시작 때 드라이버를 새로 만듦)
+        driver_class = type(driver)
+        session = supervise(session, lambda: driver_class.from_settings(get), get)
+        self.worker = DeleteWorker(session, parent=self)
         self.worker.progress.connect(self.updateProgress)
         self.worker.status.connect(self.updateStatus)
         self.worker.finished.connect(
             self._on_delete_worker_finished
         )  # 작업 완료 시그널 연결
+        self.worker.finished.connect(self.worker.deleteLater)
         self.worker.start()
+        self._pause_debug()
+        self.last_telemetry = driver.telemetry
+        self._set_export_enabled(False)
+        self.dashboard_timer.start()
+
+    def _prepare_journal(self):
+        """이어서 집계하지 않으면 이전 실행 기록을 지우고 새로 셉니다."""
+        if self.resume_check.isChecked():
+            return
+        try:
+            self.journal.reset()
+        except OSError as e:
+            logger.error(f"실행 기록 초기화 실패 - {e}")
 
     def _stop_deletion_worker(self):
         """실행 중인 DeleteWorker를 중지합니다."""
         if self.worker:
-            self.worker.stop()  # is_running = False, 스레드 자체는 wait()로 종료 대기
+            self.worker.stop()  # 기다리지 않음. 정리는 finished 시그널에서
             # self.worker = None # finished 시그널에서 None으로 처리
 
     def _on_delete_worker_finished(self):
         """DeleteWorker가 작업을 완료했을 때 호출됩니다."""
         logger.info("DeleteWorker 작업 완료됨 (finished 시그널 수신)")
+        stop_reason = None
+        if self.worker:
+            stop_reason = self.worker.session.stop_reason
+            self.last_telemetry = self.worker.session.driver.telemetry
         self.worker = None  # 작업자 참조 제거
+        self._resume_debug()
+        self.dashboard_timer.stop()
+        self._update_dashboard()
+        self._set_export_enabled(self.last_telemetry is not None)
         self.start_btn.setText("삭제 시작 (F2)")  # 버튼 상태 복원
         # 필요하다면 추가적인 상태 업데이트 (예: 최종 상태 메시지)
-        if self.is_setup:  # 아직 설정이 유효하다면
+        if stop_reason:
+            self.status_label.setText(
+                f"삭제 작업 중지됨: {stop_reason}\n마지막 삭제 수: {self.progress_label.text()}"
+            )
+        elif self.is_setup:  # 아직 설정이 유효하다면
             self.status_label.setText(
                 f"삭제 작업 중단됨/완료됨. 마지막 삭제 수: {self.progress_label.text()}"
             )
         else:
             self.status_label.setText("삭제 작업 중단됨/완료됨.")
 
+    def _sessions_use_desktop_input(self):
+        """실행 중인 다중 세션 중 실제 마우스를 쓰는(또는 쓸 차례를 기다리는) 세션이 있는지."""
+        return (
+            self.scheduler is not None
+            and self.scheduler.is_running()
+            and any(session.driver.uses_desktop_input for session in self.scheduler.sessions)
+        )
+
+    def _warn_desktop_input_busy(self, owner):
+        """마우스를 쓰는 작업은 한 번에 하나만 실행할 수 있다고 알립니다."""
+        msg = f"{owner}이 화면 클릭(마우스)을 사용하는 중입니다. 끝나거나 중지한 뒤 다시 시작하세요."
+        logger.warning(msg)
+        QMessageBox.warning(self, "경고", msg)
+
+    def toggle_sessions(self):
+        """settings.json 의 "sessions" 목록으로 다중 세션 실행을 시작하거나 중지합니다."""
+        if self.scheduler is not None and self.scheduler.is_running():
+            logger.info("다중 세션 중지 요청")
+            self.scheduler.stop()
+            return
+        self._start_sessions()
+
+    def _start_sessions(self):
+        session_configs = self.settings_manager.get("sessions", [])
+        if not session_configs:
+            msg = 'settings.json 에 "sessions" 목록이 없습니다.'
+            logger.warning(msg)
+            QMessageBox.warning(self, "경고", msg)
+            return
+        scheduler = SessionScheduler(
+            self.settings_manager.get(
+                "max_parallel_sessions", DEFAULT_MAX_PARALLEL_SESSIONS
+            )
+        )
+        # 이어서 집계하지 않으면 지울 기록을 읽지 않도록, 기록은 시작이 확정된 뒤 붙임
+        resume = self.resume_check.isChecked()
+        try:
+            for session_config in session_configs:
+                scheduler.add(
+                    create_session(
+                        session_config,
+                        session_settings_getter(
+                            self._position_overrides(), self.settings_manager.get
+                        ),
+                        journal=self.journal if resume else None,
+                        stats=self.run_stats,
+                    )
+                )
+        except (ImportError, ValueError) as e:
+            msg = f"세션을 만들 수 없습니다: {e}"
+            logger.error(msg)
+            QMessageBox.warning(self, "경고", msg)
+            return
+        # 실행 중인(또는 멈추는 중인) 단일 삭제 작업과 마우스를 함께 쓰지 않음
+        if (
+            self.worker is not None
+            and self.worker.session.driver.uses_desktop_input
+            and any(session.driver.uses_desktop_input for session in scheduler.sessions)
+        ):
+            self._warn_desktop_input_busy("삭제 작업")
+            return
+        if not resume:
+            self._prepare_journal()
+            for session in scheduler.sessions:
+                session.journal = self.journal
+        self.scheduler = scheduler
+        self.scheduler.start()
+        self.sessions_btn.setText("다중 세션 중지")
+        self.sessions_label.show()
+        self.sessions_timer.start()
+
+    def _update_sessions_label(self):
+        """다중 세션의 전체/세션별 처리량을 갱신합니다."""
+        if self.scheduler is None:
+            return
+        self.sessions_label.setText("\n".join(self.scheduler.status_lines()))
+        if not self.scheduler.is_running():
+            logger.info("다중 세션 모두 종료됨")
+            self.sessions_timer.stop()
+            self.sessions_btn.setText("다중 세션 시작")
+
+    def _set_export_enabled(self, enabled):
+        self.export_csv_btn.setEnabled(enabled)
+        self.export_json_btn.setEnabled(enabled)
+
+    def _update_dashboard(self):
+        """마지막(또는 진행 중인) 삭제 작업의 반복 통계를 대시보드에 표시합니다."""
+        if self.worker is not None:
+            # 감시자가 백엔드를 다시 시작하면 드라이버(와 반복 기록)가 바뀜
+            self.last_telemetry = self.worker.session.driver.telemetry
+        if self.last_telemetry is None:
+            return
+        self.dashboard_label.setText("\n".join(self.last_telemetry.summary_lines()))
+
+    def _export_telemetry(self, file_format):
+        """반복 기록을 CSV 또는 JSON 파일로 저장합니다."""
+        if self.last_telemetry is None:
+            return
+        default_name = datetime.now().strftime(f"telemetry_%Y%m%d_%H%M%S.{file_format}")
+        path, _ = QFileDialog.getSaveFileName(
+            self, "반복 기록 내보내기", default_name, f"{file_format.upper()} (*.{file_format})"
+        )
+        if not path:
+            return
+        try:
+            if file_format == "csv":
+                self.last_telemetry.export_csv(path)
+            else:
+                self.last_telemetry.export_json(path)
+        except OSError as e:
+            logger.error(f"반복 기록 내보내기 실패 - {e}", exc_info=True)
+            QMessageBox.warning(self, "경고", f"내보내기 실패: {e}")
+
+    def _show_run_stats(self):
+        """지난 실행들을 설정별로 묶어 유효 속도를 비교하는 창을 엽니다."""
+        groups = self.run_stats.compare_settings()
+        runs = self.run_stats.recent_runs(RECENT_RUNS_SHOWN)
+        parts = ["<h3>설정별 유효 속도</h3>"]
+        if groups:
+            parts.append(
+                "<table border='1' cellspacing='0' cellpadding='3'>"
+                "<tr><th>백엔드</th><th>개/초</th><th>실패율</th><th>실행</th><th>삭제</th>"
+                "<th>다른 설정</th></tr>"
+            )
+            for group in groups:
+                parts.append(
+                    f"<tr><td>{group['backend']}</td><td>{group['rate']:.2f}</td>"
+                    f"<td>{group['failure_rate'] * 100:.1f}%</td><td>{group['runs']}</td>"
+                    f"<td>{group['deleted']}</td><td>{escape(group['label'] or '-')}</td></tr>"
+                )
+            parts.append("</table>")
+        else:
+            parts.append("<p>기록된 실행 없음</p>")
+        parts.append(f"<h3>최근 실행 {len(runs)}개</h3>")
+        if runs:
+            parts.append(
+                "<table border='1' cellspacing='0' cellpadding='3'>"
+                "<tr><th>시작</th><th>세션</th><th>삭제</th><th>개/초</th><th>실패</th>"
+                "<th>확인 p50/p95</th><th>종료 사유</th></tr>"
+            )
+            for run in runs:
+                started = datetime.fromtimestamp(run["started_at"]).strftime("%m-%d %H:%M")
+                confirm = run["latency"].get("confirm")
+                confirm_text = f"{confirm['p50']:.0f}/{confirm['p95']:.0f}ms" if confirm else "-"
+                parts.append(
+                    f"<tr><td>{started}</td><td>{escape(run['session'])}</td><td>{run['deleted']}</td>"
+                    f"<td>{run['rate']:.2f}</td><td>{run['failures']}</td>"
+                    f"<td>{confirm_text}</td><td>{escape(run['stop_reason'] or '')}</td></tr>"
+                )
+            parts.append("</table>")
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("실행 통계")
+        dialog.resize(720, 480)
+        layout = QVBoxLayout(dialog)
+        view = QTextBrowser()
+        view.setHtml("".join(parts))
+        layout.addWidget(view)
+        dialog.exec_()
+
     def updateProgress(self, count):
         """DeleteWorker로부터 진행 상황(삭제된 항목 수)을 받아 UI에 업데이트합니다."""
         self.progress_label.setText(str(count))
@@ -541,13 +1049,33 @@ class YouTubeHistoryDeleter(QMainWindow):
     def force_quit(self):
         """F4 또는 트레이 메뉴: 프로그램을 강제 종료합니다."""
         logger.info("프로그램 강제 종료 요청")
+        debug_worker = self.debug_worker
         self.stop_debug()
+        if self.scheduler is not None:
+            self.scheduler.stop()
         if self.worker:
             self.worker.stop()
-            # self.worker.wait() # force_quit에서는 빠르게 종료. 스레드가 즉시 정리되지 않을 수 있음
+            # 대기는 중지 요청에 바로 깨어나므로 보통 곧 끝남. 멈춘 입력 호출에 대비해 최대 시간만 기다림
+            if not self.worker.wait(QUIT_WAIT_MS):
+                logger.warning("삭제 스레드가 제때 끝나지 않음 - 그대로 종료")
+        if debug_worker is not None:
+            debug_worker.wait(QUIT_WAIT_MS)
+        self.run_stats.close()  # 남은 실행 통계 쓰기
         self._save_current_settings()  # 종료 전 설정 저장
         QApplication.instance().quit()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._startup_finished:
+            # 이벤트 루프가 첫 화면을 그린 다음에 실행됨
+            QTimer.singleShot(0, self._finish_startup)
+        self._resume_debug()
+
+    def hideEvent(self, event):
+        """트레이로 숨겨진 동안에는 마우스 위치를 확인하지 않습니다."""
+        super().hideEvent(event)
+        self._pause_debug()
+
     def closeEvent(self, event):
         """창 닫기 버튼 클릭 시 호출됩니다."""
         # 현재는 F4와 동일하게 완전 종료
@@ -558,6 +1086,7 @@ class YouTubeHistoryDeleter(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    profiler.mark("QApplication 생성")
     ex = YouTubeHistoryDeleter()
     ex.show()
     sys.exit(app.exec_())